@@ -1,8 +1,8 @@
 import warnings
 import itertools as it
+import os
 import math as mt
 import numpy as np
-from tabulate import tabulate as tb
 import sys
 
 warnings.filterwarnings("ignore")
@@ -18,39 +18,35 @@ def found_pareto_at(z,show_log):
         print()
 
 def revise_pareto(dir_map, directions, pareto, variables):
-    d = np.array([-1*dir_map[direction] for direction in directions])
-    size = np.shape(pareto)[0]
-    pareto_cols = np.shape(pareto)[1]
-    isdominated = np.zeros(size, dtype=np.int64)
-    for t in range(size):
-        for tt in range(size):
-            if np.all(d * pareto[t, :] <= d * pareto[tt, :]) and np.any(d * pareto[t, :] < d * pareto[tt, :]):
-                isdominated[t] += 1
-            if np.all(d * pareto[t, :] >= d * pareto[tt, :]) and np.any(d * pareto[t, :] > d * pareto[tt, :]):
-                isdominated[tt] += 1
-    indices_to_add = []
-    for t in range(size):
-        if isdominated[t] == 0:
-            indices_to_add.append(t)
-    removed_indices = []
-    for t in range(size):
-        if isdominated[t] > 0:
-            removed_indices.append(t)
-    new_members = np.zeros((len(indices_to_add), pareto_cols))
-    for idx, t in enumerate(indices_to_add):
-        new_members[idx] = pareto[t]
-    pareto = new_members
-    indices_set = set(removed_indices)
-    variables= [item for idx, item in enumerate(variables) if idx not in indices_set]
-    pareto_array = np.array(pareto)
-    _, unique_indices = np.unique(pareto_array, axis=0, return_index=True)
-    sorted_unique_indices = sorted(unique_indices)
-    all_indices = set(range(len(pareto)))
-    removed_indices = sorted(all_indices - set(sorted_unique_indices))
-    unique_pareto = pareto_array[sorted_unique_indices]
-    filtered_variables = [variables[idx] for idx in sorted_unique_indices]
-
-    return unique_pareto, filtered_variables
+
+    from ...operators.pareto import non_dominated
+
+    pareto = np.asarray(pareto)
+    if len(pareto) == 0:
+        return pareto, variables
+
+    keep = np.flatnonzero(non_dominated(pareto, directions))
+    _, unique_indices = np.unique(pareto[keep], axis=0, return_index=True)
+    keep = keep[np.sort(unique_indices)]
+
+    return pareto[keep], [variables[idx] for idx in keep if idx < len(variables)]
+
+def saved_variables(model_object):
+
+    return {var: model_object.get_numpy_var(var) for typ, var in model_object.features['variables'].keys()}
+
+def run_tasks(task, arguments, n_jobs=1, backend='process'):
+    """
+    Runs ``task`` for each tuple of arguments, in worker processes or threads if ``n_jobs`` is not 1, and returns the results in the order of the arguments.
+    """
+
+    if n_jobs in [None, 1]:
+        return [task(*argument) for argument in arguments]
+
+    from joblib import Parallel, delayed
+
+    return Parallel(n_jobs=n_jobs, backend={'process': 'loky', 'thread': 'threading'}.get(backend, backend))(
+        delayed(task)(*argument) for argument in arguments)
 
 def sol_multi(
     instance, 
@@ -70,7 +66,8 @@ def sol_multi(
     max_iterations=None, 
     approach_options=dict(),
     weights = [],
-    save_vars = False):
+    save_vars = False,
+    interface_name = None):
     
     from ...generators import solution_generator
 
@@ -99,13 +96,57 @@ def sol_multi(
 
     M = np.copy(len(directions))
     dir_map = {'max': -1, 'min': 1}
+
+    n_jobs = approach_options.get('n_jobs', 1)
+    backend = approach_options.get('backend', 'process')
+
+    if n_jobs not in [None, 1] and cpu_threads is None:
+        from joblib import effective_n_jobs
+        cpu_threads = max(1, (os.cpu_count() or 1) // effective_n_jobs(n_jobs))
+
+    if approach_options.get('persistent', False):
+
+        model_object = None
+        if objective_id not in ['ecm', 'nwsm']:
+            warnings.warn(f"The 'persistent' option only applies to the 'ecm' and 'nwsm' approaches; '{objective_id}' rebuilds the model for each solve.", RuntimeWarning, stacklevel=2)
+        elif n_jobs not in [None, 1]:
+            warnings.warn("The 'persistent' option is ignored with n_jobs > 1, as each worker builds and solves its own model.", RuntimeWarning, stacklevel=2)
+        else:
+            if interface_name is None:
+                model_object = instance()
+                interface_name = model_object.features['interface_name']
+            if not solution_generator.supports_regeneration(interface_name):
+                warnings.warn(f"The 'persistent' option is ignored, as '{interface_name}' cannot re-solve a live model; use one of {solution_generator.persistent_interfaces + ['pyoptinterface']}.", RuntimeWarning, stacklevel=2)
+                model_object = None
+            elif model_object is None:
+                model_object = instance()
+
+        if model_object is not None:
+
+            settings = {
+                'solver_name': solver_name,
+                'solver_options': solver_options,
+                'debug_mode': debug,
+                'time_limit': time_limit,
+                'thread_count': cpu_threads,
+                'absolute_gap': absolute_gap,
+                'relative_gap': relative_gap,
+                'log': show_log,
+                'write_model_file': save_model,
+                'save_solver_log': save_log,
+                'email_address': email,
+                'max_iterations': max_iterations,
+            }
+
+            return sol_multi_persistent(model_object, directions, objective_id, settings, approach_options, weights, save_vars, show_log)
     temp_pareto = []
     temp_vars = []
 
     if approach_options.get('payoff_method', 'separated') == 'separated':
         
         payoff = np.zeros([M, M])
-        for m in range(M):
+
+        def payoff_model(m):
             model_object = instance()
             model_object.features['directions'] = directions
             model_object.features['objective_being_optimized'] = m
@@ -127,15 +168,17 @@ def sol_multi(
             model_object.features['model_object_before_solve'] = model_object.model
             model_object.solution = solution_generator.generate_solution(model_object.features)
             if model_object.healthy():
-                for k in range(M):
-                    payoff[m, k] = model_object.get_variable(z[k])
-                temp_pareto.append([model_object.get_variable(z[k]) for k in range(M)])
+                return True, [model_object.get_variable(z[k]) for k in range(M)], saved_variables(model_object) if save_vars else None
+            return False, None, None
+
+        for m, (healthy, result, saved) in enumerate(run_tasks(payoff_model, [(m,) for m in range(M)], n_jobs, backend)):
+            if healthy:
+                payoff[m, :] = result
+                temp_pareto.append(result)
                 if save_vars:
-                    temp_vars.append({})
-                    for typ,var in model_object.features['variables'].keys():
-                        temp_vars[-1][var] = model_object.get_numpy_var(var)
+                    temp_vars.append(saved)
             else:
-                sys.exit(f"There is a problem when {directions[k]}imizing obj {k}")
+                sys.exit(f"There is a problem when {directions[m]}imizing obj {m}")
 
     if show_log:
         print()
@@ -195,7 +238,9 @@ def sol_multi(
             model_object.features['email_address'] = email
             model_object.features['max_iterations'] = max_iterations
             model_object.solution = solution_generator.generate_solution(model_object.features)
-            return model_object, [model_object.get(z[k]) for k in range(M)]
+            if model_object.healthy():
+                return True, [model_object.get(z[k]) for k in range(M)], saved_variables(model_object) if save_vars else None
+            return False, None, None
 
         maxobj = np.amax(payoff, axis=0)
         minobj = np.amin(payoff, axis=0)
@@ -207,26 +252,16 @@ def sol_multi(
         pareto = []
         variables = []
         if approach_options.get('important_objective', None) == None:
-            for k in range(M):
-                for g in range(0, intervals+1):
-                    models, result = eps_constraint_model(g, intervals, k)
-                    if models.healthy():
-                        found_pareto_at(result,show_log)
-                        pareto.append(result)
-                        if save_vars:
-                            variables.append({})
-                            for typ,var in models.features['variables'].keys():
-                                variables[-1][var] = models.get_numpy_var(var)
+            tasks = [(g, intervals, k) for k in range(M) for g in range(0, intervals+1)]
         else:
-            for g in range(0, intervals+1):
-                models, result = eps_constraint_model(g, intervals, k)
-                if models.healthy():
-                    found_pareto_at(result,show_log)
-                    pareto.append(result)
-                    if save_vars:
-                        variables.append({})
-                        for typ,var in models.features['variables'].keys():
-                            variables[-1][var] = models.get_numpy_var(var)
+            tasks = [(g, intervals, approach_options['important_objective']) for g in range(0, intervals+1)]
+
+        for healthy, result, saved in run_tasks(eps_constraint_model, tasks, n_jobs, backend):
+            if healthy:
+                found_pareto_at(result,show_log)
+                pareto.append(result)
+                if save_vars:
+                    variables.append(saved)
 
         pareto = np.array(pareto)
 
@@ -268,7 +303,9 @@ def sol_multi(
             model_object.features['email_address'] = email
             model_object.features['max_iterations'] = max_iterations
             model_object.solution = solution_generator.generate_solution(model_object.features)
-            return model_object, [model_object.get(z[k]) for k in range(M)]
+            if model_object.healthy():
+                return True, [model_object.get(z[k]) for k in range(M)], saved_variables(model_object) if save_vars else None
+            return False, None, None
 
         maxobj = np.amax(payoff, axis=0)
         minobj = np.amin(payoff, axis=0)
@@ -277,39 +314,144 @@ def sol_multi(
             raise ValueError(f'Please check the conflict among objectives!\nCurrent payoff:\n {payoff}\n\nCurrent conflict:\n {np.corrcoef(payoff.T)}')
 
         intervals = approach_options.get('intervals', 10)
-        pareto = np.empty([intervals+1, M])
         variables = []
 
         if len(weights)==0:
+            tasks = []
             for g in range(0, intervals+1):
                 if approach_options.get('wm', 'dirichlet'):
                     weights = np.random.dirichlet(np.ones(M), size=1)[0]
                 if approach_options.get('wm', 'random'):
                     nums = np.random.rand(M)
                     weights = nums/sum(nums)
-                models, result = nwsm_model(weights)
-                if models.healthy():
-                    for k in range(M):
-                        pareto[g, k] = result[k]
-                    found_pareto_at(pareto[g,:],show_log)
-                    if save_vars:
-                        variables.append({})
-                        for typ,var in models.features['variables'].keys():
-                            variables[-1][var] = models.get_numpy_var(var)
-                            variables[-1]['_weights'] = weights
-
+                tasks.append((weights,))
         else:
-            models, result = nwsm_model(weights)
-            if models.healthy():
+            tasks = [(weights,)]
+
+        pareto = np.empty([len(tasks), M])
+
+        for g, (healthy, result, saved) in enumerate(run_tasks(nwsm_model, tasks, n_jobs, backend)):
+            if healthy:
                 for k in range(M):
                     pareto[g, k] = result[k]
                 found_pareto_at(pareto[g,:],show_log)
                 if save_vars:
-                    variables.append({})
-                    for typ,var in models.features['variables'].keys():
-                        variables[-1][var] = models.get_numpy_var(var)
+                    saved['_weights'] = tasks[g][0]
+                    variables.append(saved)
 
     pareto, variables = revise_pareto(dir_map, directions, pareto, variables)
     conflict = np.corrcoef(pareto.T)
 
     return pareto, payoff, conflict, variables
+
+def sol_multi_persistent(model_object, directions, objective_id, settings, approach_options=dict(), weights=[], save_vars=False, show_log=False):
+    """
+    Generates the payoff table and the Pareto front on a single live model.
+
+    The model, the '_z' variables and the objective-link constraints are built and passed to the solver once. Epsilon
+    constraints are written against the '_e' variables, so that moving from one grid point to the next only changes
+    the bounds of '_e' (or the objective weights) on the solver object, which then starts from the previous Pareto point.
+    """
+
+    from ...generators import solution_generator
+
+    M = len(directions)
+    dir_map = {'max': -1, 'min': 1}
+
+    model_object.features.update(settings)
+    model_object.features['directions'] = list(directions)
+    model_object.features['objective_being_optimized'] = 0
+
+    objectives = list(model_object.features['objectives'])
+    z = model_object.fvar('_z', [range(M)])
+    e = model_object.fvar('_e', [range(M)])
+
+    for k in range(M):
+        model_object.con(z[k] == objectives[k], name=f"epsilon_objective_value_{k}")
+
+    if objective_id == 'ecm':
+        for k in range(M):
+            if directions[k] == 'max':
+                model_object.con(z[k] >= e[k], name=f"epsilon_max_{k}")
+            if directions[k] == 'min':
+                model_object.con(z[k] <= e[k], name=f"epsilon_min_{k}")
+
+    model_object.features['model_object_before_solve'] = model_object.model
+
+    def solve(objective=None, direction=None, bounds=[]):
+        if objective is None:
+            model_object.solution = solution_generator.generate_solution(model_object.features)
+        else:
+            model_object.solution = solution_generator.regenerate_solution(model_object.features, objective, direction, bounds)
+        return model_object.healthy()
+
+    def collect(pareto, variables):
+        pareto.append([model_object.get(z[k]) for k in range(M)])
+        found_pareto_at(pareto[-1], show_log)
+        if save_vars:
+            variables.append(saved_variables(model_object))
+
+    payoff = np.zeros([M, M])
+    for m in range(M):
+        if not (solve() if m == 0 else solve(z[m], directions[m])):
+            sys.exit(f"There is a problem when {directions[m]}imizing obj {m}")
+        for k in range(M):
+            payoff[m, k] = model_object.get(z[k])
+
+    if show_log:
+        print()
+        print("Finished Generating the Payoff Table!")
+        print(payoff)
+        print()
+
+    maxobj = np.amax(payoff, axis=0)
+    minobj = np.amin(payoff, axis=0)
+
+    if np.any(maxobj-minobj) == 0:
+        raise ValueError(f'Please check the conflict among objectives!\nCurrent payoff:\n{payoff}\n\nCurrent conflict:\n"{np.corrcoef(payoff.T)}')
+
+    intervals = approach_options.get('intervals', 10)
+    pareto = []
+    variables = []
+
+    if objective_id == 'ecm':
+
+        important = approach_options.get('important_objective', None)
+
+        for k in (range(M) if important is None else [important]):
+            for g in range(0, intervals+1):
+                bounds = []
+                for j in range(M):
+                    if j == k:
+                        bounds.append((e[j], None, None))
+                    elif directions[j] == 'max':
+                        bounds.append((e[j], maxobj[j] - ((1/intervals)*(g))*(maxobj[j] - minobj[j]), maxobj[j] - ((1/intervals)*(g))*(maxobj[j] - minobj[j])))
+                    else:
+                        bounds.append((e[j], minobj[j] + ((1/intervals)*(g))*(maxobj[j] - minobj[j]), minobj[j] + ((1/intervals)*(g))*(maxobj[j] - minobj[j])))
+                if solve(z[k], directions[k], bounds):
+                    collect(pareto, variables)
+
+    if objective_id == 'nwsm':
+
+        def weighted_objective(weights):
+            return sum((1/2)*weights[k]*((1+dir_map[directions[k]])*(z[k]-minobj[k]) + (1-dir_map[directions[k]])*(maxobj[k]-z[k]))/(maxobj[k] - minobj[k]) for k in range(M))
+
+        if len(weights) == 0:
+            for g in range(0, intervals+1):
+                if approach_options.get('wm', 'dirichlet'):
+                    weights = np.random.dirichlet(np.ones(M), size=1)[0]
+                if approach_options.get('wm', 'random'):
+                    nums = np.random.rand(M)
+                    weights = nums/sum(nums)
+                if solve(weighted_objective(weights), 'min'):
+                    collect(pareto, variables)
+                    if save_vars:
+                        variables[-1]['_weights'] = weights
+        else:
+            if solve(weighted_objective(weights), 'min'):
+                collect(pareto, variables)
+
+    pareto, variables = revise_pareto(dir_map, directions, np.array(pareto), variables)
+    conflict = np.corrcoef(pareto.T)
+
+    return pareto, payoff, conflict, variables
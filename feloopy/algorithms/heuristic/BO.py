@@ -0,0 +1,101 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import warnings as wn
+import numpy as np
+
+wn.filterwarnings("ignore")
+
+class BO:
+    """
+    Bayesian optimization: a Gaussian process (RBF kernel, median-distance length scale) is fitted on the last ``ac`` evaluated agents, and the ``t`` candidates
+    with the highest upper confidence bound (``kp`` standard deviations) among ``nc`` random and local samples are evaluated together in the next epoch.
+    """
+
+    def __init__(self, f: int, d: list, s: int, t: int, ac: int = 200, nc: int = 1000, kp: float = 2.0, termination=None, **kwargs):
+
+        self.d = np.asarray([1 if item == 'max' else -1 for item in d])
+        self.r = 0 if len(d) == 1 else len(d)
+        self.f = f
+        self.s = s
+        self.t = t
+        self.ac = max(ac, t)
+        self.nc = max(nc, t)
+        self.kp = kp
+        self.termination = termination
+        self.features_cols = [0, self.f]
+        self.status_col = [-2]
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + 1 + 1
+        self.solve = self.run
+
+    def run(self, evaluate):
+
+        self.evaluate = evaluate
+        self.initialize()
+        if self.termination is not None:
+            self.termination.start()
+        for self.it_no in range(0, self.s):
+            self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
+            self.vary()
+        return self.report()
+
+    def initialize(self):
+
+        if self.r == 0:
+            self.pi = np.random.rand(self.t, self.single_objective_tot)
+            self.pi[:, self.reward_col] = - np.inf * self.d
+            self.pi[:, self.status_col] = 0
+            self.bad_status = -1
+            self.archive = np.empty((0, self.single_objective_tot))
+        self.best = self.pi[-1].copy()
+
+    def update(self):
+
+        self.pi = self.evaluate(self.pi)
+
+        if self.r == 0:
+            leader = np.argmax(self.d[0]*self.pi[:, self.reward_col[0]])
+            if self.d[0]*self.pi[leader][self.reward_col[0]] > self.d[0]*self.best[self.reward_col[0]]: self.best = self.pi[leader].copy()
+            self.archive = np.concatenate([self.archive, self.pi])[-self.ac:]
+
+    def kernel(self, a, b):
+
+        distance = np.sum(a*a, axis=1)[:, None] + np.sum(b*b, axis=1)[None, :] - 2*a@b.T
+        return np.exp(-np.maximum(distance, 0)/(2*self.length**2))
+
+    def vary(self):
+
+        x = self.archive[:, :self.f]
+        y = self.d[0]*self.archive[:, self.reward_col[0]]
+        finite = np.isfinite(y)
+        x, y = x[finite], y[finite]
+        if len(y) < 2:
+            self.pi[:, :self.f] = np.random.rand(self.t, self.f)
+            return
+
+        y = (y - y.mean())/(y.std() if y.std() > 0 else 1)
+        distance = np.sqrt(np.maximum(np.sum(x*x, axis=1)[:, None] + np.sum(x*x, axis=1)[None, :] - 2*x@x.T, 0))
+        self.length = max(np.median(distance[np.triu_indices(len(x), 1)]), 1e-3)
+
+        k = self.kernel(x, x) + 1e-6*np.eye(len(x))
+        try:
+            l = np.linalg.cholesky(k)
+        except np.linalg.LinAlgError:
+            l = np.linalg.cholesky(k + 1e-3*np.eye(len(x)))
+        alpha = np.linalg.solve(l.T, np.linalg.solve(l, y))
+
+        local = self.nc//2
+        candidates = np.concatenate([np.random.rand(self.nc - local, self.f), np.clip(self.best[:self.f] + 0.05*np.random.randn(local, self.f), 0, 1)])
+        k_star = self.kernel(candidates, x)
+        v = np.linalg.solve(l, k_star.T)
+        ucb = k_star@alpha + self.kp*np.sqrt(np.maximum(1 - np.sum(v*v, axis=0), 1e-12))
+
+        self.pi[:, :self.f] = candidates[np.argpartition(-ucb, self.t - 1)[:self.t]]
+
+    def report(self):
+
+        if self.r == 0:
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
@@ -4,11 +4,12 @@
 import warnings as wn
 import numpy as np
 
+from .kernels import use_jit, seed_kernels, de_vary
 wn.filterwarnings("ignore")
 
 class DE:
 
-    def __init__(self, f: int, d: list, s: int, t: int, cr: float, mu: float, **kwargs):
+    def __init__(self, f: int, d: list, s: int, t: int, cr: float, mu: float, termination=None, jit=None, **kwargs):
         self.d = np.asarray([1 if item == 'max' else -1 for item in d])
         self.r = 0 if len(d) == 1 else len(d)
         self.f = f
@@ -16,6 +17,9 @@ class DE:
         self.t = t
         self.cr = cr
         self.mu = mu
+        self.termination = termination
+        self.jit = use_jit(jit)
+        self.buffer = None
         self.new_features_cols = [0, self.f]
         self.old_features_cols = [self.f, 2*self.f]
         self.status_col = [-2]
@@ -28,8 +32,14 @@ class DE:
 
         self.evaluate = evaluate
         self.initialize()
+        if self.jit:
+            seed_kernels(np.random.randint(0, 2**31 - 1))
+        if self.termination is not None:
+            self.termination.start()
         for self.it_no in range(0, self.s):
             self.update()
+            if self.termination is not None and self.termination.check(self.best[self.old_reward_col[0]], self.d[0], self.pi[:, self.new_features_cols[0]:self.new_features_cols[1]], self.t):
+                break
             self.vary()
         return self.report()
 
@@ -57,6 +67,13 @@ class DE:
 
     def vary(self):
 
+        if self.jit:
+            if self.buffer is None or self.buffer.shape != (self.t, self.f):
+                self.buffer = np.empty((self.t, self.f))
+            de_vary(self.pi[:, :self.f], self.buffer, self.cr, self.mu)
+            self.pi[:, :self.f] = self.buffer
+            return
+
         indices = np.array([np.random.randint(0, self.t, 3) for t in range(self.t)])
         mask = np.random.rand(self.t) < self.cr
         self.pi[mask, :self.f] = np.clip(self.pi[indices[mask, 0], :self.f] + self.mu * (self.pi[indices[mask, 1], :self.f] - self.pi[indices[mask, 2], :self.f]), 0, 1)
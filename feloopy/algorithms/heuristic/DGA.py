@@ -0,0 +1,90 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import warnings as wn
+import numpy as np
+
+wn.filterwarnings("ignore")
+
+class GA:
+    """
+    Discrete (binary) genetic algorithm: the features are 0 or 1 (the lower or upper bound of each variable), parents are chosen by truncation (``sc=0``) or
+    tournament (``sc=1``) selection, recombined by uniform crossover and mutated by bit flips, and the best agent is kept.
+    """
+
+    def __init__(self, f: int, d: list, s: int, t: int, sc: int, cr: float, mu: float, sfl: float, sfu: float, termination=None, **kwargs):
+
+        self.f = f
+        self.d = np.asarray([1 if item == 'max' else -1 for item in d])
+        self.s = s
+        self.t = t
+        self.sc = sc
+        self.cr = cr
+        self.mu = mu
+        self.sfl = sfl
+        self.sfu = sfu
+        self.termination = termination
+        self.r = 0 if len(d) == 1 else len(d)
+        self.features_cols = [0, self.f]
+        self.status_col = [-2]
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + 1 + 1
+        self.solve = self.run
+
+    def run(self, evaluate):
+
+        self.evaluate = evaluate
+        self.initialize()
+        if self.termination is not None:
+            self.termination.start()
+        for self.it_no in range(0, self.s):
+            self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
+            self.vary()
+        return self.report()
+
+    def initialize(self):
+
+        if self.r == 0:
+            self.pi = np.random.rand(self.t, self.single_objective_tot)
+            self.pi[:, self.features_cols[0]:self.features_cols[1]] = np.random.randint(0, 2, size=(self.t, self.f))
+            self.pi[:, self.reward_col] = - np.inf * self.d
+            self.pi[:, self.status_col] = 0
+            self.bad_status = -1
+        self.best = self.pi[-1].copy()
+
+    def update(self):
+
+        self.pi = self.evaluate(self.pi)
+
+        if self.r == 0:
+            fitness = self.d[0]*self.pi[:, self.reward_col[0]]
+            leader = np.argmax(fitness)
+            if fitness[leader] > self.d[0]*self.best[self.reward_col[0]]: self.best = self.pi[leader].copy()
+
+            if self.sc == 0:
+                #Truncation
+                survivors = np.argsort(-fitness)[:max(1, int(np.random.uniform(self.sfl, self.sfu)*self.t))]
+                self.parents = survivors[np.random.randint(0, len(survivors), size=self.t)]
+
+            if self.sc == 1:
+                #Tournament
+                size = max(2, int(np.random.uniform(self.sfl, self.sfu)*self.t))
+                entrants = np.random.randint(0, self.t, size=(self.t, size))
+                self.parents = entrants[np.arange(self.t), np.argmax(fitness[entrants], axis=1)]
+
+    def vary(self):
+
+        parents = self.pi[self.parents, self.features_cols[0]:self.features_cols[1]]
+        mates = parents[np.random.permutation(self.t)]
+        crossed = (np.random.rand(self.t, 1) < self.cr) & (np.random.rand(self.t, self.f) < 0.5)
+        children = np.where(crossed, mates, parents)
+        children = np.where(np.random.rand(self.t, self.f) < self.mu, 1 - children, children)
+        children[0] = self.best[self.features_cols[0]:self.features_cols[1]]
+        self.pi[:, self.features_cols[0]:self.features_cols[1]] = children
+
+    def report(self):
+
+        if self.r == 0:
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
@@ -5,12 +5,13 @@
 import warnings as wn
 import numpy as np
 
+from .kernels import use_jit, seed_kernels, ga_vary
 
 wn.filterwarnings("ignore")
 
 class GA:
 
-    def __init__(self, f: int, d: list, s: int, t: int, sc: int,cr: float, mu: float, sfl: float, sfu: float, **kwargs):
+    def __init__(self, f: int, d: list, s: int, t: int, sc: int,cr: float, mu: float, sfl: float, sfu: float, termination=None, jit=None, **kwargs):
 
         self.f = f
         self.d = np.asarray([1 if item == 'max' else -1 for item in d])
@@ -21,6 +22,9 @@ class GA:
         self.mu = mu
         self.sfl = sfl
         self.sfu = sfu
+        self.termination = termination
+        self.jit = use_jit(jit)
+        self.buffer = None
         self.r = 0 if len(d) == 1 else len(d)
         self.features_cols = [0, self.f]
         self.status_col = [-2]
@@ -32,8 +36,14 @@ class GA:
 
         self.evaluate = evaluate
         self.initialize()
+        if self.jit:
+            seed_kernels(np.random.randint(0, 2**31 - 1))
+        if self.termination is not None:
+            self.termination.start()
         for self.it_no in range(0, self.s):
             self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
             self.vary()
         return self.report()
 
@@ -66,11 +76,18 @@ class GA:
                 size = int(np.random.uniform(self.sfl,self.sfu)*self.t)
                 tournament_individuals = np.random.choice(self.t, size, replace=False)
                 best_individual = np.argmax(self.pi[tournament_individuals, self.reward_col[0]])
-                if self.d[0] == 1: self.pi[:self.t-size] = [self.pi[tournament_individuals[best_individual]] for _ in range(self.t-size)]
-                else: self.pi[size:] = [self.pi[tournament_individuals[best_individual]] for _ in range(self.t-size)]
+                if self.d[0] == 1: self.pi[:self.t-size] = self.pi[tournament_individuals[best_individual]]
+                else: self.pi[size:] = self.pi[tournament_individuals[best_individual]]
 
     def vary(self):
 
+        if self.jit:
+            if self.buffer is None or self.buffer.shape != (self.t, self.f):
+                self.buffer = np.empty((self.t, self.f))
+            ga_vary(self.pi[:, self.features_cols[0]:self.features_cols[1]], self.buffer, self.cr, self.mu)
+            self.pi[:, self.features_cols[0]:self.features_cols[1]] = self.buffer
+            return
+
         pool = np.asarray([np.array([t, np.random.randint(0, self.t)]) if np.random.rand() < self.cr else np.array([t, t]) for t in range(0, self.t)], dtype=np.int64)
         mask = np.random.randint(0, 2, size=(self.t, self.f)) == 1
         self.pi[pool[:,0], self.features_cols[0]:self.features_cols[1]] = mask*self.pi[:, self.features_cols[0]:self.features_cols[1]] + (1-mask)*(self.pi[pool[:,0], self.features_cols[0]:self.features_cols[1]] + np.random.uniform(-1, 1, size=(self.t, self.f))*(self.pi[pool[:,1], self.features_cols[0]:self.features_cols[1]]-self.pi[pool[:,0], self.features_cols[0]:self.features_cols[1]]))
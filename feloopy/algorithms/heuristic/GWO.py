@@ -4,17 +4,20 @@
 import warnings as wn
 import numpy as np
 
+from .kernels import use_jit, seed_kernels, gwo_vary
 wn.filterwarnings("ignore")
 
 class GWO:
 
-    def __init__(self, f: int, d: list, s: int, t: int, **kwargs):
+    def __init__(self, f: int, d: list, s: int, t: int, termination=None, jit=None, **kwargs):
 
         self.d = np.asarray([1 if item == 'max' else -1 for item in d])
         self.r = 0 if len(d) == 1 else len(d)
         self.f = f
         self.it = s
         self.t = t
+        self.termination = termination
+        self.jit = use_jit(jit)
         self.features_cols = [0, self.f]
         self.status_col = [-2]
         self.reward_col = [-1]
@@ -25,8 +28,14 @@ class GWO:
 
         self.evaluate = evaluate
         self.initialize()
+        if self.jit:
+            seed_kernels(np.random.randint(0, 2**31 - 1))
+        if self.termination is not None:
+            self.termination.start()
         for self.it_no in range(0, self.it):
             self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
             self.vary()
         return self.report()
 
@@ -54,6 +63,12 @@ class GWO:
 
     def vary(self):
 
+        if self.jit:
+            features = np.ascontiguousarray(self.pi[:, :self.f])
+            gwo_vary(features, self.alpha[:self.f], self.beta[:self.f], self.delta[:self.f], 2*(1 - self.it_no/self.it))
+            self.pi[:, :self.f] = features
+            return
+
         a = 2*(1 - self.it_no/self.it)*(2*np.random.rand(self.t, self.f, 3)-1)
         c = 2*np.random.rand(self.t, self.f, 3)
         self.pi[:, :self.f] = np.clip((self.alpha[:self.f] - a[:, :, 0] * np.abs(c[:, :, 0] * self.alpha[:self.f] - self.pi[:, :self.f]))/3 + (self.beta[:self.f] - a[:, :, 1] * np.abs(c[:, :, 1] * self.beta[:self.f] - self.pi[:, :self.f]))/3 + (self.delta[:self.f] - a[:, :, 2] * np.abs(c[:, :, 2] * self.delta[:self.f] - self.pi[:, :self.f]))/3, 0, 1)
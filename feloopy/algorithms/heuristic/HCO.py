@@ -0,0 +1,73 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import warnings as wn
+import numpy as np
+
+wn.filterwarnings("ignore")
+
+class HCO:
+    """
+    Hill climbing optimization: a population of climbers each evaluates one Gaussian neighbour per epoch (with a shrinking step) and moves to it if it is not worse; the ``e`` worst climbers restart from the best one.
+    """
+
+    def __init__(self, f: int, d: list, s: int, t: int, e: int, sg: float = 0.1, termination=None, **kwargs):
+
+        self.d = np.asarray([1 if item == 'max' else -1 for item in d])
+        self.r = 0 if len(d) == 1 else len(d)
+        self.f = f
+        self.s = s
+        self.t = t
+        self.e = min(e, t - 1)
+        self.sg = sg
+        self.termination = termination
+        self.features_cols = [0, self.f]
+        self.status_col = [-2]
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + 1 + 1
+        self.solve = self.run
+
+    def run(self, evaluate):
+
+        self.evaluate = evaluate
+        self.initialize()
+        if self.termination is not None:
+            self.termination.start()
+        for self.it_no in range(0, self.s):
+            self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.climbers[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
+            self.vary()
+        return self.report()
+
+    def initialize(self):
+
+        if self.r == 0:
+            self.pi = np.random.rand(self.t, self.single_objective_tot)
+            self.pi[:, self.reward_col] = - np.inf * self.d
+            self.pi[:, self.status_col] = 0
+            self.bad_status = -1
+            self.climbers = self.pi.copy()
+        self.best = self.pi[-1].copy()
+
+    def update(self):
+
+        self.pi = self.evaluate(self.pi)
+
+        if self.r == 0:
+            accepted = self.d[0]*self.pi[:, self.reward_col[0]] >= self.d[0]*self.climbers[:, self.reward_col[0]]
+            self.climbers[accepted] = self.pi[accepted]
+            order = np.argsort(self.d[0]*self.climbers[:, self.reward_col[0]])
+            if self.d[0]*self.climbers[order[-1]][self.reward_col[0]] > self.d[0]*self.best[self.reward_col[0]]: self.best = self.climbers[order[-1]].copy()
+            if self.e > 0:
+                self.climbers[order[:self.e]] = self.best
+
+    def vary(self):
+
+        step = self.sg*(1 - self.it_no/self.s) + 1e-3
+        self.pi[:, self.features_cols[0]:self.features_cols[1]] = np.clip(self.climbers[:, :self.f] + step*np.random.randn(self.t, self.f), 0, 1)
+
+    def report(self):
+
+        if self.r == 0:
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
@@ -0,0 +1,78 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import warnings as wn
+import numpy as np
+
+wn.filterwarnings("ignore")
+
+class PSO:
+    """
+    Particle swarm optimization: the velocities and personal bests of the swarm are kept next to the ``pi`` matrix and updated in one NumPy step per epoch.
+    """
+
+    def __init__(self, f: int, d: list, s: int, t: int, w: float, c1: float, c2: float, vm: float = 0.2, termination=None, **kwargs):
+
+        self.d = np.asarray([1 if item == 'max' else -1 for item in d])
+        self.r = 0 if len(d) == 1 else len(d)
+        self.f = f
+        self.s = s
+        self.t = t
+        self.w = w
+        self.c1 = c1
+        self.c2 = c2
+        self.vm = vm
+        self.termination = termination
+        self.features_cols = [0, self.f]
+        self.status_col = [-2]
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + 1 + 1
+        self.solve = self.run
+
+    def run(self, evaluate):
+
+        self.evaluate = evaluate
+        self.initialize()
+        if self.termination is not None:
+            self.termination.start()
+        for self.it_no in range(0, self.s):
+            self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], self.t):
+                break
+            self.vary()
+        return self.report()
+
+    def initialize(self):
+
+        if self.r == 0:
+            self.pi = np.random.rand(self.t, self.single_objective_tot)
+            self.pi[:, self.reward_col] = - np.inf * self.d
+            self.pi[:, self.status_col] = 0
+            self.bad_status = -1
+            self.velocity = np.random.uniform(-self.vm, self.vm, size=(self.t, self.f))
+            self.p_best = self.pi.copy()
+        self.best = self.pi[-1].copy()
+
+    def update(self):
+
+        self.pi = self.evaluate(self.pi)
+
+        if self.r == 0:
+            improved = self.d[0]*self.pi[:, self.reward_col[0]] > self.d[0]*self.p_best[:, self.reward_col[0]]
+            self.p_best[improved] = self.pi[improved]
+            leader = np.argmax(self.d[0]*self.p_best[:, self.reward_col[0]])
+            if self.d[0]*self.p_best[leader][self.reward_col[0]] > self.d[0]*self.best[self.reward_col[0]]: self.best = self.p_best[leader].copy()
+
+    def vary(self):
+
+        x = self.pi[:, self.features_cols[0]:self.features_cols[1]]
+        r1, r2 = np.random.rand(2, self.t, self.f)
+        self.velocity = np.clip(self.w*self.velocity + self.c1*r1*(self.p_best[:, :self.f] - x) + self.c2*r2*(self.best[:self.f] - x), -self.vm, self.vm)
+        moved = x + self.velocity
+        self.velocity[(moved < 0) | (moved > 1)] = 0
+        self.pi[:, self.features_cols[0]:self.features_cols[1]] = np.clip(moved, 0, 1)
+
+    def report(self):
+
+        if self.r == 0:
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
@@ -5,12 +5,21 @@
 import warnings as wn
 import numpy as np
 
+from .neighborhood import Neighborhood
+
 wn.filterwarnings("ignore")
 
 
 class SA:
+    """
+    Simulated annealing: each iteration evaluates ``k`` neighbors of the current agent of each of ``ch`` chains in one batch, and each chain moves to its best
+    neighbor if it is better or with the Metropolis probability at its temperature. The temperature cools linearly from ``mt`` over the epochs.
+
+    With several chains (parallel tempering), the chains run at temperatures spread geometrically down to ``tl`` times the current one, and adjacent chains
+    exchange their agents with the replica-exchange probability after every iteration.
+    """
 
-    def __init__(self, f: int, d: list, s: int, t: int, cc: int, mt: int, **kwargs):
+    def __init__(self, f: int, d: list, s: int, t: int, cc: int, mt: int, k: int = 1, ch: int = 1, tl: float = 1e-2, groups=None, mv=None, sg: float = 0.1, termination=None, **kwargs):
 
         self.d = np.asarray([1 if item == 'max' else -1 for item in d])
         self.r = 0 if len(d) == 1 else len(d)
@@ -19,57 +28,71 @@ class SA:
         self.t = t
         self.cc = cc
         self.mt = mt
-        self.new_features_cols = [0, self.f]
-        self.old_features_cols = [self.f, 2*self.f]
+        self.k = k
+        self.ch = ch
+        self.ladder = np.geomspace(1, tl, ch) if ch > 1 else np.ones(1)
+        self.neighborhood = Neighborhood(f, groups, mv, sg)
+        self.termination = termination
+        self.features_cols = [0, self.f]
         self.status_col = [-2]
-        self.new_reward_col = [-1]
-        self.old_reward_col = [-3] if self.r == 0 else [-3-self.r]
-        self.single_objective_tot = self.f + self.f + 1 + 1 + 1
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + 1 + 1
         self.solve = self.run
 
     def run(self, evaluate):
 
         self.evaluate = evaluate
         self.initialize()
+        if self.termination is not None:
+            self.termination.start()
         for self.it_no in range(0, self.s):
             for self.c in range(0, self.cc):
                 self.update()
                 self.vary()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.current[:, self.features_cols[0]:self.features_cols[1]], self.cc*self.ch*self.k):
+                break
         return self.report()
 
     def initialize(self):
 
         if self.r == 0:
-            self.pi = np.random.rand(1, self.single_objective_tot)
-            self.pi[:, self.new_reward_col] = - np.inf * self.d
-            self.pi[:, self.old_reward_col] = - np.inf * self.d
+            self.pi = np.random.rand(self.ch*self.k, self.single_objective_tot)
+            self.pi[:, self.reward_col] = - np.inf * self.d
             self.pi[:, self.status_col] = 0
-            self.best_index = -1*(1+self.d[0])//2
             self.bad_status = -1
+            self.current = self.pi[::self.k].copy()
         self.best = self.pi[-1].copy()
 
     def update(self):
 
         self.pi = self.evaluate(self.pi)
-        Accept = np.random.rand()
+
         if self.r == 0:
-            self.pi[:, self.new_features_cols[0]:self.new_features_cols[1]] = np.where(self.d[0]*self.pi[:, self.new_reward_col[0]] > self.d[0]*self.pi[:, self.old_reward_col[0]] or Accept < np.exp(-abs(
-                self.pi[:, self.old_reward_col[0]] - self.pi[:, self.new_reward_col[0]])/(((self.s-self.it_no)/self.s)*self.mt)), self.pi[:, self.new_features_cols[0]:self.new_features_cols[1]], self.pi[:, self.old_features_cols[0]:self.old_features_cols[1]])
-            self.pi[:, self.new_reward_col[0]] = np.where(self.d[0]*self.pi[:, self.new_reward_col[0]] > self.d[0]*self.pi[:, self.old_reward_col[0]] or Accept < np.exp(-abs(
-                self.pi[:, self.old_reward_col[0]] - self.pi[:, self.new_reward_col[0]])/(((self.s-self.it_no)/self.s)*self.mt)), self.pi[:, self.new_reward_col[0]], self.pi[:, self.old_reward_col[0]])
-            self.pi[:, self.old_features_cols[0]:self.old_features_cols[1]] = np.where(self.d[0]*self.pi[:, self.new_reward_col[0]] > self.d[0]*self.pi[:, self.old_reward_col[0]] or Accept < np.exp(-abs(
-                self.pi[:, self.old_reward_col[0]] - self.pi[:, self.new_reward_col[0]])/(((self.s-self.it_no)/self.s)*self.mt)), self.pi[:, self.new_features_cols[0]:self.new_features_cols[1]], self.pi[:, self.old_features_cols[0]:self.old_features_cols[1]])
-            self.pi[:, self.old_reward_col[0]] = np.where(self.d[0]*self.pi[:, self.new_reward_col[0]] > self.d[0]*self.pi[:, self.old_reward_col[0]] or Accept < np.exp(-abs(
-                self.pi[:, self.old_reward_col[0]] - self.pi[:, self.new_reward_col[0]])/(((self.s-self.it_no)/self.s)*self.mt)), self.pi[:, self.new_reward_col[0]], self.pi[:, self.old_reward_col[0]])
-            if self.d[0]*self.pi[self.best_index][self.old_reward_col[0]] > self.d[0]*self.best[self.old_reward_col[0]]:
-                self.best = self.pi[self.best_index].copy()
+            fitness = self.d[0]*self.pi[:, self.reward_col[0]]
+            leader = np.argmax(fitness)
+            if fitness[leader] > self.d[0]*self.best[self.reward_col[0]]:
+                self.best = self.pi[leader].copy()
+
+            chains = np.arange(self.ch)
+            proposals = self.pi.reshape(self.ch, self.k, -1)[chains, np.argmax(fitness.reshape(self.ch, self.k), axis=1)]
+            temperature = self.ladder*max(((self.s-self.it_no)/self.s)*self.mt, 1e-12)
+            delta = self.d[0]*(proposals[:, self.reward_col[0]] - self.current[:, self.reward_col[0]])
+            accept = (delta > 0) | (np.random.rand(self.ch) < np.exp(-np.abs(delta)/temperature))
+            self.current[accept] = proposals[accept]
+
+            if self.ch > 1:
+                lower = np.arange(self.c % 2, self.ch - 1, 2)
+                energy = -self.d[0]*self.current[:, self.reward_col[0]]
+                exchange = np.random.rand(len(lower)) < np.exp(np.minimum((1/temperature[lower] - 1/temperature[lower+1])*(energy[lower] - energy[lower+1]), 0))
+                lower = lower[exchange]
+                self.current[np.concatenate([lower, lower+1])] = self.current[np.concatenate([lower+1, lower])]
 
     def vary(self):
 
-        self.pi[:, :self.f] = np.clip(
-            self.pi[:, :self.f] + 2*np.random.rand(self.f)-1, 0, 1)
+        self.pi = np.repeat(self.current, self.k, axis=0)
+        self.pi[:, :self.f] = self.neighborhood.propose(self.pi[:, :self.f])
 
     def report(self):
 
         if self.r == 0:
-            return self.best[self.old_features_cols[0]:self.old_features_cols[1]], self.best[self.old_reward_col[0]], self.best[self.status_col]
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
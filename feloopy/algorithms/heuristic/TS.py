@@ -4,12 +4,18 @@
 import warnings as wn
 import numpy as np
 
+from .neighborhood import Neighborhood, TabuMemory
+
 wn.filterwarnings("ignore")
 
 
 class TS:
+    """
+    Tabu search: each epoch evaluates ``k`` neighbors of the current agent in one batch and moves to the best one that is not in the tabu memory of the
+    last ``c`` visited solutions (unless it improves on the best found, aspiration).
+    """
 
-    def __init__(self, f: int, d: list, s: int, t: int, c: int,**kwargs):
+    def __init__(self, f: int, d: list, s: int, t: int, c: int, k: int = 10, groups=None, mv=None, sg: float = 0.1, termination=None, **kwargs):
 
         self.d = np.asarray([1 if item == 'max' else -1 for item in d])
         self.r = 0 if len(d) == 1 else len(d)
@@ -17,6 +23,9 @@ class TS:
         self.s = s
         self.t = t
         self.c = c
+        self.k = k
+        self.neighborhood = Neighborhood(f, groups, mv, sg)
+        self.termination = termination
         self.features_cols = [0, self.f]
         self.status_col = [-2]
         self.reward_col = [-1]
@@ -27,8 +36,12 @@ class TS:
 
         self.evaluate = evaluate
         self.initialize()
+        if self.termination is not None:
+            self.termination.start()
         for self.it_no in range(0, self.s):
             self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], len(self.pi)):
+                break
             self.vary()
         return self.report()
 
@@ -38,25 +51,31 @@ class TS:
             self.pi = np.random.rand(1, self.single_objective_tot)
             self.pi[:, self.reward_col] = - np.inf * self.d
             self.pi[:, self.status_col] = 0
-            self.best_index = -1*(1+self.d[0])//2
             self.bad_status = -1
-            self.tabu_list = []
+            self.tabu_list = TabuMemory(self.c)
+            self.current = None
         self.best = self.pi[-1].copy()
 
     def update(self):
 
-        newpie = self.evaluate(self.pi)
+        self.pi = self.evaluate(self.pi)
+
         if self.r == 0:
-            if self.d[0]*newpie[self.best_index][self.reward_col[0]] > self.d[0]*self.best[self.reward_col[0]]:
-                self.best = newpie[self.best_index].copy()
-            if self.it_no == 0:
-                self.tabu_list.append(newpie)
-                self.pi = newpie.copy()
+            fitness = self.d[0]*self.pi[:, self.reward_col[0]]
+            keys = self.neighborhood.keys(self.pi[:, :self.f])
+            admissible = np.array([key not in self.tabu_list for key in keys]) | (fitness > self.d[0]*self.best[self.reward_col[0]])
+            candidates = np.flatnonzero(admissible) if admissible.any() else np.arange(len(self.pi))
+            move = candidates[np.argmax(fitness[candidates])]
+
+            self.current = self.pi[move].copy()
+            self.tabu_list.add(keys[move])
+            if fitness[move] > self.d[0]*self.best[self.reward_col[0]]:
+                self.best = self.current.copy()
 
     def vary(self):
 
-        self.pi[:, :self.f] = np.clip(
-            self.pi[:, :self.f] + 2*np.random.rand(self.f)-1, 0, 1)
+        self.pi = np.repeat(self.current[None, :], self.k, axis=0)
+        self.pi[:, :self.f] = self.neighborhood.propose(self.pi[:, :self.f])
 
     def report(self):
 
@@ -0,0 +1,74 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import timeit
+
+import numpy as np
+import psutil
+from tabulate import tabulate as tb
+
+from .kernels import NUMBA_AVAILABLE
+from .GA import GA
+from .DE import DE
+from .GWO import GWO
+
+
+def build(algorithm, t, f, jit):
+
+    match algorithm:
+        case 'ga':
+            model_object = GA(f=f, d=['max'], s=1, t=t, sc=1, cr=0.7, mu=0.02, sfl=0.4, sfu=0.6, jit=jit)
+        case 'de':
+            model_object = DE(f=f, d=['max'], s=1, t=t, cr=0.7, mu=0.02, jit=jit)
+        case 'gwo':
+            model_object = GWO(f=f, d=['max'], s=1, t=t, jit=jit)
+
+    model_object.initialize()
+    model_object.it_no = 0
+    return model_object
+
+
+def benchmark(algorithms=('ga', 'de', 'gwo'), pop_sizes=(50, 500, 5000), dimensions=(10, 1000, 100000), repeats=5, max_cells=5*10**6, show_log=True):
+    """
+    Times the ``vary`` step of the native GA, DE and GWO with NumPy and (if numba is installed) with the numba kernels, for each population size and dimension.
+
+    Combinations with more than ``max_cells`` features in the population, or whose NumPy temporaries (about a dozen float64 copies of the population)
+    would not fit in the available memory, are not timed, and are reported with the reason in the ``skipped`` column.
+    Returns one row per combination, with the average milliseconds per epoch.
+    """
+
+    memory_cells = psutil.virtual_memory().available//(12*8)
+    rows = []
+    for algorithm in algorithms:
+        for t in pop_sizes:
+            for f in dimensions:
+
+                row = {'algorithm': algorithm, 'pop_size': t, 'dimension': f}
+                if t*f > max_cells or t*f > memory_cells:
+                    reason = f"{t*f} cells > max_cells={max_cells}" if t*f > max_cells else f"{t*f} cells exceed the available memory"
+                    rows.append({**row, 'numpy': None, 'numba': None, 'speedup': None, 'skipped': reason})
+                    continue
+
+                for engine, jit in [('numpy', False), ('numba', True)]:
+                    if jit and not NUMBA_AVAILABLE:
+                        row[engine] = None
+                        continue
+                    model_object = build(algorithm, t, f, jit)
+                    model_object.vary()
+                    begin = timeit.default_timer()
+                    for _ in range(repeats):
+                        model_object.vary()
+                    row[engine] = (timeit.default_timer() - begin)/repeats*10**3
+
+                row['speedup'] = row['numpy']/row['numba'] if row['numba'] else None
+                row['skipped'] = None
+                rows.append(row)
+
+    if show_log:
+        print(tb(rows, headers="keys", tablefmt="github", floatfmt=".3f"))
+
+    return rows
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,24 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .base import GradientOptimizer
+
+class ADADELTA(GradientOptimizer):
+    """
+    Adadelta (with the learning rate as a multiplier of its steps) on batched finite-difference gradients.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, rh: float, e: float = 1e-6, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.rh = rh
+        self.e = e
+
+    def step(self, g, x):
+
+        v = self.state['v'] = self.rh*self.state.get('v', 0) + (1 - self.rh)*g*g
+        delta = np.sqrt(self.state.get('u', 0) + self.e)/np.sqrt(v + self.e)*g
+        self.state['u'] = self.rh*self.state.get('u', 0) + (1 - self.rh)*delta*delta
+        return delta
@@ -0,0 +1,21 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .base import GradientOptimizer
+
+class ADAGRAD(GradientOptimizer):
+    """
+    Adagrad on batched finite-difference gradients.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, e: float = 1e-8, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.e = e
+
+    def step(self, g, x):
+
+        v = self.state['v'] = self.state.get('v', 0) + g*g
+        return g/(np.sqrt(v) + self.e)
@@ -0,0 +1,28 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .base import GradientOptimizer
+
+class ADAM(GradientOptimizer):
+    """
+    Adam (AdamW with a weight decay ``wd``) on batched finite-difference gradients.
+
+    The weight decay is decoupled and shrinks the variables themselves (not their normalized features) by ``lr*wd`` per epoch.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, b1: float, b2: float, wd: float = 0.0, e: float = 1e-8, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.b1 = b1
+        self.b2 = b2
+        self.wd = wd
+        self.e = e
+
+    def step(self, g, x):
+
+        k = self.it_no + 1
+        m = self.state['m'] = self.b1*self.state.get('m', 0) + (1 - self.b1)*g
+        v = self.state['v'] = self.b2*self.state.get('v', 0) + (1 - self.b2)*g*g
+        return (m/(1 - self.b1**k))/(np.sqrt(v/(1 - self.b2**k)) + self.e) - self.wd*x/self.width
@@ -0,0 +1,25 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .base import GradientOptimizer
+
+class ADAMAX(GradientOptimizer):
+    """
+    Adam with the infinity norm of the gradients on batched finite-difference gradients.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, b1: float, b2: float, e: float = 1e-8, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.b1 = b1
+        self.b2 = b2
+        self.e = e
+
+    def step(self, g, x):
+
+        k = self.it_no + 1
+        m = self.state['m'] = self.b1*self.state.get('m', 0) + (1 - self.b1)*g
+        u = self.state['u'] = np.maximum(self.b2*self.state.get('u', 0), np.abs(g))
+        return (m/(1 - self.b1**k))/(u + self.e)
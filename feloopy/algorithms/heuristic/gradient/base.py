@@ -0,0 +1,113 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import warnings as wn
+import numpy as np
+
+wn.filterwarnings("ignore")
+
+class GradientOptimizer:
+    """
+    Base of the gradient-family algorithms, which climb the reward of ``t`` agents from random starts.
+
+    The ``pi`` matrix holds the features, the gradients, the status and the reward of each agent (the layout written by ``model.grad``/``model.grads``).
+    Each epoch evaluates the agents and their central finite-difference neighbours (``h`` apart along each feature) in one ``(2f+1)*t``-row call;
+    if the environment reports its own gradients through ``model.grad``/``model.grads`` (single agent), they are used instead and only the agents are evaluated.
+
+    The gradients and steps are taken in the normalized [0, 1] space of the features, so ``lr`` is a share of the range ``lb``/``ub`` of each variable
+    whatever its units, and each step is clipped to ``ms`` of that range. Subclasses implement ``step``.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, h: float = 1e-4, ms: float = 0.1, termination=None, **kwargs):
+
+        self.d = np.asarray([1 if item == 'max' else -1 for item in d])
+        self.r = 0 if len(d) == 1 else len(d)
+        self.f = f
+        self.s = s
+        self.t = t
+        self.lr = lr
+        self.h = h
+        self.ms = ms
+        self.termination = termination
+        self.lb = np.asarray(lb, dtype=float)
+        self.width = np.asarray(ub, dtype=float) - self.lb
+        self.width[~(self.width > 0)] = 1
+        self.features_cols = [0, self.f]
+        self.gradient_cols = [self.f, 2*self.f]
+        self.status_col = [-2]
+        self.reward_col = [-1]
+        self.single_objective_tot = self.f + self.f + 1 + 1
+        self.solve = self.run
+
+    def run(self, evaluate):
+
+        self.evaluate = evaluate
+        self.initialize()
+        if self.termination is not None:
+            self.termination.start()
+        for self.it_no in range(0, self.s):
+            self.update()
+            if self.termination is not None and self.termination.check(self.best[self.reward_col[0]], self.d[0], self.pi[:, self.features_cols[0]:self.features_cols[1]], len(self.batch)):
+                break
+            self.vary()
+        return self.report()
+
+    def initialize(self):
+
+        if self.r == 0:
+            self.pi = np.random.rand(self.t, self.single_objective_tot)
+            self.pi[:, self.reward_col] = - np.inf * self.d
+            self.pi[:, self.status_col] = 0
+            self.bad_status = -1
+            self.analytic = False
+            self.state = dict()
+        self.best = self.pi[-1].copy()
+
+    def neighbours(self):
+
+        x = self.pi[:, :self.f]
+        shift = self.h*np.eye(self.f)
+        self.upper = np.clip(x[:, None, :] + shift, 0, 1)
+        self.lower = np.clip(x[:, None, :] - shift, 0, 1)
+        return np.concatenate([x, self.upper.reshape(-1, self.f), self.lower.reshape(-1, self.f)])
+
+    def update(self):
+
+        self.pi[:, self.gradient_cols[0]:self.gradient_cols[1]] = 0
+        features = self.pi[:, :self.f] if self.analytic else self.neighbours()
+        self.batch = np.zeros((len(features), self.single_objective_tot))
+        self.batch[:, :self.f] = features
+        self.batch = self.evaluate(self.batch)
+
+        if self.r == 0:
+            self.pi[:, self.f:] = self.batch[:self.t, self.f:]
+            leader = np.argmax(self.d[0]*self.batch[:, self.reward_col[0]])
+            if self.d[0]*self.batch[leader][self.reward_col[0]] > self.d[0]*self.best[self.reward_col[0]]: self.best = self.batch[leader].copy()
+
+            if not self.analytic and self.t == 1 and np.any(self.pi[0, self.gradient_cols[0]:self.gradient_cols[1]] != 0):
+                self.analytic = True
+
+            if self.analytic:
+                self.gradient = self.pi[:, self.gradient_cols[0]:self.gradient_cols[1]]*self.width
+            else:
+                reward = self.batch[self.t:, self.reward_col[0]]
+                upper = reward[:self.t*self.f].reshape(self.t, self.f)
+                lower = reward[self.t*self.f:].reshape(self.t, self.f)
+                span = np.diagonal(self.upper - self.lower, axis1=1, axis2=2)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    self.gradient = np.where(span > 0, (upper - lower)/np.where(span > 0, span, 1), 0)
+                self.gradient[~np.isfinite(self.gradient)] = 0
+
+    def step(self, g, x):
+        raise NotImplementedError
+
+    def vary(self):
+
+        x = self.lb + self.pi[:, :self.f]*self.width
+        step = np.clip(self.lr*self.step(self.d[0]*self.gradient, x), -self.ms, self.ms)
+        self.pi[:, :self.f] = np.clip(self.pi[:, :self.f] + step, 0, 1)
+
+    def report(self):
+
+        if self.r == 0:
+            return self.best[self.features_cols[0]:self.features_cols[1]], self.best[self.reward_col[0]], self.best[self.status_col]
@@ -0,0 +1,24 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .base import GradientOptimizer
+
+class RMSPROP(GradientOptimizer):
+    """
+    RMSprop with momentum on batched finite-difference gradients.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, m: float, dr: float, e: float = 1e-8, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.m = m
+        self.dr = dr
+        self.e = e
+
+    def step(self, g, x):
+
+        v = self.state['v'] = self.dr*self.state.get('v', 0) + (1 - self.dr)*g*g
+        self.state['b'] = self.m*self.state.get('b', 0) + g/(np.sqrt(v) + self.e)
+        return self.state['b']
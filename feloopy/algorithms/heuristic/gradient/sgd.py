@@ -0,0 +1,20 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+from .base import GradientOptimizer
+
+class SGD(GradientOptimizer):
+    """
+    Gradient ascent with (Nesterov, if ``nv``) momentum on batched finite-difference gradients.
+    """
+
+    def __init__(self, f: int, d: list, lb, ub, s: int, t: int, lr: float, m: float, nv: bool = False, termination=None, **kwargs):
+
+        super().__init__(f, d, lb, ub, s, t, lr, termination=termination, **kwargs)
+        self.m = m
+        self.nv = nv
+
+    def step(self, g, x):
+
+        b = self.state['b'] = self.m*self.state.get('b', 0) + g
+        return g + self.m*b if self.nv else b
@@ -0,0 +1,93 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+
+def use_jit(jit=None):
+    """
+    Returns whether the numba kernels are used: ``jit=None`` (the default) uses them whenever numba is installed, ``jit=True`` requires numba,
+    and ``jit=False`` keeps the NumPy path (see ``benchmark.py`` to compare both on a given machine).
+    """
+
+    if jit is None:
+        return NUMBA_AVAILABLE
+    if jit and not NUMBA_AVAILABLE:
+        raise ImportError("The 'jit' option requires numba; install it with `pip install feloopy[extras]`.")
+    return bool(jit)
+
+
+@njit(cache=True)
+def seed_kernels(seed):
+    """
+    Seeds the random generator of the kernels (separate from the one of NumPy when compiled).
+    """
+
+    np.random.seed(seed)
+
+
+@njit(cache=True)
+def ga_vary(features, out, cr, mu):
+    """
+    Writes the children of the GA population to ``out``: each agent crosses over with a random mate with probability ``cr`` (blending the features of a random half),
+    then each feature flips (``1-x``) with probability ``mu`` and is clipped to [0, 1].
+    """
+
+    t, f = features.shape
+    for i in range(t):
+        j = np.random.randint(0, t) if np.random.random() < cr else i
+        for k in range(f):
+            x = features[i, k]
+            if np.random.random() < 0.5:
+                x = x + np.random.uniform(-1.0, 1.0)*(features[j, k] - x)
+            if np.random.random() < mu:
+                x = 1.0 - x
+            out[i, k] = min(max(x, 0.0), 1.0)
+
+
+@njit(cache=True)
+def de_vary(features, out, cr, mu):
+    """
+    Writes the trial agents of the DE population to ``out``: with probability ``cr``, an agent is replaced by ``a + mu*(b - c)`` for three random agents (clipped to [0, 1]).
+    """
+
+    t, f = features.shape
+    for i in range(t):
+        a = np.random.randint(0, t)
+        b = np.random.randint(0, t)
+        c = np.random.randint(0, t)
+        if np.random.random() < cr:
+            for k in range(f):
+                out[i, k] = min(max(features[a, k] + mu*(features[b, k] - features[c, k]), 0.0), 1.0)
+        else:
+            for k in range(f):
+                out[i, k] = features[i, k]
+
+
+@njit(cache=True)
+def gwo_vary(features, alpha, beta, delta, a_max):
+    """
+    Moves each wolf in place to the average of its moves towards the alpha, beta and delta wolves (clipped to [0, 1]).
+    """
+
+    t, f = features.shape
+    for i in range(t):
+        for k in range(f):
+            x = features[i, k]
+            position = 0.0
+            for leader in (alpha[k], beta[k], delta[k]):
+                a = a_max*(2.0*np.random.random() - 1.0)
+                c = 2.0*np.random.random()
+                position += (leader - a*abs(c*leader - x))/3.0
+            features[i, k] = min(max(position, 0.0), 1.0)
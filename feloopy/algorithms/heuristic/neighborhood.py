@@ -0,0 +1,151 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+from collections import deque
+
+import numpy as np
+
+MOVES = ['gaussian', 'bit_flip', 'swap', 'insert']
+
+
+def move_groups(variables_spread, variables_type):
+    """
+    Returns the features of each variable as a ``(kind, start, end)`` group, where kind is 'binary' (bvar), 'sequence' (svar) or 'continuous'.
+    """
+
+    kinds = {'bvar': 'binary', 'svar': 'sequence'}
+    return [(kinds.get(variables_type.get(name), 'continuous'), spread[0], spread[1]) for name, spread in variables_spread.items()]
+
+
+class Neighborhood:
+    """
+    Samples neighbors of (encoded) search agents for the local search algorithms.
+
+    Each neighbor changes the features of one variable (``groups``, chosen with a probability proportional to its size) with one of the enabled ``moves``:
+
+    - 'bit_flip' for binary variables (each bit flips with probability 1/length, at least one),
+    - 'swap' or 'insert' for sequence variables (two positions are swapped or one item is moved, keeping the random keys of the other positions),
+    - 'gaussian' for the others, or for any variable whose moves are not enabled (a normal step of ``sigma*scale``).
+    """
+
+    def __init__(self, f, groups=None, moves=None, sigma=0.1, resolution=1e-3):
+
+        moves = MOVES if moves is None else list(moves)
+        if any(move not in MOVES for move in moves):
+            raise ValueError(f"Invalid moves {moves}; expected a subset of {MOVES}.")
+
+        self.f = f
+        self.groups = [('continuous', 0, f)] if not groups else list(groups)
+        self.moves = moves
+        self.sigma = sigma
+        self.resolution = resolution
+        sizes = np.array([end - start for _, start, end in self.groups], dtype=float)
+        self.weights = sizes/sizes.sum()
+        self.sequence_moves = [move for move in ['swap', 'insert'] if move in moves]
+
+    def propose(self, X, scale=1.0):
+        """
+        Returns one neighbor of each row of X.
+        """
+
+        Y = np.array(X, dtype=float)
+        choice = np.random.choice(len(self.groups), size=len(Y), p=self.weights)
+
+        for group, (kind, start, end) in enumerate(self.groups):
+
+            rows = np.flatnonzero(choice == group)
+            width = end - start
+            if len(rows) == 0 or width == 0:
+                continue
+            block = Y[rows, start:end]
+
+            match kind:
+
+                case 'binary' if 'bit_flip' in self.moves:
+                    flip = np.random.rand(len(rows), width) < 1/width
+                    flip[np.arange(len(rows)), np.random.randint(0, width, size=len(rows))] = True
+                    block = np.where(flip, 1 - block, block)
+
+                case 'sequence' if width > 1 and self.sequence_moves:
+                    block = self.permute(block)
+
+                case _:
+                    block = np.clip(block + self.sigma*scale*np.random.randn(len(rows), width), 0, 1)
+
+            Y[rows, start:end] = block
+
+        return Y
+
+    def permute(self, block):
+        """
+        Swaps two positions of, or moves one item within, the sequence encoded by each row of random keys.
+        """
+
+        n, width = block.shape
+        rows = np.arange(n)[:, None]
+        order = np.argsort(block, axis=1)
+        keys = np.take_along_axis(block, order, axis=1)
+
+        i = np.random.randint(0, width, size=(n, 1))
+        j = (i + np.random.randint(1, width, size=(n, 1))) % width
+        p = np.arange(width)[None, :]
+
+        if self.sequence_moves == ['swap']:
+            swap = np.ones((n, 1), dtype=bool)
+        elif self.sequence_moves == ['insert']:
+            swap = np.zeros((n, 1), dtype=bool)
+        else:
+            swap = np.random.rand(n, 1) < 0.5
+
+        swapped = np.where(p == i, j, np.where(p == j, i, p))
+        inserted = np.where((i < j) & (p >= i) & (p < j), p + 1, np.where((i > j) & (p > j) & (p <= i), p - 1, p))
+        inserted = np.where(p == j, i, inserted)
+        order = order[rows, np.where(swap, swapped, inserted)]
+
+        permuted = np.empty_like(block)
+        permuted[rows, order] = keys
+        return permuted
+
+    def keys(self, X):
+        """
+        Returns a hashable key per row of X, equal for agents that decode to the same solution (up to ``resolution`` for continuous features).
+        """
+
+        X = np.atleast_2d(X)
+        coded = np.empty((len(X), self.f), dtype=np.int64)
+        for kind, start, end in self.groups:
+            match kind:
+                case 'binary':
+                    coded[:, start:end] = X[:, start:end] >= 0.5
+                case 'sequence':
+                    coded[:, start:end] = np.argsort(X[:, start:end], axis=1)
+                case _:
+                    coded[:, start:end] = np.round(X[:, start:end]/self.resolution)
+        return [row.tobytes() for row in coded]
+
+
+class TabuMemory:
+    """
+    Tabu list of the last ``size`` solution keys, with constant-time membership.
+    """
+
+    def __init__(self, size):
+
+        self.size = size
+        self.queue = deque()
+        self.members = set()
+
+    def __contains__(self, key):
+        return key in self.members
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, key):
+
+        if key in self.members or self.size <= 0:
+            return
+        self.queue.append(key)
+        self.members.add(key)
+        if len(self.queue) > self.size:
+            self.members.discard(self.queue.popleft())
@@ -0,0 +1,109 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import timeit
+import numpy as np
+
+TERMINATION_OPTIONS = ['max_evaluations', 'max_time', 'target_objective', 'patience', 'tolerance', 'min_diversity']
+
+
+class Termination:
+    """
+    Early termination of the native heuristic algorithms, checked once per epoch after the population is evaluated.
+
+    A run stops at the end of its epochs ('epoch') or as soon as one of the enabled criteria is met:
+
+    - 'max_evaluations': the number of evaluated agents reaches ``max_evaluations``,
+    - 'max_time': the run takes ``max_time`` seconds,
+    - 'target_objective': the best reward reaches ``target_objective``,
+    - 'patience': the best reward does not improve by more than ``tolerance`` (relative) for ``patience`` epochs,
+    - 'min_diversity': the mean standard deviation of the (encoded) features of the population falls below ``min_diversity``.
+
+    The criterion that stopped the run is kept in ``reason``.
+    """
+
+    def __init__(self, max_evaluations=None, max_time=None, target_objective=None, patience=None, tolerance=0.0, min_diversity=None):
+
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.target_objective = target_objective
+        self.patience = patience
+        self.tolerance = tolerance
+        self.min_diversity = min_diversity
+        self.start()
+
+    def start(self):
+
+        self.begin = timeit.default_timer()
+        self.epochs = 0
+        self.evaluations = 0
+        self.incumbent = None
+        self.stalled = 0
+        self.reason = 'epoch'
+
+    def stop(self, reason):
+
+        self.reason = reason
+        return True
+
+    def check(self, best, direction, population, evaluations):
+        """
+        Returns True if the run should stop after the current epoch.
+
+        Parameters
+        ----------
+        best : float
+            Best reward found so far.
+        direction : int
+            1 to maximize, -1 to minimize.
+        population : numpy.ndarray
+            Encoded features of the agents (one per row).
+        evaluations : int
+            Number of agents evaluated in the current epoch.
+        """
+
+        self.epochs += 1
+        self.evaluations += evaluations
+
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return self.stop('max_evaluations')
+
+        if self.max_time is not None and timeit.default_timer() - self.begin >= self.max_time:
+            return self.stop('max_time')
+
+        if self.target_objective is not None and direction*best >= direction*self.target_objective:
+            return self.stop('target_objective')
+
+        if self.patience is not None:
+            if self.incumbent is None or not np.isfinite(self.incumbent) or direction*(best - self.incumbent) > self.tolerance*abs(self.incumbent):
+                self.incumbent = best
+                self.stalled = 0
+            else:
+                self.stalled += 1
+                if self.stalled >= self.patience:
+                    return self.stop('patience')
+
+        if self.min_diversity is not None and len(population) > 1 and np.mean(np.std(population, axis=0)) < self.min_diversity:
+            return self.stop('min_diversity')
+
+        return False
+
+    def __repr__(self):
+        return f"Termination(reason='{self.reason}', epochs={self.epochs}, evaluations={self.evaluations})"
+
+
+def termination_from_options(solver_options):
+    """
+    Returns the termination of a native algorithm configured by the solver options, or ``None`` if none of the ``TERMINATION_OPTIONS`` is provided.
+    """
+
+    if not any(solver_options.get(option) is not None for option in TERMINATION_OPTIONS):
+        return None
+
+    return Termination(
+        max_evaluations=solver_options.get('max_evaluations'),
+        max_time=solver_options.get('max_time'),
+        target_objective=solver_options.get('target_objective'),
+        patience=solver_options.get('patience'),
+        tolerance=solver_options.get('tolerance', 0.0),
+        min_diversity=solver_options.get('min_diversity'))
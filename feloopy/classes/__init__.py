@@ -10,4 +10,7 @@ from .event_variable_collection import *
 from .normal_constraint import *
 from .special_constraint import *
 from .linearization import *
-from .constraint_programming import *
\ No newline at end of file
+from .constraint_programming import *
+from .variable_array import *
+from .constraint_registry import *
+from .model_state import *
@@ -0,0 +1,136 @@
+"""
+Constraint registry module
+
+This module defines an incremental registry for the labels of the constraints of a model.
+
+Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+See the file LICENSE file for licensing details.
+"""
+
+import re
+
+import numpy as np
+
+INDEX_SUFFIX = re.compile(r"[_\[(][\d_,\s\[\]()-]*$")
+
+
+def constraint_family(label):
+    """
+    Returns the family of a constraint label, i.e., the label without its trailing index suffix (e.g., ``c1_3`` -> ``c1``, ``c[2, 3]`` -> ``c``).
+
+    Only a suffix starting with ``_``, ``[`` or ``(`` is an index, so the digits of the name itself are kept.
+    """
+
+    if not isinstance(label, str):
+        return label
+    family = INDEX_SUFFIX.sub("", label)
+    return family if family else label
+
+
+class ConstraintRegistry:
+    """
+    Keeps the labels of the constraints of a model together with their counts and a hash index from label family to constraint positions.
+
+    The registry extends the very same list stored in ``features['constraint_labels']``, so that the solution generators can keep
+    reading that list, while the number of distinct labels and the positions of a family are available in O(1).
+    """
+
+    __slots__ = ('labels', 'label_counts', 'families', '_matches')
+
+    def __init__(self, labels=None):
+        """
+        Parameters
+        ----------
+        labels : list, optional
+            List to which the labels are appended (usually ``features['constraint_labels']``).
+        """
+
+        self.labels = [] if labels is None else labels
+        self.label_counts = {}
+        self.families = {}
+        self._matches = {}
+
+        if self.labels:
+            existing = list(self.labels)
+            self.labels.clear()
+            self.add(existing)
+
+    def add(self, labels, family=None):
+        """
+        Registers new labels and returns the number of distinct labels.
+
+        Parameters
+        ----------
+        labels : list
+            Labels of the constraints being added (``None`` for unlabelled constraints).
+        family : str, optional
+            Name passed to ``con`` that the labels were generated from, if any; it is registered as a family key of all of them.
+        """
+
+        position = len(self.labels)
+        label_counts = self.label_counts
+        families = self.families
+
+        for label in labels:
+            label_counts[label] = label_counts.get(label, 0) + 1
+            if label is not None:
+                derived = constraint_family(label)
+                families.setdefault(derived, []).append(position)
+                if label != derived:
+                    families.setdefault(label, []).append(position)
+                if family is not None and family != derived and family != label:
+                    families.setdefault(family, []).append(position)
+            position += 1
+
+        self.labels.extend(labels)
+        self._matches.clear()
+        return len(label_counts)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def distinct(self):
+        return len(self.label_counts)
+
+    def count(self, label):
+        return self.label_counts.get(label, 0)
+
+    def positions(self, family):
+        """
+        Returns the positions of the constraints of a family.
+
+        The family is matched exactly against the registered keys (the families derived from the labels, the labels themselves and the names
+        passed to ``con``) first; if it is unknown, the labels starting with it are scanned once and cached.
+        """
+
+        positions = self.families.get(family)
+        if positions is not None:
+            return positions
+
+        if family not in self._matches:
+            self._matches[family] = [position for position, label in enumerate(self.labels) if isinstance(label, str) and label.startswith(family)]
+        return self._matches[family]
+
+    def select(self, family):
+        """
+        Returns the labels of the constraints of a family.
+        """
+
+        labels = self.labels
+        return [labels[position] for position in self.positions(family)]
+
+    def collect(self, family, getter):
+        """
+        Evaluates ``getter`` (e.g., ``get_dual`` or ``get_slack``) for all constraints of a family and returns a numpy array.
+        """
+
+        labels = self.select(family)
+        values = [getter(label) for label in labels]
+        try:
+            return np.fromiter(values, dtype=float, count=len(values))
+        except (TypeError, ValueError):
+            return np.array(values)
+
+    def __repr__(self):
+        return f"ConstraintRegistry(constraints={len(self.labels)}, distinct={len(self.label_counts)})"
@@ -0,0 +1,100 @@
+"""
+Model state module
+
+This module defines the compact, slotted state of a model, which replaces the ``features`` dictionary while keeping its dictionary interface.
+
+Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+See the file LICENSE file for licensing details.
+"""
+
+from collections.abc import MutableMapping
+
+MODEL_STATE_FIELDS = (
+    'solution_method', 'model_name', 'interface_name', 'solver_name',
+    'no_scenarios', 'no_agents', 'scenario_ids', 'constraint_ids',
+    'constraints', 'constraint_labels', 'constraint_registry', 'objectives', 'objective_labels', 'directions',
+    'positive_variable_counter', 'integer_variable_counter', 'binary_variable_counter', 'free_variable_counter',
+    'event_variable_counter', 'sequential_variable_counter', 'dependent_variable_counter', 'total_variable_counter',
+    'objective_counter', 'constraint_counter', 'objective_being_optimized',
+    'solver_options', 'bulk_variables', 'variable_names',
+    'model_object', 'model_object_before_solve', 'variables', 'dimensions',
+    'agent_status', 'variable_spread', 'variable_type', 'variable_bound', 'variable_dim', 'pop_size', 'penalty_coefficient', 'vectorized',
+    'debug_mode', 'time_limit', 'thread_count', 'absolute_gap', 'relative_gap', 'log', 'write_model_file', 'save_solver_log',
+    'email_address', 'max_iterations', 'obj_operators',
+)
+
+_FIELDS = frozenset(MODEL_STATE_FIELDS)
+
+
+class ModelState(MutableMapping):
+    """
+    State of a model (name, interface, counters, objectives, constraints, agent and solver settings) kept in slots instead of a dictionary.
+
+    The generators read and write it as ``features['key']``, exactly like a dictionary; keys that are not among ``MODEL_STATE_FIELDS`` are kept
+    in an extra dictionary that is only allocated when such a key is set. The model reads its hottest fields as attributes (``features.agent_status``).
+    """
+
+    __slots__ = MODEL_STATE_FIELDS + ('_extra',)
+
+    def __init__(self, fields=None, **kwargs):
+        self._extra = None
+        if fields is not None:
+            self.update(fields)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, key):
+        if key in _FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELDS:
+            setattr(self, key, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in MODEL_STATE_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return f"ModelState({dict(self)!r})"
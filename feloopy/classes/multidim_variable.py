@@ -51,7 +51,8 @@ class MultidimVariableClass:
         if self.features['solution_method'] == 'exact':
             from ..generators import variable_generator
             self.features['variables'][("fvar", name)] = variable_generator.generate_variable(
-                self.features['interface_name'], self.model, 'fvar', name, bound, dim
+                self.features['interface_name'], self.model, 'fvar', name, bound, dim,
+                bulk=self.features['bulk_variables'], named=self.features['variable_names']
             )
             self.features['dimensions'][name] = dim
             return self.features['variables'][("fvar", name)]
@@ -95,7 +96,8 @@ class MultidimVariableClass:
         if self.features['solution_method'] == 'exact':
             from ..generators import variable_generator
             self.features['variables'][("pvar", name)] = variable_generator.generate_variable(
-                self.features['interface_name'], self.model, 'pvar', name, bound, dim
+                self.features['interface_name'], self.model, 'pvar', name, bound, dim,
+                bulk=self.features['bulk_variables'], named=self.features['variable_names']
             )
             self.features['dimensions'][name] = dim
 
@@ -158,7 +160,8 @@ class MultidimVariableClass:
         if self.features['solution_method'] == 'exact':
             from ..generators import variable_generator
             self.features['variables'][("ivar", name)] = variable_generator.generate_variable(
-                self.features['interface_name'], self.model, 'ivar', name, bound, dim
+                self.features['interface_name'], self.model, 'ivar', name, bound, dim,
+                bulk=self.features['bulk_variables'], named=self.features['variable_names']
             )
             self.features['dimensions'][name] = dim
 
@@ -220,7 +223,8 @@ class MultidimVariableClass:
         if self.features['solution_method'] == 'exact':
             from ..generators import variable_generator
             self.features['variables'][("bvar", name)] = variable_generator.generate_variable(
-                self.features['interface_name'], self.model, 'bvar', name, bound, dim
+                self.features['interface_name'], self.model, 'bvar', name, bound, dim,
+                bulk=self.features['bulk_variables'], named=self.features['variable_names']
             )
             self.features['dimensions'][name] = dim
 
@@ -354,3 +358,11 @@ class MultidimVariableClass:
                         return 0
                     else:
                         return np.zeros([len(dims) for dims in dim])
+
+    binary_variable = binary = bool = add_bool = add_binary = add_binary_variable = boolean_variable = add_boolean_variable = bvar
+    positive_variable = positive = add_positive = add_positive_variable = pvar
+    integer_variable = integer = add_integer = add_integer_variable = ivar
+    free_variable = free = float = add_free = add_float = real = add_real = add_free_variable = fvar
+    sequential_variable = sequence = sequential = add_sequence = add_sequential = add_sequential_variable = permutation_variable = add_permutation_variable = svar
+    random_variable = add_random_variable = rvar
+    dependent_variable = array = add_array = add_dependent_variable = dvar
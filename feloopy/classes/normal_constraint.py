@@ -7,6 +7,7 @@ See the file LICENSE file for licensing details.
 
 from typing import List, Optional, Any
 from numpy import reshape, shape
+from ..helpers.profiler import profiled
 
 def check_constraint_type(constraint):
 
@@ -90,6 +91,7 @@ class NormalConstraintClass:
     def enforce_neq(self, lhs, rhs, epsilon=1e-6, name=None):
         self.con([lhs, '!=', rhs, epsilon], name)
                              
+    @profiled("constraint")
     def con(self, expression, name=None):
         """
         Constraint Definition
@@ -116,8 +118,7 @@ class NormalConstraintClass:
             case 'exact':
 
                 if 'insideopt' in self.features['interface_name'] or 'pyoptinterface' in self.features['interface_name']:
-                    self.features['constraint_labels'].append(name)
-                    self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                    self.features['constraint_counter'][0] = self.features['constraint_registry'].add([name])
                     self.features['constraints'].append(expression)
                     self.features['constraint_counter'][1] = len(self.features['constraints'])
 
@@ -129,9 +130,8 @@ class NormalConstraintClass:
                             for element in expression:
                                 const = add_special_constraint(element)
                                 const_list+=const
-                            if isinstance(name, list): self.features['constraint_labels'] += name
-                            else: self.features['constraint_labels'] += [str(name)+str(i) if name else None for i in range(len(expression))]
-                            self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                            labels = name if isinstance(name, list) else [str(name)+str(i) if name else None for i in range(len(expression))]
+                            self.features['constraint_counter'][0] = self.features['constraint_registry'].add(labels, None if isinstance(name, list) else name)
                             self.features['constraints'] += const_list
                             self.features['constraint_counter'][1] = len(self.features['constraints'])
                     
@@ -139,17 +139,15 @@ class NormalConstraintClass:
                 
                             if len(expression)==3: name = [name]
                             const = add_special_constraint(expression)
-                            if isinstance(name, list): self.features['constraint_labels'] += name
-                            else: self.features['constraint_labels'] += [str(name)+str(i) if name else None for i in range(len(const))]
-                            self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                            labels = name if isinstance(name, list) else [str(name)+str(i) if name else None for i in range(len(const))]
+                            self.features['constraint_counter'][0] = self.features['constraint_registry'].add(labels, None if isinstance(name, list) else name)
                             self.features['constraints'] += const
                             self.features['constraint_counter'][1] = len(self.features['constraints'])
 
                         case 'list without sense':
 
-                            if isinstance(name, list): self.features['constraint_labels'] += name
-                            else: self.features['constraint_labels'] += [str(name)+str(i) if name else None for i in range(len(expression))]
-                            self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                            labels = name if isinstance(name, list) else [str(name)+str(i) if name else None for i in range(len(expression))]
+                            self.features['constraint_counter'][0] = self.features['constraint_registry'].add(labels, None if isinstance(name, list) else name)
                             self.features['constraints'] += list(expression)
                             self.features['constraint_counter'][1] = len(self.features['constraints'])
 
@@ -158,8 +156,7 @@ class NormalConstraintClass:
                             for key, value in expression.items():
         
                                 const = add_special_constraint(value)
-                                self.features['constraint_labels'].append(key)
-                                self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                                self.features['constraint_counter'][0] = self.features['constraint_registry'].add([key])
                                 self.features['constraints']+=const
                                 self.features['constraint_counter'][1] = len(self.features['constraints'])
 
@@ -167,30 +164,26 @@ class NormalConstraintClass:
                     
                             for key, value in expression.items():
                                 const = add_special_constraint(value)
-                                self.features['constraint_labels'].append(key)
-                                self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                                self.features['constraint_counter'][0] = self.features['constraint_registry'].add([key])
                                 self.features['constraints']+=const
                                 self.features['constraint_counter'][1] = len(self.features['constraints'])
 
                         case 'dict without sense':
 
-                            self.features['constraint_labels']+=list(expression.keys())
-                            self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                            self.features['constraint_counter'][0] = self.features['constraint_registry'].add(list(expression.keys()))
                             self.features['constraints']+=list(expression.values())
                             self.features['constraint_counter'][1] = len(self.features['constraints'])
                         
                         case 'classic':
                         
-                            self.features['constraint_labels'].append(name)
-                            self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                            self.features['constraint_counter'][0] = self.features['constraint_registry'].add([name])
                             self.features['constraints'].append(expression)
                             self.features['constraint_counter'][1] = len(self.features['constraints'])
 
                         case 'evaluation string':
                             
                             if self.features['interface_name']=="jump":
-                                self.features['constraint_labels'].append(name)
-                                self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                                self.features['constraint_counter'][0] = self.features['constraint_registry'].add([name])
                                 self.features['constraints'].append(expression)
                                 self.features['constraint_counter'][1] = len(self.features['constraints'])
 
@@ -200,12 +193,13 @@ class NormalConstraintClass:
             case 'heuristic':
 
                 if self.features['agent_status'] == 'idle':
-                    self.features['constraint_labels'].append(name)
-                    self.features['constraint_counter'][0] = len(set(self.features['constraint_labels']))
+                    self.features['constraint_counter'][0] = self.features['constraint_registry'].add([name])
                     self.features['constraints'].append(expression)
                     self.features['constraint_counter'][1] = len(self.features['constraints'])
                 else:
                     if self.features['vectorized']:
                         self.features['constraints'].append(reshape(expression, [shape(self.agent)[0], 1]))
                     else:
-                        self.features['constraints'].append(expression)
\ No newline at end of file
+                        self.features['constraints'].append(expression)
+
+    constraint = equation = add_constraint = add_equation = st = subject_to = cb = computed_by = penalize = pen = eq = con
@@ -215,3 +215,9 @@ class TensorVariableClass:
             )
 
         raise ValueError(f"Error: TensorVariable '{name}' cannot be created.")
+
+    positive_tensor_variable = positive_tensor = add_positive_tensor = add_positive_tensor_variable = ptvar
+    binary_tensor_variable = binary_tensor = add_binary_tensor = add_binary_tensor_variable = add_boolean_tensor_variable = boolean_tensor_variable = btvar
+    integer_tensor_variable = integer_tensor = add_integer_tensor = add_integer_tensor_variable = itvar
+    free_tensor_variable = free_tensor = float_tensor = add_free_tensor = add_float_tensor = add_free_tensor_variable = ftvar
+    random_tensor_variable = add_random_tensor_variable = rtvar
@@ -0,0 +1,156 @@
+"""
+Variable array module
+
+This module defines an index-aware, array-backed container for variables that are created in bulk.
+
+Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+See the file LICENSE file for licensing details.
+"""
+
+import itertools as it
+import numpy as np
+
+
+class VariableArray:
+    """
+    Index-aware container that stores the variables of one multi-dimensional variable in a numpy object array.
+
+    It can be indexed exactly like the dictionaries returned by the regular generators (e.g., ``x[i, j]``),
+    but it keeps the variables in a contiguous array, so that whole blocks can be created, sliced and
+    extracted without per-key Python overhead.
+    """
+
+    __slots__ = ('name', 'dims', 'array', 'first_column', '_starts', '_steps', '_lookup')
+
+    def __init__(self, name, dims, array, first_column=None):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        dims : list or set
+            Fixed dimensions of the variable (a list of ranges or a set of keys).
+        array : np.ndarray
+            Object array holding the interface-specific variables (flat for set-based dimensions).
+        first_column : int, optional
+            Column index of the first element in the solver model, if the interface exposes it.
+        """
+
+        self.name = name
+        self.dims = dims
+        self.first_column = first_column
+
+        if isinstance(dims, set):
+            keys = list(dims)
+            self.array = np.asarray(array, dtype=object).reshape(len(keys))
+            self._lookup = {key: position for position, key in enumerate(keys)}
+            self._starts = self._steps = None
+        else:
+            self.array = np.asarray(array, dtype=object).reshape(tuple(len(d) for d in dims))
+            self._lookup = None
+            self._starts = tuple(d.start if isinstance(d, range) else 0 for d in dims)
+            self._steps = tuple(d.step if isinstance(d, range) else 1 for d in dims)
+
+    def _position(self, key):
+
+        if self._lookup is not None:
+            return self._lookup[key]
+
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if all(start == 0 and step == 1 for start, step in zip(self._starts, self._steps)):
+            return key
+
+        return tuple((k - start) // step for k, start, step in zip(key, self._starts, self._steps))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) or (isinstance(key, tuple) and any(isinstance(k, slice) for k in key)):
+            return self.array[key]
+        return self.array[self._position(key)]
+
+    def __contains__(self, key):
+        try:
+            self._position(key)
+            return True
+        except (KeyError, IndexError, TypeError):
+            return False
+
+    def __len__(self):
+        return self.array.size
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    @property
+    def shape(self):
+        return self.array.shape
+
+    def keys(self):
+        if self._lookup is not None:
+            return self._lookup.keys()
+        return iterate_variable_keys(self.dims)
+
+    def values(self):
+        return self.array.ravel()
+
+    def items(self):
+        return zip(self.keys(), self.values())
+
+    def column(self, key):
+        """
+        Returns the solver column index of an element, if the interface exposes contiguous columns.
+        """
+
+        if self.first_column is None:
+            return None
+        position = self._position(key)
+        if isinstance(position, tuple):
+            position = int(np.ravel_multi_index(position, self.array.shape))
+        return self.first_column + position
+
+    def columns(self):
+        """
+        Returns the solver column indices of all elements with the shape of the array.
+        """
+
+        if self.first_column is None:
+            return None
+        return self.first_column + np.arange(self.array.size).reshape(self.array.shape)
+
+    def __repr__(self):
+        return f"VariableArray(name={self.name!r}, shape={self.shape})"
+
+
+def allocate_variable_array(variable_dim):
+    """
+    Returns the number of elements and the normalized dimensions of a bulk variable.
+    """
+
+    if isinstance(variable_dim, set):
+        return len(variable_dim), variable_dim
+    if len(variable_dim) == 1 and isinstance(variable_dim[0], set):
+        return len(variable_dim[0]), variable_dim[0]
+    return int(np.prod([len(d) for d in variable_dim])), variable_dim
+
+
+def iterate_variable_keys(dims):
+    """
+    Iterates over the keys of a bulk variable in the same (row-major) order as its array.
+    """
+
+    if isinstance(dims, set):
+        return iter(dims)
+    if len(dims) == 1:
+        return iter(dims[0])
+    return it.product(*dims)
+
+
+def to_object_array(elements, size):
+    """
+    Packs interface-specific variables into a flat numpy object array without letting numpy unpack them.
+    """
+
+    array = np.empty(size, dtype=object)
+    array[:] = list(elements)
+    return array
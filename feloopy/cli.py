@@ -10,6 +10,7 @@ except:
     pass
 
 from .clitools import *
+from .helpers.lazy_import import IMPORT_TIME_BUDGET
 
 def cli_detect():
     detect_package_manager(verbose=True)
@@ -58,6 +59,12 @@ def main():
     uninstall_parser = subparsers.add_parser("uninstall", help="Uninstall Python packages")
     uninstall_parser.add_argument("packages", nargs="*", help="Packages to uninstall")
 
+    importtime_parser = subparsers.add_parser("importtime", help="Check the import time of FelooPy against a budget")
+    importtime_parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET, help="Maximum import time in seconds")
+    importtime_parser.add_argument("--repeat", type=int, default=3, help="Number of measurements (the best one is kept)")
+    importtime_parser.add_argument("--module", default="feloopy", help="Module to import")
+    importtime_parser.set_defaults(func=check_import_budget)
+
     args = parser.parse_args()
 
     if args.version:
@@ -266,6 +266,12 @@ def zip_project(args=None):
 
     print(f"Project (excluding 'backups' directory) zipped and saved at: {zip_file_path}")
 
+def check_import_budget(args):
+    from ..helpers.lazy_import import check_import_time
+
+    if not check_import_time(module=args.module, budget=args.budget, repeat=args.repeat):
+        sys.exit(1)
+
 def debug_print(message):
     print(f"[DEBUG] {message}")
 
@@ -12,9 +12,8 @@ import warnings
 import concurrent.futures
 
 from typing import Literal, Optional
-from joblib import Parallel, delayed
 from typing import Callable, Any, Tuple, Union
-from contextlib import suppress,redirect_stdout
+from contextlib import suppress,redirect_stdout,nullcontext
 import timeit
 import numpy as np
 
@@ -726,6 +725,10 @@ SPECIAL_ALGORITHMS = [
     ['opa_method', 'pydecision'],
 ]
 
+GRADIENT_SOLVERS = ['adam', 'nadam', 'adamax', 'adadelta', 'adamw', 'rmsprop', 'adagrad', 'sgd', 'nesterov']
+
+BULK_ERRORS = (AttributeError, LookupError, TypeError, ValueError)
+
 class model(
     TensorVariableClass,
     TensorVariableCollectionClass,
@@ -750,6 +753,8 @@ class model(
         scenario_ids: Optional[list] = None,
         constraint_ids: Optional[list] = None,
         validate: bool = True,
+        bulk_variables: bool = False,
+        variable_names: Optional[bool] = None,
         ):
         
         """
@@ -773,6 +778,10 @@ class model(
             Indices of scenarios in uncertainty handling.
         constraint_ids
             Indices of constraints to be considered.
+        bulk_variables
+            Whether multi-dimensional variables should be created in bulk as array-backed containers (supported by pulp, highs, ortools, cplex and pyoptinterface).
+        variable_names
+            Whether to format a name for every element of a multi-dimensional variable. Defaults to False for bulk variables and True otherwise.
         """
         
         if validate: 
@@ -824,96 +833,72 @@ class model(
         else:
             self.method_was = None
         
-        self.features = {
-            'solution_method': self.method,
-            'model_name': self.name,
-            'interface_name': self.interface,
-            'no_scenarios': self.no_scenarios,
-            'no_agents': self.no_agents,
-            'scenario_ids': self.scenario_ids,
-            'constraint_ids': self.constraint_ids,
-            'solver_name': None,
-            'constraints': [],
-            'constraint_labels': [],
-            'objectives': [],
-            'objective_labels': [],
-            'directions': [],
-            'positive_variable_counter': [0, 0],
-            'integer_variable_counter': [0, 0],
-            'binary_variable_counter': [0, 0],
-            'free_variable_counter': [0, 0],
-            'event_variable_counter': [0, 0],
-            'sequential_variable_counter': [0,0],
-            'dependent_variable_counter': [0,0],
-            'total_variable_counter': [0, 0],
-            'objective_counter': [0, 0],
-            'constraint_counter': [0, 0],
-            'objective_being_optimized': 0,
-            'solver_options': {},
-        }
+        features = self.features = ModelState()
+        features.solution_method = self.method
+        features.model_name = self.name
+        features.interface_name = self.interface
+        features.no_scenarios = self.no_scenarios
+        features.no_agents = self.no_agents
+        features.scenario_ids = self.scenario_ids
+        features.constraint_ids = self.constraint_ids
+        features.solver_name = None
+        features.constraints = []
+        features.constraint_labels = []
+        features.objectives = []
+        features.objective_labels = []
+        features.directions = []
+        features.positive_variable_counter = [0, 0]
+        features.integer_variable_counter = [0, 0]
+        features.binary_variable_counter = [0, 0]
+        features.free_variable_counter = [0, 0]
+        features.event_variable_counter = [0, 0]
+        features.sequential_variable_counter = [0, 0]
+        features.dependent_variable_counter = [0, 0]
+        features.total_variable_counter = [0, 0]
+        features.objective_counter = [0, 0]
+        features.constraint_counter = [0, 0]
+        features.objective_being_optimized = 0
+        features.solver_options = {}
+        features.bulk_variables = bulk_variables
+        features.variable_names = (not bulk_variables) if variable_names is None else variable_names
+        features.constraint_registry = ConstraintRegistry(features.constraint_labels)
 
         if self.method == 'exact':
 
             from .generators import model_generator
-            self.model = model_generator.generate_model(self.features)
-            
-            from collections import defaultdict
+            self.model = model_generator.generate_model(features)
 
-            self.features.update(
-                {
-                'model_object': self.model,
-                'variables': {},
-                'dimensions': {},
-                }
-            )
+            features.model_object = self.model
+            features.variables = {}
+            features.dimensions = {}
             
             self.link_to_interface = self.lti = self._ = self.model
                     
         if self.method == 'heuristic':
-            
-            self.features.update(
-                {
-                'agent_status': self.agent[0],
-                'variable_spread': self.agent[2] if self.agent[0] != 'idle' else dict(),
-                'variable_type': dict() if self.agent[0] == 'idle' else None,
-                'variable_bound': dict() if self.agent[0] == 'idle' else None,
-                'variable_dim': dict() if self.agent[0] == 'idle' else None,
-                'pop_size': 1 if self.agent[0] == 'idle' else len(self.agent[1]),
-                'penalty_coefficient': 0 if self.agent[0] == 'idle' else self.agent[3],
-                'vectorized': self.interface in ['feloopy', 'pymoo'],
-                }
-            )
-            if self.agent[0] != 'idle':
+
+            idle = self.agent[0] == 'idle'
+            features.agent_status = self.agent[0]
+            features.variable_spread = dict() if idle else self.agent[2]
+            features.variable_type = dict() if idle else None
+            features.variable_bound = dict() if idle else None
+            features.variable_dim = dict() if idle else None
+            features.pop_size = 1 if idle else len(self.agent[1])
+            features.penalty_coefficient = 0 if idle else self.agent[3]
+            features.vectorized = self.interface in ['feloopy', 'pymoo'] or (not idle and np.ndim(self.agent[1]) == 2)
+            if not idle:
                 self.agent = self.agent[1].copy()
                 
 
         self.grad_counter=0
 
-        self.binary_variable = self.binary = self.bool = self.add_bool = self.add_binary = self.add_binary_variable = self.boolean_variable = self.add_boolean_variable = self.bvar
-        self.positive_variable = self.positive = self.add_positive = self.add_positive_variable = self.pvar
-        self.integer_variable = self.integer = self.add_integer = self.add_integer_variable = self.ivar
-        self.free_variable = self.free = self.float = self.add_free = self.add_float = self.real = self.add_real = self.add_free_variable = self.fvar
-        self.sequential_variable = self.sequence = self.sequential = self.add_sequence = self.add_sequential = self.add_sequential_variable = self.permutation_variable = self.add_permutation_variable = self.svar
-        self.positive_tensor_variable = self.positive_tensor = self.add_positive_tensor = self.add_positive_tensor_variable = self.ptvar
-        self.binary_tensor_variable = self.binary_tensor = self.add_binary_tensor = self.add_binary_tensor_variable = self.add_boolean_tensor_variable = self.boolean_tensor_variable = self.btvar
-        self.integer_tensor_variable = self.integer_tensor = self.add_integer_tensor = self.add_integer_tensor_variable = self.itvar
-        self.free_tensor_variable = self.free_tensor = self.float_tensor = self.add_free_tensor = self.add_float_tensor = self.add_free_tensor_variable = self.ftvar
-        self.random_variable = self.add_random_variable = self.rvar
-        self.random_tensor_variable = self.add_random_tensor_variable = self.rtvar
-        self.dependent_variable = self.array = self.add_array = self.add_dependent_variable = self.dvar
-        self.objective = self.reward = self.hypothesis = self.fitness = self.goal = self.add_objective = self.loss = self.gain = self.obj
-        self.constraint = self.equation = self.add_constraint = self.add_equation = self.st = self.subject_to = self.cb = self.computed_by = self.penalize = self.pen = self.eq = self.con
-        self.solve = self.implement = self.run = self.optimize = self.sol
-        self.get_obj = self.get_objective
-        self.get_stat = self.get_status
-        self.get_tensor = self.get_numpy_var
-        self.get_var = self.value = self.get = self.get_variable
-        self.PI = self.pi = np.pi
+    PI = pi = np.pi
+    penalty_aggregator = None
 
     def __getitem__(self, agent):
-        agent_status = self.features['agent_status']
-        vectorized = self.features['vectorized']
-        interface_name = self.features['interface_name']
+        features = self.features
+        agent_status = features.agent_status
+        vectorized = features.vectorized
+        interface_name = features.interface_name
         if agent_status == 'idle':
             return self
         elif agent_status == 'feasibility_check':
@@ -921,6 +906,34 @@ class model(
         else:
             return self._get_result(vectorized, interface_name)
 
+    def load_agent(self, agent):
+        """
+        Reuses this heuristic model for another search agent.
+
+        Only the per-evaluation state (agent, objectives, constraints and directions) is reset, so the
+        validation and model state built in the constructor are kept.
+
+        Parameters
+        ----------
+        agent : list
+            Agent properties as passed by the implementor (status, search agent, variable spread, penalty coefficient).
+        """
+
+        self.features['agent_status'] = agent[0]
+        self.features['vectorized'] = self.interface in ['feloopy', 'pymoo'] or np.ndim(agent[1]) == 2
+        self.features['variable_spread'] = agent[2]
+        self.features['pop_size'] = len(agent[1])
+        self.features['penalty_coefficient'] = agent[3]
+        self.features['directions'] = []
+        self.features['objectives'] = []
+        self.features['objective_labels'] = []
+        self.features['objective_counter'] = [0, 0]
+        self.features['constraints'] = []
+        self.agent = agent[1].copy()
+        self.grad_counter = 0
+
+        return self
+
     def _feasibility_check(self) -> str:
         
         """
@@ -1037,6 +1050,7 @@ class model(
         else:
             pass
 
+    @profiled("objective")
     def obj(self, expression=0, direction=None, label=None):
             
             """
@@ -1077,8 +1091,8 @@ class model(
             elif self.features['solution_method'] == 'heuristic' and self.features['agent_status'] != 'idle':
 
                 self.features['directions'].append(direction)
-                if self.features['interface_name'] == "mealpy":
-                    self.features['objectives'].append(float(expression))
+                if self.features['interface_name'] == "mealpy" and not self.features['vectorized']:
+                    self.features['objectives'].append(record(float, expression))
                 else:
                     self.features['objectives'].append(expression)
                 self.features['objective_counter'][0] += 1
@@ -1201,159 +1215,138 @@ class model(
                         self.current_std = np.inf
 
                 else:
-                    
-                    if self.features['penalty_coefficient'] == 0 and len(self.features['constraints']) != 0:
-                        raise ValueError(f"'penalty_coefficient' must be greater than zero for constrained environments.")
-                    
-                    if self.features['vectorized']:    
-                        if self.features['interface_name']=='feloopy':
-                            self.penalty = np.zeros(np.shape(self.agent)[0])
-                            if self.features['penalty_coefficient'] != 0 and len(self.features['constraints']) == 1:
-                                self.features['constraints'][0] = np.reshape(
-                                    self.features['constraints'][0], [np.shape(self.agent)[0], 1])
-                                self.features['constraints'].append(
-                                    np.zeros(shape=(np.shape(self.agent)[0], 1)))
-                                self.penalty = np.amax(np.concatenate(
-                                    self.features['constraints'], axis=1), axis=1)
-                                self.agent[np.where(self.penalty == 0), -2] = 1
-                                self.agent[np.where(self.penalty > 0), -2] = -1
-
-                            if self.features['penalty_coefficient'] != 0 and len(self.features['constraints']) > 1:
-                                self.features['constraints'].append(
-                                    np.zeros(shape=(np.shape(self.agent)[0], 1)))
-                                self.penalty = np.amax(np.concatenate(
-                                    self.features['constraints'], axis=1), axis=1)
-                                self.agent[np.where(self.penalty == 0), -2] = 1
-                                self.agent[np.where(self.penalty > 0), -2] = -1
-                            else:
-                                self.agent[:, -2] = 2
-
-                            if type(obj_id) != str:
-                                term = np.reshape(self.features['objectives'][obj_id], [self.agent.shape[0],])
-                                if directions[obj_id] == 'max':
-                                    self.agent[:, -1] = term - np.reshape(
-                                        self.features['penalty_coefficient'] * (self.penalty)**2, [self.agent.shape[0],])
-                                if directions[obj_id] == 'min':
-                                    self.agent[:, -1] = term + np.reshape(
-                                        self.features['penalty_coefficient'] * (self.penalty)**2, [self.agent.shape[0],])
-
-                                if self.features["agent_status"] !=  'feasibility_check': 
-                                    self.current_min = np.min(self.agent[:, -1])
-                                    self.current_max = np.max(self.agent[:, -1])
-                                    self.current_ave = np.mean(self.agent[:, -1])
-                                    self.current_std = np.std(self.agent[:, -1])
 
-                            else:
-                                self.agent[:, -1] = 0
-                                total_obj = self.features['objective_counter'][0]
-                                self.features['objectives'] = np.array(self.features['objectives']).T
-                                for i in range(self.features['objective_counter'][0]):
-                                    if directions[i] == 'max':
-                                        self.agent[:, -2-total_obj+i] = self.features['objectives'][:,i] - self.features['penalty_coefficient'] * (self.penalty)**2
-                                    if directions[i] == 'min':
-                                        self.agent[:, -2-total_obj+i] = self.features['objectives'][:,i] + self.features['penalty_coefficient'] * (self.penalty)**2
-                                
-                                if self.features["agent_status"] !=  'feasibility_check': 
-                                    self.current_min = np.min(self.agent[:, -2-total_obj:-2], axis = 0)
-                                    self.current_max = np.max(self.agent[:, -2-total_obj:-2], axis = 0)
-                                    self.current_ave = np.mean(self.agent[:, -2-total_obj:-2], axis =0)
-                                    self.current_std = np.std(self.agent[:, -2-total_obj:-2], axis = 0)
+                    self.heuristic_reward(directions, obj_id)
 
-                        else:
+    def heuristic_reward(self, directions, obj_id=0):
+        """
+        Computes the penalized reward of the active search agents from the collected objectives and constraints (as ``sol`` does for heuristic models).
+        """
 
-                            self.penalty = np.zeros(np.shape(self.agent)[0])
+        if self.features['penalty_coefficient'] == 0 and len(self.features['constraints']) != 0:
+            raise ValueError(f"'penalty_coefficient' must be greater than zero for constrained environments.")
 
-                            if self.features['penalty_coefficient'] != 0 and len(self.features['constraints']) == 1:
+        aggregator = self.penalty_aggregator
+        if aggregator is None:
+            aggregator = self.penalty_aggregator = PenaltyAggregator()
 
-                                self.features['constraints'][0] = np.reshape(self.features['constraints'][0], [np.shape(self.agent)[0], 1])
-                                self.features['constraints'].append(np.zeros(shape=(np.shape(self.agent)[0], 1)))
-                                self.penalty = np.amax(np.concatenate(self.features['constraints'], axis=1), axis=1)
+        if self.features['vectorized']:    
+            pop_size = np.shape(self.agent)[0]
+            self.penalty, infeasible = aggregator.aggregate(self.features['constraints'], pop_size)
+            penalty = self.features['penalty_coefficient'] * self.penalty
+            if self.features['interface_name']=='feloopy':
+                if len(self.features['constraints']) != 0:
+                    self.agent[:, -2] = np.where(infeasible, -1, 1)
+                else:
+                    self.agent[:, -2] = 2
 
-                            if self.features['penalty_coefficient'] != 0 and len(self.features['constraints']) > 1:
+                if type(obj_id) != str:
+                    term = np.reshape(self.features['objectives'][obj_id], [pop_size,])
+                    if directions[obj_id] == 'max':
+                        self.agent[:, -1] = term - penalty
+                    if directions[obj_id] == 'min':
+                        self.agent[:, -1] = term + penalty
 
-                                self.features['constraints'].append(np.zeros(shape=(np.shape(self.agent)[0], 1)))
-                                self.penalty = np.amax(np.concatenate(self.features['constraints'], axis=1), axis=1)
+                    if self.features["agent_status"] !=  'feasibility_check': 
+                        self.current_min = np.min(self.agent[:, -1])
+                        self.current_max = np.max(self.agent[:, -1])
+                        self.current_ave = np.mean(self.agent[:, -1])
+                        self.current_std = np.std(self.agent[:, -1])
 
-                            if type(obj_id) != str:
+                else:
+                    self.agent[:, -1] = 0
+                    total_obj = self.features['objective_counter'][0]
+                    self.features['objectives'] = np.array(self.features['objectives']).T
+                    for i in range(self.features['objective_counter'][0]):
+                        if directions[i] == 'max':
+                            self.agent[:, -2-total_obj+i] = self.features['objectives'][:,i] - penalty
+                        if directions[i] == 'min':
+                            self.agent[:, -2-total_obj+i] = self.features['objectives'][:,i] + penalty
+
+                    if self.features["agent_status"] !=  'feasibility_check': 
+                        self.current_min = np.min(self.agent[:, -2-total_obj:-2], axis = 0)
+                        self.current_max = np.max(self.agent[:, -2-total_obj:-2], axis = 0)
+                        self.current_ave = np.mean(self.agent[:, -2-total_obj:-2], axis =0)
+                        self.current_std = np.std(self.agent[:, -2-total_obj:-2], axis = 0)
 
-                                if directions[obj_id] == 'max':
-                                    self.sing_result = np.reshape(self.features['objectives'][obj_id], [self.agent.shape[0],]) - np.reshape(self.features['penalty_coefficient'] * (self.penalty)**2, [self.agent.shape[0],])
+            else:
 
-                                if directions[obj_id] == 'min':
-                                    self.sing_result = np.reshape(self.features['objectives'][obj_id], [self.agent.shape[0],]) + np.reshape(self.features['penalty_coefficient'] * (self.penalty)**2, [self.agent.shape[0],])
-                                
-                                if self.features["agent_status"] !=  'feasibility_check': 
-                                    self.current_min = np.min(self.sing_result)
-                                    self.current_max = np.max(self.sing_result)
-                                
-                            else:
+                if type(obj_id) != str:
 
-                                total_obj = self.features['objective_counter'][0]
-                                self.sing_result = []
-                            
-                                n_objs = int(self.features['objective_counter'][0])
-
-                                for i in range(n_objs):
-                                    obj = np.array(self.features['objectives'][i])
-                                    pen = np.array(self.features['penalty_coefficient']) * (np.array(self.penalty) ** 2)
-                                    if obj.ndim == 2 and obj.shape[1] == 1 and pen.ndim == 1:
-                                        pen = pen[:, np.newaxis]
-                                    elif obj.ndim == 1 and pen.ndim == 2 and pen.shape[1] == 1:
-                                        pen = pen.ravel()
-                                    if directions[i] == 'max':
-                                        result_i = obj - pen
-                                    else:
-                                        result_i = obj + pen
-                                    self.sing_result.append(result_i)
-                                if self.features["agent_status"] !=  'feasibility_check': 
-                                    self.current_min = np.min(np.array(self.sing_result), axis = 0)
-                                    self.current_max = np.max(np.array(self.sing_result), axis = 0)
+                    if directions[obj_id] == 'max':
+                        self.sing_result = np.reshape(self.features['objectives'][obj_id], [pop_size,]) - penalty
 
-                    else:
+                    if directions[obj_id] == 'min':
+                        self.sing_result = np.reshape(self.features['objectives'][obj_id], [pop_size,]) + penalty
 
-                        self.penalty = 0
-                        
-                        if len(self.features['constraints']) >= 1:
-                            
-                            self.penalty = np.amax(np.array([0]+self.features['constraints'], dtype=object))
+                    if self.features["agent_status"] !=  'feasibility_check': 
+                        self.current_min = np.min(self.sing_result)
+                        self.current_max = np.max(self.sing_result)
 
-                        if type(obj_id) != str:
+                else:
 
-                            if directions[obj_id] == 'max':
-                                self.response = self.features['objectives'][obj_id] - \
-                                    self.features['penalty_coefficient'] * \
-                                    (self.penalty-0)**2
+                    total_obj = self.features['objective_counter'][0]
+                    self.sing_result = []
 
-                            if directions[obj_id] == 'min':
-                                self.response = self.features['objectives'][obj_id] + \
-                                    self.features['penalty_coefficient'] * \
-                                    (self.penalty-0)**2
-                            if self.features["agent_status"] !=  'feasibility_check': 
-                                self.current_min = np.min(self.response)
-                                self.current_max = np.max(self.response)
+                    n_objs = int(self.features['objective_counter'][0])
 
+                    for i in range(n_objs):
+                        obj = np.array(self.features['objectives'][i])
+                        pen = penalty
+                        if obj.ndim == 2 and obj.shape[1] == 1 and pen.ndim == 1:
+                            pen = pen[:, np.newaxis]
+                        elif obj.ndim == 1 and pen.ndim == 2 and pen.shape[1] == 1:
+                            pen = pen.ravel()
+                        if directions[i] == 'max':
+                            result_i = obj - pen
                         else:
+                            result_i = obj + pen
+                        self.sing_result.append(result_i)
+                    if self.features["agent_status"] !=  'feasibility_check': 
+                        self.current_min = np.min(np.array(self.sing_result), axis = 0)
+                        self.current_max = np.max(np.array(self.sing_result), axis = 0)
+
+        else:
 
-                            total_obj = self.features['objective_counter'][0]
+            self.penalty = 0
 
-                            self.response = [None for i in range(total_obj)]
+            if len(self.features['constraints']) >= 1:
 
-                            for i in range(total_obj):
+                self.penalty = aggregator.aggregate_one([np.max(constraint) for constraint in self.features['constraints']])
 
-                                if directions[i] == 'max':
+            if type(obj_id) != str:
 
-                                    self.response[i] = self.features['objectives'][i] - \
-                                        self.features['penalty_coefficient'] * \
-                                        (self.penalty)**2
+                if directions[obj_id] == 'max':
+                    self.response = self.features['objectives'][obj_id] - \
+                        self.features['penalty_coefficient'] * self.penalty
+
+                if directions[obj_id] == 'min':
+                    self.response = self.features['objectives'][obj_id] + \
+                        self.features['penalty_coefficient'] * self.penalty
+                if self.features["agent_status"] !=  'feasibility_check': 
+                    self.current_min = np.min(self.response)
+                    self.current_max = np.max(self.response)
+
+            else:
 
-                                if directions[i] == 'min':
+                total_obj = self.features['objective_counter'][0]
 
-                                    self.response[i] = self.features['objectives'][i] + \
-                                        self.features['penalty_coefficient'] * \
-                                        (self.penalty)**2
-                            if self.features["agent_status"] !=  'feasibility_check': 
-                                self.current_min = np.min(np.array(self.response), axis = 0)
-                                self.current_max = np.max(np.array(self.response), axis = 0)
+                self.response = [None for i in range(total_obj)]
+
+                for i in range(total_obj):
+
+                    if directions[i] == 'max':
+
+                        self.response[i] = self.features['objectives'][i] - \
+                            self.features['penalty_coefficient'] * self.penalty
+
+                    if directions[i] == 'min':
+
+                        self.response[i] = self.features['objectives'][i] + \
+                            self.features['penalty_coefficient'] * self.penalty
+                if self.features["agent_status"] !=  'feasibility_check': 
+                    self.current_min = np.min(np.array(self.response), axis = 0)
+                    self.current_max = np.max(np.array(self.response), axis = 0)
 
     def healthy(self):
         try:
@@ -1753,6 +1746,9 @@ class model(
             return self.get(var_name)
 
         if not dual and not slack:
+            output = self.get_bulk_var(var_name, 'rc' if reduced_cost else 'variable')
+            if output is not None:
+                return output
             for i,j in self.features['variables'].keys():
                 if j==var_name:
                     if self.features['dimensions'][j]==0:
@@ -1803,23 +1799,95 @@ class model(
                             except:
                                 output[k] =  self.get_rc(self.features['variables'][(i,j)])[k]            
         if dual:
-            
-            output = []
-            for i in self.features['constraint_labels']:
-                if var_name in i:
-                    output.append(self.get_dual(i))
-            output = np.array(output)
-        
+
+            output = self.get_bulk_con(var_name, 'dual')
+
         if slack:
 
-            output = []
-            for i in self.features['constraint_labels']:
-                if var_name in i:
-                    output.append(self.get_slack(i))
-            output = np.array(output)
-                        
+            output = self.get_bulk_con(var_name, 'slack')
+
         return output
 
+    def get_bulk_var(self, var_name, thing='variable'):
+        """
+        Returns the values (or reduced costs) of a multi-dimensional variable in one bulk gather, or None if the variable cannot be extracted in bulk.
+        """
+
+        from .generators import result_generator
+
+        key = next((key for key in self.features['variables'].keys() if key[1] == var_name), None)
+        if key is None or self.features['dimensions'][var_name] == 0:
+            return None
+
+        variable = self.features['variables'][key]
+        dims = self.features['dimensions'][var_name]
+        column_index = self.features.setdefault('column_index', {})
+
+        try:
+            if isinstance(variable, VariableArray):
+                keys = list(variable.keys()) if isinstance(variable.dims, set) else None
+                elements = variable.values()
+                shape = variable.shape
+                if var_name not in column_index and variable.first_column is not None:
+                    column_index[var_name] = variable.columns().ravel()
+            elif isinstance(variable, dict):
+                if isinstance(dims, set) or (len(dims) == 1 and isinstance(dims[0], set)):
+                    keys = list(variable.keys())
+                    elements = list(variable.values())
+                    shape = None
+                else:
+                    keys = None
+                    fixed_dims = fix_dims(dims)
+                    elements = [variable[k] for k in iterate_variable_keys(fixed_dims)]
+                    shape = tuple(len(dim) for dim in fixed_dims)
+            else:
+                return None
+
+            if var_name not in column_index:
+                column_index[var_name] = result_generator.get_columns(self.features, elements)
+
+            values = result_generator.get_many(self.features, self.model, self.solution, thing, elements, column_index[var_name])
+        except BULK_ERRORS:
+            return None
+
+        if keys is not None:
+            return dict(zip(keys, values.tolist()))
+        return np.reshape(values, shape)
+
+    def get_bulk_con(self, family=None, thing='dual'):
+        """
+        Returns the duals (or slacks) of all constraints, or of a constraint family, as a numpy array; duals the solver does not provide (e.g., for
+        mixed-integer models solved with highs) are NaN.
+        """
+
+        from .generators import result_generator
+
+        registry = self.features['constraint_registry']
+        positions = range(len(registry)) if family is None else registry.positions(family)
+        labels = [registry.labels[position] for position in positions]
+        first_row = self.features.get('constraint_first_row')
+        rows = None if first_row is None else first_row + np.asarray(positions, dtype=np.int64)
+
+        try:
+            return result_generator.get_many(self.features, self.model, self.solution, thing, labels, rows)
+        except BULK_ERRORS:
+            getter = self.get_dual if thing == 'dual' else self.get_slack
+            return np.array([getter(label) for label in labels])
+
+    def get_duals(self, family=None):
+        """
+        Returns the dual values of all constraints (or of a constraint family) as a numpy array.
+        """
+
+        return self.get_bulk_con(family, 'dual')
+
+    def get_slacks(self, family=None):
+        """
+        Returns the slack values of all constraints (or of a constraint family) as a numpy array.
+        """
+
+        return self.get_bulk_con(family, 'slack')
+
     def decision_information_print(self,status, show_tensors, show_detailed_tensors, box_width=88):
         
         if show_detailed_tensors: show_tensors=True
@@ -2715,6 +2783,7 @@ end
         if n_jobs == 1:
             results = [_safe_decode(args, idx) for idx, args in enumerate(row_args)]
         else:
+            from joblib import Parallel, delayed
             results = Parallel(n_jobs=n_jobs, verbose=int(verbose), backend='threading')(
                 delayed(_safe_decode)(args, idx) for idx, args in enumerate(row_args)
             )
@@ -2767,8 +2836,17 @@ end
         else:
             raise TypeError("param must be either numpy.ndarray or dict")
 
+    objective = reward = hypothesis = fitness = goal = add_objective = loss = gain = obj
+    solve = implement = run = optimize = sol
+    get_obj = get_objective
+    get_stat = get_status
+    get_tensor = get_numpy_var
+    get_var = value = get = get_variable
+
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+BATCH_ERRORS = (TypeError, ValueError, IndexError)
+
 class Implement:
 
     def __init__(self, ModelFunction):
@@ -2803,6 +2881,13 @@ class Implement:
         self.status = 'Not solved'
         self.response = None
         self.AgentProperties = [None, None, None, None]
+        self.batch_supported = True
+        self.batch_checked = False
+        self.evaluation_pool = None
+        self.evaluation_recorder = None
+        self.fitness_cache = None
+        self.episodes = None
+        self.history = None
         self.get_objective = self.get_obj
         self.get_var = self.get_variable = self.get
         self.search = self.solve = self.optimize = self.run = self.sol
@@ -2850,25 +2935,50 @@ class Implement:
                     for key in self.VariablesBound.keys()
                 ])
                 from .generators.model import feloopy_model_generator
+                from .algorithms.heuristic.neighborhood import move_groups
                 self.ModelObject = feloopy_model_generator.generate_model(
-                    self.tot_counter[1], self.objectives_directions, self.solver_name, self.AlgOptions, self.LB, self.UB)
+                    self.tot_counter[1], self.objectives_directions, self.solver_name, self.AlgOptions, self.LB, self.UB, move_groups(self.VariablesSpread, self.VariablesType))
 
     def remove_infeasible_solutions(self):
 
         self.BestAgent = np.delete(self.BestAgent, self.remove, axis=0)
         self.BestReward = np.delete(self.BestReward, self.remove, axis=0)
 
-    def sol(self, penalty_coefficient=0, number_of_times=1, show_plots=False, save_plots=False, show_log=False):
+    def __getstate__(self):
+        '''
+        Drops the evaluation pool when the implementor is pickled (e.g., to run episodes in worker processes), which then evaluate the agents serially.
+        '''
+
+        state = self.__dict__.copy()
+        state['evaluation_pool'] = None
+        return state
+
+    def remove_dominated_solutions(self):
+        '''
+        Keeps the distinct non-dominated solutions of the obtained front, at most 'archive_cap' of them (least crowded first) if this option is provided.
+        '''
+
+        if len(self.BestReward) == 0:
+            return
+
+        archive = ParetoArchive(self.objectives_directions, self.AlgOptions.get('archive_cap', None))
+        archive.add(self.BestReward, list(self.BestAgent))
+        self.BestReward = archive.points
+        self.BestAgent = np.array(archive.items)
+
+    def sol(self, penalty_coefficient=0, number_of_times=1, show_plots=False, save_plots=False, show_log=False, n_jobs=1, seed=None):
 
         self.penalty_coefficient = penalty_coefficient
+        self.episodes = None
 
         match self.interface_name:
 
             case 'mealpy':
 
                 from .generators.solution import mealpy_solution_generator
-                self.BestAgent, self.BestReward, self.start, self.end = mealpy_solution_generator.generate_solution(
-                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, save_plots,show_log, self.AlgOptions)
+                self.BestAgent, self.BestReward, self.start, self.end, self.episodes = mealpy_solution_generator.generate_solution(
+                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, save_plots,show_log, self.AlgOptions,
+                    batch_fitness_function=self.Batch_Fitness if self.AlgOptions.get('batch_size') or self.evaluation_pool is not None else None, n_jobs=n_jobs, seed=seed, history=self.history)
 
             case 'scipy':
 
@@ -2885,7 +2995,8 @@ class Implement:
 
                 from .generators.solution import pygad_solution_generator
                 self.BestAgent, self.BestReward, self.start, self.end = pygad_solution_generator.generate_solution(
-                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, save_plots,show_log, self.AlgOptions)
+                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, save_plots,show_log, self.AlgOptions,
+                    batch_fitness_function=self.Batch_Fitness if self.AlgOptions.get('batch_size') or self.evaluation_pool is not None else None)
 
             case 'pymultiobjective':
 
@@ -2903,6 +3014,8 @@ class Implement:
                 if len(self.remove) != 0:
                     self.remove_infeasible_solutions()
 
+                self.remove_dominated_solutions()
+
             case 'pymoo':
 
                 from .generators.solution import pymoo_solution_generator
@@ -2917,12 +3030,14 @@ class Implement:
 
                 if len(self.remove) != 0:
                     self.remove_infeasible_solutions()
+
+                self.remove_dominated_solutions()
             
             case 'feloopy':
 
                 from .generators.solution import feloopy_solution_generator
-                self.BestAgent, self.BestReward, self.start, self.end, self.status = feloopy_solution_generator.generate_solution(
-                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, show_log)
+                self.BestAgent, self.BestReward, self.start, self.end, self.status, self.episodes = feloopy_solution_generator.generate_solution(
+                    self.ModelObject, self.Fitness, self.tot_counter, self.objectives_directions, self.ObjectiveBeingOptimized, number_of_times, show_plots, show_log, n_jobs=n_jobs, seed=seed, history=self.history)
 
     def dis_plots(self, ideal_pareto: Optional[np.ndarray] = [], step: Optional[tuple] = (0.1,)):
 
@@ -3018,6 +3133,9 @@ class Implement:
 
     def Check_Fitness(self, X):
 
+        if self.AlgOptions.get('batch_size') and self.batch_supported and np.ndim(X) == 1:
+            X = np.reshape(X, (1, -1))
+
         self.AgentProperties[0] = 'feasibility_check'
         self.AgentProperties[1] = X
         self.AgentProperties[2] = self.VariablesSpread
@@ -3025,8 +3143,22 @@ class Implement:
 
         return self.ModelFunction(self.AgentProperties)
 
+    @profiled("fitness")
     def Fitness(self, X):
 
+        if self.fitness_cache is None:
+            return self.Evaluate_Fitness(X)
+
+        return self.Cached_Fitness(X, self.Evaluate_Fitness)
+
+    def Evaluate_Fitness(self, X, record=True):
+
+        if self.evaluation_pool is not None and np.ndim(X) == 2 and self.interface_name in ['feloopy', 'pymoo']:
+            result = self.evaluation_pool.evaluate('active', X, self.VariablesSpread, self.penalty_coefficient)
+            if record and self.evaluation_recorder is not None:
+                self.evaluation_recorder(result)
+            return result
+
         self.AgentProperties[0] = 'active'
         self.AgentProperties[1] = X
         self.AgentProperties[2] = self.VariablesSpread
@@ -3034,354 +3166,180 @@ class Implement:
 
         return self.ModelFunction(self.AgentProperties)
 
-    def evaluate(self, show_fig=True, save_fig=False, file_name=None, dpi=800, fig_size=(18, 4), opt=None, opt_features=None, pareto=None, abs_tol=0.001, rel_tol=0.001):
+    def Cached_Fitness(self, X, evaluate, row_axis=None):
+        '''
+        Evaluates X through the fitness cache, so that only the agents whose decoded values are not cached are passed to ``evaluate``.
 
-        import matplotlib.pyplot as plt
+        A single agent is looked up as is. For a population (one agent per row), the cache misses are evaluated in one call and merged back with the hits in the original row order; rows are taken along ``row_axis`` of the result (by default, the axis used by the interface).
+        '''
 
-        fig = plt.figure(figsize=fig_size)
+        cache = self.fitness_cache
 
-        m = self.ModelObject.epsiode
-
-        no_epochs = self.AlgOptions['epoch']
-        no_episodes = self.AlgOptions['episode']
-
-        max_epoch_time = []
-        for epoch in range(0, no_epochs):
-            episode_time = []
-            for episode in range(0, no_episodes):
-                episode_time.append(m[episode]['epoch_time'][epoch])
-            max_epoch_time.append(np.max(episode_time))
-        max_epoch_time = np.array(max_epoch_time)
-
-        min_epoch_time = []
-        for epoch in range(0, no_epochs):
-            episode_time = []
-            for episode in range(0, no_episodes):
-                episode_time.append(m[episode]['epoch_time'][epoch])
-            min_epoch_time.append(np.min(episode_time))
-        min_epoch_time = np.array(min_epoch_time)
-
-        ave_epoch_time = []
-        for epoch in range(0, no_epochs):
-            episode_time = []
-            for episode in range(0, no_episodes):
-                episode_time.append(m[episode]['epoch_time'][epoch])
-            ave_epoch_time.append(np.average(episode_time))
-        ave_epoch_time = np.array(ave_epoch_time)
-
-        std_epoch_time = []
-        for epoch in range(0, no_epochs):
-            episode_time = []
-            for episode in range(0, no_episodes):
-                episode_time.append(m[episode]['epoch_time'][epoch])
-            std_epoch_time.append(np.std(episode_time))
-        std_epoch_time = np.array(std_epoch_time)
-
-        axs = fig.add_subplot(1, 5, 5)
-        x = np.arange(no_epochs)
-        axs.plot(x, max_epoch_time, 'blue', alpha=0.4)
-        axs.plot(x, ave_epoch_time, 'blue', alpha=0.8)
-        axs.plot(x, min_epoch_time, 'blue', alpha=0.4)
-        axs.fill_between(x, ave_epoch_time - std_epoch_time,
-                         ave_epoch_time + std_epoch_time, color='blue', alpha=0.3)
-        axs.set_xlabel('Epoch')
-        axs.set_ylabel('Time (second)')
-        axs.set_xlim(-0.5, no_epochs-1+0.5)
-
-        max_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-            max_epoch_obj.append(np.max(max_episode_obj))
-        max_epoch_obj = np.array(max_epoch_obj)
-
-        min_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-            min_epoch_obj.append(np.min(max_episode_obj))
-        min_epoch_obj = np.array(min_epoch_obj)
-
-        ave_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-            ave_epoch_obj.append(np.average(max_episode_obj))
-        ave_epoch_obj = np.array(ave_epoch_obj)
-
-        std_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-            std_epoch_obj.append(np.std(max_episode_obj))
-        std_epoch_obj = np.array(std_epoch_obj)
-
-        axs = fig.add_subplot(1, 5, 4)
-        x = np.arange(no_epochs)
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'max':
-            axs.plot(x, max_epoch_obj, 'green', alpha=0.4)
-            axs.plot(x, ave_epoch_obj, 'green', alpha=0.8)
-            axs.plot(x, min_epoch_obj, 'green', alpha=0.4)
-            axs.fill_between(x, ave_epoch_obj - std_epoch_obj,
-                             ave_epoch_obj + std_epoch_obj, color='green', alpha=0.3)
-        else:
-            axs.plot(x, max_epoch_obj, 'red', alpha=0.4)
-            axs.plot(x, ave_epoch_obj, 'red', alpha=0.8)
-            axs.plot(x, min_epoch_obj, 'red', alpha=0.4)
-
-            axs.fill_between(x, ave_epoch_obj - std_epoch_obj,
-                             ave_epoch_obj + std_epoch_obj, color='red', alpha=0.3)
-        axs.set_xlabel('Epoch')
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'max':
-            axs.set_ylabel('Maximum reward')
-        else:
-            axs.set_ylabel('Maximum loss')
-        axs.set_xlim(-0.5, no_epochs-1+0.5)
-
-        max_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(np.average(
-                    m[episode]['epoch_solutions'][epoch][:, -1]))
-            max_epoch_obj.append(np.max(max_episode_obj))
-        max_epoch_obj = np.array(max_epoch_obj)
-
-        min_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(np.average(
-                    m[episode]['epoch_solutions'][epoch][:, -1]))
-            min_epoch_obj.append(np.min(max_episode_obj))
-        min_epoch_obj = np.array(min_epoch_obj)
-
-        ave_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(np.average(
-                    m[episode]['epoch_solutions'][epoch][:, -1]))
-            ave_epoch_obj.append(np.average(max_episode_obj))
-        ave_epoch_obj = np.array(ave_epoch_obj)
-
-        std_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(np.average(
-                    m[episode]['epoch_solutions'][epoch][:, -1]))
-            std_epoch_obj.append(np.std(max_episode_obj))
-        std_epoch_obj = np.array(std_epoch_obj)
-
-        axs = fig.add_subplot(1, 5, 3)
-        x = np.arange(no_epochs)
-        axs.plot(x, max_epoch_obj, 'orange', alpha=0.4)
-        axs.plot(x, ave_epoch_obj, 'orange', alpha=0.8)
-        axs.plot(x, min_epoch_obj, 'orange', alpha=0.4)
-        axs.fill_between(x, ave_epoch_obj - std_epoch_obj,
-                         ave_epoch_obj + std_epoch_obj, color='orange', alpha=0.3)
-        axs.set_xlabel('Epoch')
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'max':
-            axs.set_ylabel('Average reward')
-        else:
-            axs.set_ylabel('Average loss')
-        axs.set_xlim(-0.5, no_epochs-1+0.5)
-
-        max_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-            max_epoch_obj.append(np.max(max_episode_obj))
-        max_epoch_obj = np.array(max_epoch_obj)
-
-        min_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-            min_epoch_obj.append(np.min(max_episode_obj))
-        min_epoch_obj = np.array(min_epoch_obj)
-
-        ave_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-            ave_epoch_obj.append(np.average(max_episode_obj))
-        ave_epoch_obj = np.array(ave_epoch_obj)
-
-        std_epoch_obj = []
-        for epoch in range(0, no_epochs):
-            max_episode_obj = []
-            for episode in range(0, no_episodes):
-                max_episode_obj.append(
-                    np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-            std_epoch_obj.append(np.std(max_episode_obj))
-        std_epoch_obj = np.array(std_epoch_obj)
-
-        axs = fig.add_subplot(1, 5, 2)
-        x = np.arange(no_epochs)
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'max':
-            axs.plot(x, max_epoch_obj, 'red', alpha=0.4)
-            axs.plot(x, ave_epoch_obj, 'red', alpha=0.8)
-            axs.plot(x, min_epoch_obj, 'red', alpha=0.4)
-            axs.fill_between(x, ave_epoch_obj - std_epoch_obj,
-                             ave_epoch_obj + std_epoch_obj, color='red', alpha=0.3)
-        else:
-            axs.plot(x, max_epoch_obj, 'green', alpha=0.4)
-            axs.plot(x, ave_epoch_obj, 'green', alpha=0.8)
-            axs.plot(x, min_epoch_obj, 'green', alpha=0.4)
-            axs.fill_between(x, ave_epoch_obj - std_epoch_obj,
-                             ave_epoch_obj + std_epoch_obj, color='green', alpha=0.3)
-        axs.set_xlabel('Epoch')
-        axs.set_xlim(-0.5, no_epochs-1+0.5)
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'max':
-            axs.set_ylabel('Minimum reward')
-        else:
-            axs.set_ylabel('Minimum loss')
-
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'min':
-            best_min_min = np.inf
-            best_min_min_t = []
-            best_sol_t = []
-            best_per_episode = []
-            no_features = self.tot_counter[1]
-            for epoch in range(0, no_epochs):
-                best_min = []
-                best_sol = []
-                for episode in range(0, no_episodes):
-                    best_min.append(
-                        np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-                    best_sol.append(m[episode]['epoch_solutions'][epoch][np.argmin(
-                        m[episode]['epoch_solutions'][epoch][:, -1]), :])
-                    best_track = np.min(best_min)
-                    for x in best_sol:
-                        if x[-1] == best_track:
-                            best_sol_found = x[:no_features]
-                if best_track <= best_min_min:
-                    best_min_min = best_track
-                    best_min_min_t.append(best_track)
-                    if no_features == 1:
-                        best_sol_t.append(best_sol_found[0])
-                    if no_features == 2:
-                        best_sol_t.append(
-                            [best_sol_found[0], best_sol_found[1]])
-                    else:
-                        best_sol_t.append(
-                            [best_sol_found[0], best_sol_found[1], best_sol_found[2]])
-                else:
-                    best_min_min_t.append(best_min_min)
-                    best_sol_t.append(best_sol_t[-1])
+        if np.ndim(X) == 1:
 
-                    if epoch == no_epochs-1:
-                        best_per_episode.append(best_track)
+            key = cache.keys(X)[0]
+            values, rows = cache.lookup([key])
+            if rows:
+                values[0] = evaluate(X, record=False)
+                cache.store(key, values[0])
+            result = values[0]
 
-            best_min_min_t = np.array(best_min_min_t)
         else:
-            best_min_min = -np.inf
-            best_min_min_t = []
-            best_sol_t = []
-            best_per_episode = []
-            no_features = self.tot_counter[1]
-            for epoch in range(0, no_epochs):
-                best_min = []
-                best_sol = []
-                for episode in range(0, no_episodes):
-                    best_min.append(
-                        np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-                    best_sol.append(m[episode]['epoch_solutions'][epoch][np.argmax(
-                        m[episode]['epoch_solutions'][epoch][:, -1]), :])
-                    best_track = np.max(best_min)
-                    for x in best_sol:
-                        if x[-1] == best_track:
-                            best_sol_found = x[:no_features]
-                if best_track >= best_min_min:
-                    best_min_min = best_track
-                    best_min_min_t.append(best_track)
-                    if no_features == 1:
-                        best_sol_t.append(best_sol_found[0])
-                    if no_features == 2:
-                        best_sol_t.append(
-                            [best_sol_found[0], best_sol_found[1]])
-                    else:
-                        best_sol_t.append(
-                            [best_sol_found[0], best_sol_found[1], best_sol_found[2]])
+
+            X = np.asarray(X)
+            width = self.tot_counter[1] if self.interface_name == 'feloopy' else 0
+            keys = cache.keys(X)
+            values, rows = cache.lookup(keys)
+            evaluated = {}
+
+            if rows:
+                result = np.asarray(evaluate(X[rows], record=False))
+                axis = row_axis if row_axis is not None else (1 if result.ndim > 1 and not width else 0)
+                for position, row in enumerate(rows):
+                    value = np.take(result, position, axis=axis)
+                    evaluated[keys[row]] = value[width:] if width else value
+                    cache.store(keys[row], evaluated[keys[row]])
+
+            for row, value in enumerate(values):
+                if value is cache.missing:
+                    values[row] = evaluated[keys[row]]
+
+            if width:
+                result = X.copy()
+                result[:, width:] = np.stack(values)
+            else:
+                axis = row_axis if row_axis is not None else (1 if np.ndim(values[0]) > 0 else 0)
+                result = np.stack(values, axis=axis)
+
+        if self.evaluation_recorder is not None:
+            self.evaluation_recorder(result)
+
+        return result
+
+    def Batch_Fitness(self, X):
+        '''
+        Evaluates a whole population (one agent per row), through the fitness cache if one is attached.
+        '''
+
+        if self.fitness_cache is None:
+            return self.Evaluate_Batch_Fitness(X)
+
+        return self.Cached_Fitness(np.asarray(X, dtype=float), self.Evaluate_Batch_Fitness, row_axis=0)
+
+    def Evaluate_Batch_Fitness(self, X, record=True):
+        '''
+        Evaluates a whole population (one agent per row) in vectorized environment calls.
+
+        Rows are evaluated in chunks of the 'batch_size' solver option ('population' or True for a single call), or split over the evaluation pool if one is attached. If the environment cannot be evaluated in vectorized form (a shape, type or value error, or results that differ from a per-agent call), it falls back to per-agent calls for the rest of the search with a warning; other errors are raised.
+        '''
+
+        X = np.asarray(X, dtype=float)
+        number_of_agents = X.shape[0]
+
+        if self.batch_supported and self.AlgOptions.get('batch_size'):
+
+            batch_size = self.AlgOptions.get('batch_size', None)
+            if batch_size in [True, 'population'] or batch_size >= number_of_agents:
+                batch_size = number_of_agents
+
+            try:
+                if self.evaluation_pool is not None:
+                    result = np.asarray(self.evaluation_pool.evaluate('active', X, self.VariablesSpread, self.penalty_coefficient), dtype=float)
+                    rewards = np.reshape(result, (-1, number_of_agents)).T
                 else:
-                    best_min_min_t.append(best_min_min)
-                    best_sol_t.append(best_sol_t[-1])
+                    rewards = []
+                    for start in range(0, number_of_agents, batch_size):
+                        chunk = X[start:start+batch_size]
+                        self.AgentProperties[0] = 'active'
+                        self.AgentProperties[1] = chunk
+                        self.AgentProperties[2] = self.VariablesSpread
+                        self.AgentProperties[3] = self.penalty_coefficient
+                        result = np.asarray(self.ModelFunction(self.AgentProperties), dtype=float)
+                        rewards.append(np.reshape(result, (-1, chunk.shape[0])).T)
+                    rewards = np.concatenate(rewards, axis=0)
+                rewards = rewards[:, 0] if rewards.shape[1] == 1 else rewards
+
+                if not self.batch_checked:
+                    self.batch_checked = True
+                    try:
+                        reward = np.asarray(self.Evaluate_Fitness(X[0], record=False), dtype=float).ravel()
+                    except BATCH_ERRORS:
+                        reward = None
+                    if reward is not None and not np.allclose(rewards[0], reward):
+                        raise ValueError("The environment is not vectorizable.")
 
-                    if epoch == no_epochs-1:
-                        best_per_episode.append(best_track)
+                if record and self.evaluation_pool is not None and self.evaluation_recorder is not None:
+                    self.evaluation_recorder(rewards)
 
-            best_min_min_t = np.array(best_min_min_t)
+                return rewards
 
-        if no_features == 1:
-            axs = fig.add_subplot(1, 5, 1)
-            axs.plot(np.arange(no_epochs), best_sol_t, c='black', lw=1)
-            if opt_features != None:
-                axs.scatter(np.arange(no_epochs),
-                            opt_features[0], c='black', marker='*', lw=1)
+            except BATCH_ERRORS as error:
+                self.batch_supported = False
+                warnings.warn(f"The environment is evaluated agent by agent for the rest of the search, as it cannot be evaluated in batches ({type(error).__name__}: {error}).", RuntimeWarning, stacklevel=2)
 
-            axs.set_ylim(-0.5, 1.5)
-            axs.set_xlim(-0.5, no_epochs-1+0.5)
+        if self.evaluation_pool is not None:
+            rewards = np.array(self.evaluation_pool.evaluate('active', X, self.VariablesSpread, self.penalty_coefficient, per_agent=True))
+            if record and self.evaluation_recorder is not None:
+                self.evaluation_recorder(rewards)
+            return rewards
+
+        return np.array([self.Evaluate_Fitness(x, record=record) for x in X])
+
+    def close_evaluation_pool(self):
+
+        if self.evaluation_pool is not None:
+            self.evaluation_pool.close()
+            self.evaluation_pool = None
+
+    def evaluate(self, show_fig=True, save_fig=False, file_name=None, dpi=800, fig_size=(18, 4), opt=None, opt_features=None, pareto=None, abs_tol=0.001, rel_tol=0.001):
+        '''
+        Plots the convergence of the episodes of a search recorded with ``track_history=True`` (best, minimum, average and maximum reward and time per epoch, with their spread over the episodes).
+
+        Returns the best reward and the time of each episode, and, if the optimal value ``opt`` is known, the accuracy of the best reward found so far and the share of episodes that found ``opt`` at each epoch.
+
+        ``opt_features`` and ``pareto`` are deprecated and ignored, as the history records the statistics of the rewards and not the agents.
+        '''
+
+        import matplotlib.pyplot as plt
+
+        if opt_features is not None or pareto is not None:
+            warnings.warn("The 'opt_features' and 'pareto' arguments of evaluate are deprecated and ignored; the convergence history does not record the agents.", DeprecationWarning, stacklevel=2)
+
+        if self.history is None:
+            raise ValueError("The convergence history is not recorded; create the search with track_history=True.")
+
+        direction = self.objectives_directions[self.ObjectiveBeingOptimized]
+        objective = self.ObjectiveBeingOptimized if self.history.shape[3] > 1 else 0
+        best = self.history.best(direction, objective)
+        no_epochs = best.shape[1]
+        x = np.arange(no_epochs)
+
+        fig = plt.figure(figsize=fig_size)
+
+        def panel(position, values, color, label):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                low, ave, high, std = np.nanmin(values, axis=0), np.nanmean(values, axis=0), np.nanmax(values, axis=0), np.nanstd(values, axis=0)
+            axs = fig.add_subplot(1, 5, position)
+            axs.plot(x, high, color, alpha=0.4)
+            axs.plot(x, ave, color, alpha=0.8)
+            axs.plot(x, low, color, alpha=0.4)
+            axs.fill_between(x, ave - std, ave + std, color=color, alpha=0.3)
             axs.set_xlabel('Epoch')
-            axs.set_ylabel('Feature')
-
-        if no_features == 2:
-            axs = fig.add_subplot(1, 5, 1)
-            from matplotlib.patches import Rectangle
-            for i in range(0, no_epochs):
-                hg = 0.1+i/(no_epochs)
-                axs.scatter(best_sol_t[i][0], best_sol_t[i]
-                            [1], c='black', lw=1, alpha=hg)
-            if opt_features != None:
-                axs.scatter(opt_features[0], opt_features[1],
-                            c='black', marker='*', lw=1)
-
-            axs.add_patch(Rectangle((0, 0), 1, 1, fill=None, alpha=1))
-
-            axs.set_ylim(-0.5, 1.5)
-            axs.set_xlim(-0.5, 1.5)
-            axs.set_xlabel('Feature 1')
-            axs.set_ylabel('Feature 2')
-
-        if no_features == 3:
-            axs = fig.add_subplot(1, 5, 1, projection='3d')
-            for i in range(0, no_epochs):
-                hg = 0.1+i/(no_epochs)
-                axs.scatter(best_sol_t[i][0], best_sol_t[i][1],
-                            best_sol_t[i][2], lw=1, alpha=hg, color='black')
-            if opt_features != None:
-                axs.scatter(opt_features[0], opt_features[1],
-                            opt_features[2], c='red', marker='*', lw=1)
-            axs.set_xlabel('Feature 1')
-            axs.set_ylabel('Feature 2')
-            axs.set_zlabel('Feature 3')
-            axs.set_ylim(-0.5, 1.5)
-            axs.set_xlim(-0.5, 1.5)
-            axs.set_zlim(-0.5, 1.5)
-
-            axs.view_init(azim=30)
-
-        if no_features <= 2:
-            plt.subplots_adjust(left=0.071, bottom=0.217,
-                                right=0.943, top=0.886, wspace=0.35, hspace=0.207)
-        else:
-            plt.subplots_adjust(left=0.03, bottom=0.252,
-                                right=0.945, top=0.886, wspace=0.421, hspace=0.22)
+            axs.set_ylabel(label)
+            axs.set_xlim(-0.5, no_epochs-1+0.5)
+            return axs
+
+        unit = 'reward' if direction == 'max' else 'loss'
+        axs = panel(1, best, 'black', f'Best {unit}')
+        if opt is not None:
+            axs.axhline(opt, color='black', linestyle='--', lw=1)
+        panel(2, self.history.trajectory('min', objective), 'red' if direction == 'max' else 'green', f'Minimum {unit}')
+        panel(3, self.history.trajectory('mean', objective), 'orange', f'Average {unit}')
+        panel(4, self.history.trajectory('max', objective), 'green' if direction == 'max' else 'red', f'Maximum {unit}')
+        panel(5, self.history.trajectory('time', objective), 'blue', 'Time (second)')
+
+        plt.subplots_adjust(left=0.03, bottom=0.252, right=0.945, top=0.886, wspace=0.421, hspace=0.22)
 
         if save_fig:
             if file_name == None:
@@ -3392,71 +3350,22 @@ class Implement:
         if show_fig:
             plt.show()
 
-        obj = []
-        time = []
-        for episode in range(0, no_episodes):
-            obj.append(m[episode]['best_single'][0][-1])
-            time.append(m[episode]['episode_time'][0])
+        obj = list(best[:, -1])
+        time = list(np.nansum(self.history.trajectory('time', objective), axis=1))
 
-        opt = np.array([opt])
+        if opt is None:
+            return [obj, time, None, None]
+
+        overall = np.fmax.reduce(best, axis=0) if direction == 'max' else np.fmin.reduce(best, axis=0)
         if opt != 0:
-            accuracy = (1-np.abs(opt-best_min_min_t)/opt)*100
+            accuracy = (1-np.abs(opt-overall)/opt)*100
         else:
-            opt = opt + 1
-            best_min_min_t = best_min_min_t+1
-            accuracy = (1-np.abs(opt-best_min_min_t)/opt)*100
+            accuracy = (1-np.abs(1-(overall+1)))*100
             accuracy[np.where(accuracy < 0)] = 0
 
-        from math import isclose
-
-        opt = np.array([opt])
-        prob_per_epoch = []
-
-        findbest = np.zeros(shape=(no_episodes, no_epochs))
-
-        if self.objectives_directions[self.ObjectiveBeingOptimized] == 'min':
-            for episode in range(0, no_episodes):
-                episode_tracker = []
-                best = np.inf
-                for epoch in range(0, no_epochs):
-                    if np.min(m[episode]['epoch_solutions'][epoch][:, -1]) <= best:
-                        best = np.min(
-                            m[episode]['epoch_solutions'][epoch][:, -1])
-                        episode_tracker.append(
-                            np.min(m[episode]['epoch_solutions'][epoch][:, -1]))
-                    else:
-                        episode_tracker.append(best)
-                for epoch in range(0, no_epochs):
-                    if opt == 0:
-                        if isclose(episode_tracker[epoch], opt, abs_tol=abs_tol):
-                            findbest[episode, epoch] = 1
-                    else:
-                        if isclose(episode_tracker[epoch], opt, rel_tol=rel_tol):
-                            findbest[episode, epoch] = 1
-        else:
-            for episode in range(0, no_episodes):
-                episode_tracker = []
-                best = -np.inf
-                for epoch in range(0, no_epochs):
-                    if np.max(m[episode]['epoch_solutions'][epoch][:, -1]) >= best:
-                        best = np.max(
-                            m[episode]['epoch_solutions'][epoch][:, -1])
-                        episode_tracker.append(
-                            np.max(m[episode]['epoch_solutions'][epoch][:, -1]))
-                    else:
-                        episode_tracker.append(best)
-                for epoch in range(0, no_epochs):
-                    if opt == 0:
-                        if isclose(episode_tracker[epoch], opt, abs_tol=abs_tol, rel_tol=rel_tol):
-                            findbest[episode, epoch] = 1
-                    else:
-                        if isclose(episode_tracker[epoch], opt, abs_tol=abs_tol, rel_tol=rel_tol):
-                            findbest[episode, epoch] = 1
-
         # abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
-
-        prob_per_epoch = [sum(findbest[episode, epoch] for episode in range(
-            0, no_episodes))/no_episodes for epoch in range(0, no_epochs)]
+        found = np.abs(best - opt) <= np.maximum(rel_tol*np.maximum(np.abs(best), abs(opt)), abs_tol)
+        prob_per_epoch = list(np.mean(found, axis=0))
 
         return [obj, time, accuracy, prob_per_epoch]
 
@@ -3672,68 +3581,34 @@ class Implement:
         """
         Calculates selected Pareto front metrics and displays the results in a tabulated format.
 
-        :param ideal_pareto: An array of shape (n_samples, n_objectives) containing the ideal Pareto front. Default is None.
+        The indicators are calculated natively from the obtained front (and the ideal Pareto front, if provided), without re-evaluating the fitness function.
+        HV, SP and MS are always available; GD, GD+, IGD and IGD+ require the ideal Pareto front.
+
+        :param ideal_pareto: An array of shape (n_samples, n_objectives) containing the ideal Pareto front, in the original sense of the objectives. Default is None.
+        :param ideal_point: The reference point of the hypervolume, in the original sense of the objectives. Default is the worst value of each objective over the obtained front.
+        :param step: Kept for backward compatibility; no grid is evaluated anymore.
         :param epsilon: A float value for the epsilon value used in the epsilon metric. Default is 0.01.
         :param p: A float value for the power parameter used in the weighted generational distance and weighted inverted generational distance metrics. Default is 2.0.
         :param n_clusters: An integer value for the number of clusters used in the knee point distance metric. Default is 5.
         :param save_path: A string value for the path where the results should be saved. Default is None.
+        :param normalize_hv: If True, the hypervolume is calculated over objectives normalized to [0, 1]. Default is False.
+        :param bypass_limit: Kept for backward compatibility; all indicators are calculated regardless of the number of variables.
         """
         if len(self.get_obj())!=0:
 
-            obtained_pareto = self.BestReward
-            try:
-                from pyMultiobjective.util import indicators
-            except:
-                ""
+            from .operators.indicator_operators import calculate_indicators
 
-            ObjectivesDirections = [-1 if direction =='max' else 1 for direction in self.objectives_directions]
-
-            def f1(X): return ObjectivesDirections[0]*self.Fitness(np.array(X))[0]
-            def f2(X): return ObjectivesDirections[1]*self.Fitness(np.array(X))[1]
-            def f3(X): return ObjectivesDirections[2]*self.Fitness(np.array(X))[2]
-            def f4(X): return ObjectivesDirections[3]*self.Fitness(np.array(X))[3]
-            def f5(X): return ObjectivesDirections[4]*self.Fitness(np.array(X))[4]
-            def f6(X): return ObjectivesDirections[5]*self.Fitness(np.array(X))[5]
-
-            list_of_functions = [f1, f2, f3, f4, f5, f6]
-
-            solution = np.concatenate((self.BestAgent, self.BestReward*ObjectivesDirections), axis=1)
-            self.calculated_indicators = dict()
-
-            #Does not require the ideal_pareto
-            parameters = {
-                'solution': solution,
-                'n_objs': len(ObjectivesDirections),
-                'ref_point': ideal_point,
-                'normalize': normalize_hv
-            }
-            hypervolume = indicators.hv_indicator(**parameters)
-            self.calculated_indicators['hv'] = hypervolume
-
-            parameters = {
-                'min_values': (0,)*self.tot_counter[1],
-                'max_values': (1,)*self.tot_counter[1],
-                'step': step*self.tot_counter[1],
-                'solution': solution,
-                'pf_min': True,
-                'custom_pf': ideal_pareto*ObjectivesDirections if type(ideal_pareto) == np.ndarray else []
-            }
-
-            sp = indicators.sp_indicator(list_of_functions=list_of_functions, **parameters)
-            self.calculated_indicators['sp'] = sp
-
-            #Computationally efficient only if ideal_pareto exists
-            if self.tot_counter[1]<=3 or ideal_pareto != [] or bypass_limit:
-                gd = indicators.gd_indicator(list_of_functions=list_of_functions, **parameters)
-                gdp = indicators.gd_plus_indicator(list_of_functions=list_of_functions, **parameters)
-                igd = indicators.igd_indicator(list_of_functions=list_of_functions, **parameters)
-                igdp = indicators.igd_plus_indicator(list_of_functions=list_of_functions, **parameters)
-                ms = indicators.ms_indicator(list_of_functions=list_of_functions, **parameters)
-                self.calculated_indicators['gd'] = gd
-                self.calculated_indicators['gdp'] = gdp
-                self.calculated_indicators['igd'] = igd
-                self.calculated_indicators['igdp'] = igdp
-                self.calculated_indicators['ms'] = ms
+            self.calculated_indicators = calculate_indicators(
+                self.BestReward,
+                self.objectives_directions,
+                reference_front=ideal_pareto,
+                reference_point=ideal_point,
+                normalize_hv=normalize_hv,
+            )
+
+            if show_log:
+                for key, value in self.calculated_indicators.items():
+                    print(f"{key}: {value}")
 
             return self.calculated_indicators
 
@@ -5144,6 +5019,23 @@ class search(model,Implement):
         absolute_gap=None,
         relative_gap=None,
         track_history=False,
+        bulk_variables=False,
+        variable_names=None,
+        compiled=False,
+        evaluation_backend="serial",
+        evaluation_workers=None,
+        evaluation_chunk_size=None,
+        fitness_cache=None,
+        sensitivity_jobs=1,
+        sensitivity_backend="process",
+        mutable_params=[],
+        benchmark_timeout=None,
+        benchmark_jobs=1,
+        profiling=False,
+        penalty_aggregation="max",
+        episode_jobs=1,
+        episode_seed=None,
+        history_path=None,
         *args, **kwargs
     ):
 
@@ -5175,6 +5067,8 @@ class search(model,Implement):
         self.memorize = memorize
         self.sensitivity_analyzed = False
         self.options = options
+        if interface == 'feloopy' and solver in GRADIENT_SOLVERS and 'pop_size' not in options:
+            self.options = {**options, 'pop_size': 1}
         self.should_benchmark = True if (type(benchmark)==str and benchmark=='all') or (type(benchmark)==list and len(benchmark)>=1) else False
         self.inputdata = dataset
         self.data = {}
@@ -5183,13 +5077,38 @@ class search(model,Implement):
         self.mgt = 0
         self.decoder = decoder
         self.track_history = track_history
+        self.bulk_variables = bulk_variables
+        self.variable_names = variable_names
+        self.compiled = compiled
+        self.heuristic_shell = None
+        self.compiled_environment = None
+        self.evaluation_backend = evaluation_backend
+        self.evaluation_workers = evaluation_workers
+        self.evaluation_chunk_size = evaluation_chunk_size
+        self.fitness_cache_size = fitness_cache
+        self.history_recorded_by_implementor = False
+        self.sensitivity_jobs = sensitivity_jobs
+        self.sensitivity_backend = sensitivity_backend
+        self.mutable_params = mutable_params
+        self.benchmark_timeout = benchmark_timeout
+        self.benchmark_jobs = benchmark_jobs
+        self.profiler = Profiler() if profiling else None
+        self.penalty_aggregation = penalty_aggregation
+        self.penalty_aggregator = None
+        if penalty_aggregation == "adaptive" and (fitness_cache or evaluation_backend == "process"):
+            raise ValueError("The 'adaptive' penalty aggregation cannot be combined with a fitness cache or the 'process' evaluation backend, as cached fitness values and worker processes would use stale or diverging penalty weights.")
+        self.episode_jobs = episode_jobs
+        self.episode_seed = episode_seed
+        self.history_path = history_path
+        self.history = None
 
         if self.method!= "madm":
             
             self.number_of_objectives = len(self.directions)
         
         start = timeit.default_timer()
-        self.create_env(environment, verbose=self.verbose)
+        with self.profiled_phase("generation"):
+            self.create_env(environment, verbose=self.verbose)
         end = timeit.default_timer()
         self.mgt+=end-start
 
@@ -5206,12 +5125,15 @@ class search(model,Implement):
             
             #run_with_progress(self.run, show_log= self.progress, verbose=self.verbose)
             start = timeit.default_timer()
-            self.run(verbose=self.verbose)
+            with self.profiled_phase("search"):
+                self.run(verbose=self.verbose)
             end = timeit.default_timer()
             self.mgt+=end-start
+            self.count_profile()
         
         if len(self.key_params)!=0 and len(self.scenarios)!=0:
-            self.sensitivity(dataset, key_params, scenarios, environment,control_scenario)
+            with self.profiled_phase("sensitivity"):
+                self.sensitivity(dataset, key_params, scenarios, environment,control_scenario)
 
         if report:
             self.report()
@@ -5222,6 +5144,114 @@ class search(model,Implement):
             self.best_epoch_trajectory = []
             self.best_overall_trajectory = []
 
+    def profiled_phase(self, name):
+        """
+        Returns a context that records the enclosed block as one call of the phase ``name`` if profiling is enabled.
+        """
+
+        profiler = getattr(self, 'profiler', None)
+        return profiler.phase(name) if profiler is not None else nullcontext()
+
+    def count_profile(self):
+
+        if self.profiler is None:
+            return
+        features = getattr(self.em, 'features', None)
+        if isinstance(features, (dict, ModelState)):
+            for counter, feature in [('variables', 'total_variable_counter'), ('constraints', 'constraint_counter')]:
+                if feature in features:
+                    self.profiler.count(counter, features[feature][1])
+
+    @property
+    def profile(self):
+        """
+        Returns the number of calls, total seconds, mean microseconds per call and share of the generation and search time of each profiled phase, or ``None`` if profiling is disabled.
+
+        For exact methods, the time spent in the solution phase is further split into the time reported by the solver ('solver') and the rest ('transfer'), i.e., passing the model to the solver and collecting the results.
+        """
+
+        if getattr(self, 'profiler', None) is None:
+            return None
+
+        phases = self.profiler.summary()
+        if self.method == 'exact' and 'solution' in phases and self.number_of_objectives == 1:
+            try:
+                solver_time = float(self.em.get_time())
+                calls, seconds = phases['solution']
+                phases['solver'] = (calls, solver_time)
+                phases['transfer'] = (calls, max(0.0, seconds - solver_time))
+            except Exception:
+                pass
+
+        total = sum(phases.get(phase, (0, 0.0))[1] for phase in ['generation', 'search'])
+        rows = [{
+            'phase': phase,
+            'calls': calls,
+            'seconds': seconds,
+            'mean_us': seconds / calls * 1e6 if calls else 0.0,
+            'share': seconds / total if total else 0.0,
+        } for phase, (calls, seconds) in phases.items()]
+        return pd.DataFrame(rows, columns=['phase', 'calls', 'seconds', 'mean_us', 'share']).set_index('phase')
+
+    @property
+    def constraint_violations(self):
+        """
+        Returns the share of the evaluated search agents that violated each constraint of a heuristic model (labelled as in the model, or by position), from the most violated, or ``None`` for other methods.
+
+        With an evaluation pool of processes, only the agents evaluated in the main process are counted.
+        """
+
+        if getattr(self, 'penalty_aggregator', None) is None:
+            return None
+
+        rates = self.penalty_aggregator.violation_rates()
+        labels = list(self.em.model_data.features['constraint_labels']) if hasattr(self.em, 'model_data') else []
+        labels = [label if label is not None else f"c{position}" for position, label in enumerate(labels[:len(rates)])]
+        labels += [f"c{position}" for position in range(len(labels), len(rates))]
+        return pd.Series(rates, index=labels, name='violation_rate', dtype=float).sort_values(ascending=False, kind='stable')
+
+    @property
+    def episodes(self):
+        """
+        Returns the seed, best reward, computation time (seconds) and number of evaluated populations (or epochs) until the best reward of each episode of a heuristic search repeated over several episodes, or ``None`` otherwise.
+        """
+
+        episodes = getattr(getattr(self, 'em', None), 'episodes', None)
+        if not episodes:
+            return None
+
+        return pd.DataFrame([[episode['seed'], episode['reward'], episode['end'] - episode['begin'], len(episode['curve']), episode.get('termination', 'epoch')] for episode in episodes],
+                            columns=['seed', 'reward', 'cpt', 'curve_length', 'termination']).rename_axis('episode')
+
+    @property
+    def termination(self):
+        """
+        Returns the early termination of a native heuristic algorithm configured by the solver options (with the criterion that stopped the last run in ``reason``), or ``None`` otherwise.
+        """
+
+        return getattr(getattr(getattr(self, 'em', None), 'ModelObject', None), 'termination', None)
+
+    def get_convergence(self):
+        """
+        Returns the convergence curve (best reward so far) of each episode of a repeated heuristic search, padded with their final value to the longest one, as a 2D array (one row per episode).
+        """
+
+        episodes = getattr(getattr(self, 'em', None), 'episodes', None)
+        if not episodes:
+            return None
+
+        length = max(len(episode['curve']) for episode in episodes)
+        return np.array([np.pad(episode['curve'], (0, length - len(episode['curve'])), mode='edge') if len(episode['curve']) else np.full(length, np.nan) for episode in episodes])
+
+    def save_profile(self, path):
+        """
+        Saves the timeline of the profiled phases as a Chrome trace (JSON), viewable in chrome://tracing or Perfetto.
+        """
+
+        if getattr(self, 'profiler', None) is None:
+            raise ValueError("Profiling is disabled; create the search with profiling=True.")
+        self.profiler.save_trace(path)
+
     def clean_report(self,**kwargs):
 
         command = "cls" if os.name == "nt" else "clear"
@@ -5230,6 +5260,8 @@ class search(model,Implement):
         
     def create_env(self, environment, verbose):
         
+        self.release_evaluation_pool()
+
         if not verbose:
             start_progress(message="Generating...", spinner="dots")
 
@@ -5238,59 +5270,80 @@ class search(model,Implement):
         #    del self.options["penalty_coefficient"]
     
         if self.method in ["exact", "convex", "constraint", "uncertain"]:
-            self.em = model(method=self.method,name=self.name,interface=self.interface)
+            self.em = model(method=self.method,name=self.name,interface=self.interface, bulk_variables=self.bulk_variables, variable_names=self.variable_names)
             self.em = self.environment(self.em, *self.args, **self.kwargs)
             if self.interface =="jump" and self.inputdata:
                 self.em.jlcode_data(self.inputdata)
 
         if self.method in ["heuristic"]:
 
+            self.penalty_aggregator = PenaltyAggregator(self.penalty_aggregation, adaptive_period=self.options.get("pop_size", 50))
+            self.heuristic_shell = None
+
+            if self.track_history:
+                self.history = HistoryRecorder(
+                    epochs=self.options.get("epoch", 100) + 1,
+                    episodes=self.repeat,
+                    objectives=len(self.directions),
+                    pop_size=None if self.interface in ['feloopy', 'pymoo'] else self.options.get("pop_size", 50),
+                    path=self.history_path)
+
             if len(self.directions)==1:
 
-                if self.track_history:
-                    self.lb_record = []
-                    self.ub_record = []
-                    if self.interface == "feloopy":
-                        self.ave_record = []
-                        self.std_record = []
+                def solve(lm):
+                    lm.sol(directions=self.directions,solver=self.solver,show_log=self.verbose, solver_options=self.options)
+
+                if self.compiled:
+                    self.compiled_environment = CompiledEnvironment(self.heuristic_model, environment, self.args, self.kwargs, solve, self.directions)
 
                 def instance(X):
                     
-                    lm = model(method=self.method, name=self.name, interface=self.interface, agent=X, no_agents=self.options.get("pop_size", 50))
-                    lm = environment(lm, *self.args, **self.kwargs)
-                    lm.sol(directions=self.directions,solver=self.solver,show_log=self.verbose, solver_options=self.options)
-                    if self.track_history and lm.features["agent_status"] !=  'feasibility_check':
-                        self.lb_record.append(lm.current_min)
-                        self.ub_record.append(lm.current_max)
-                        if self.interface == "feloopy":
-                            self.ave_record.append(lm.current_ave)
-                            self.std_record.append(lm.current_std)
+                    if self.compiled and X[0] == 'active':
+                        lm = self.compiled_environment(X)
+                    else:
+                        lm = self.heuristic_model(X)
+                        lm = environment(lm, *self.args, **self.kwargs)
+                        solve(lm)
+                    recording = self.track_history and not self.history_recorded_by_implementor and lm.features["agent_status"] == 'active'
+                    if recording and self.interface == "feloopy":
+                        self.history.record_stats(lm.current_min, lm.current_max, lm.current_ave, lm.current_std)
+                    elif recording and lm.features['vectorized'] and self.interface != 'pymoo':
+                        self.history.record(lm.sing_result)
+                    elif recording:
+                        self.history.record(lm.current_max)
                     return lm[X]
                 
                 self.em = Implement(instance)
+                self.em.history = self.history
+                self.pool_environment = environment
+                self.attach_fitness_cache()
 
             else:
 
-                if self.track_history:
+                def solve(m):
+                    m.sol(self.directions, self.solver, self.options, obj_id='all')
 
-                    self.lb_record = []
-                    self.ub_record = []
-                    if self.interface == "feloopy":
-                        self.ave_record = []
-                        self.std_record = []
+                if self.compiled:
+                    self.compiled_environment = CompiledEnvironment(self.heuristic_model, self.environment, self.args, self.kwargs, solve, self.directions)
 
                 def instance(X):
-                    m = model(self.name,self.method, self.interface,X, no_agents=self.options.get("pop_size", 50))
-                    m = self.environment(m, *self.args, **self.kwargs)
-                    m.sol(self.directions, self.solver, self.options, obj_id='all')
-                    if self.track_history and m.features["agent_status"] != 'feasibility_check':
-                        self.lb_record.append(m.current_min)
-                        self.ub_record.append(m.current_max)
+                    if self.compiled and X[0] == 'active':
+                        m = self.compiled_environment(X)
+                    else:
+                        m = self.heuristic_model(X)
+                        m = self.environment(m, *self.args, **self.kwargs)
+                        solve(m)
+                    if self.track_history and m.features["agent_status"] == 'active':
                         if self.interface == "feloopy":
-                            self.ave_record.append(m.current_ave)
-                            self.std_record.append(m.current_std)
+                            self.history.record_stats(m.current_min, m.current_max, m.current_ave, m.current_std)
+                        elif self.interface == "pymoo":
+                            self.history.record_stats(m.current_min, m.current_max, np.nan, np.nan)
+                        else:
+                            self.history.record(m.current_max)
                     return m[X]
                 self.em = implement(instance)
+                self.pool_environment = environment
+                self.attach_fitness_cache()
 
         if self.method in ["madm"]:
             self.em = madm(self.solver,self.name, self.interface)
@@ -5299,10 +5352,119 @@ class search(model,Implement):
         if not verbose:
             end_progress(success_message="√ Generated")
 
+    def attach_evaluation_pool(self, environment):
+        """
+        Attaches a thread or process pool to the implementor, holding the environment and its dataset, to evaluate population rows in parallel.
+        The pool persists over the epochs and episodes of one run (see ``run``).
+        """
+
+        if self.evaluation_backend in [None, "serial"]:
+            return
+
+        validate_string(
+            label="evaluation_backend",
+            list_of_allowed_values=["serial", "thread", "process"],
+            input_string=self.evaluation_backend,
+            required=True)
+
+        evaluator = EnvironmentEvaluator(environment, self.args, self.kwargs, self.name, self.method, self.interface, list(self.directions), self.solver, self.options, self.compiled, self.penalty_aggregator)
+        self.em.evaluation_pool = EvaluationPool(evaluator, self.evaluation_backend, self.evaluation_workers, self.evaluation_chunk_size)
+
+        if self.track_history and len(self.directions) == 1:
+            self.em.evaluation_recorder = self.record_history
+
+    def release_evaluation_pool(self):
+        """
+        Shuts down the evaluation pool of the implementor, if any, along with its workers.
+        """
+
+        em = getattr(self, 'em', None)
+        if isinstance(em, Implement):
+            em.close_evaluation_pool()
+
+    def attach_fitness_cache(self):
+        """
+        Attaches a bounded LRU cache of fitness values to the implementor, keyed by the decoded values of the variables, so that agents decoding to an already evaluated solution are not evaluated again.
+        """
+
+        if not self.fitness_cache_size:
+            return
+
+        maxsize = 4096 if self.fitness_cache_size is True else int(self.fitness_cache_size)
+        self.em.fitness_cache = FitnessCache(self.em.VariablesSpread, self.em.VariablesType, self.em.VariablesBound, maxsize)
+
+        if self.track_history and len(self.directions) == 1:
+            self.em.evaluation_recorder = self.record_history
+            self.history_recorded_by_implementor = True
+
+    def record_history(self, result):
+
+        self.history.record(result[:, -1] if self.interface == "feloopy" else np.ravel(result))
+
+    def summarize_history(self):
+        '''
+        Sets the per-epoch convergence statistics (best maximum and minimum so far, middle, range, average and standard deviation of the rewards, one list per objective for multi-objective models) and the stagnation from the history recorder.
+        '''
+
+        self.history.flush()
+        summary = self.history.summary()
+        if summary is None:
+            return
+
+        for key, value in summary.items():
+            if key == 'stagnation':
+                self.stagnation = value
+            elif self.number_of_objectives == 1:
+                setattr(self, key, value[:, 0])
+            else:
+                setattr(self, key, value.T)
+
+        self.final_min = self.best_min[-1]
+        self.final_max = self.best_max[-1]
+
+    def heuristic_model(self, X):
+        """
+        Returns the model on which the environment is evaluated for the agent properties X.
+
+        In compiled mode, the model is built once for the first active agent and then reused as a lightweight shell. The active agents are evaluated by replaying
+        the traced objective and constraint expressions on this shell (see ``CompiledEnvironment``), and the environment only runs on it when it cannot be traced.
+        """
+
+        if X[0] == 'idle':
+            lm = model(method=self.method, name=self.name, interface=self.interface, agent=X, no_agents=self.options.get("pop_size", 50))
+            if self.options.get("batch_size"):
+                lm.features['vectorized'] = True
+            return lm
+
+        if not self.compiled:
+            lm = model(method=self.method, name=self.name, interface=self.interface, agent=X, no_agents=self.options.get("pop_size", 50))
+            lm.penalty_aggregator = self.penalty_aggregator
+            return lm
+
+        if self.heuristic_shell is None:
+            self.heuristic_shell = model(method=self.method, name=self.name, interface=self.interface, agent=X, no_agents=self.options.get("pop_size", 50))
+            self.heuristic_shell.penalty_aggregator = self.penalty_aggregator
+            return self.heuristic_shell
+
+        return self.heuristic_shell.load_agent(X)
+
     def healthy(self):
         return self.em.healthy()
     
     def run(self, verbose):
+        """
+        Solves the generated environment. The evaluation pool of a heuristic search is created for the run and shut down when it ends, even if it fails.
+        """
+
+        if self.method == "heuristic":
+            self.attach_evaluation_pool(self.pool_environment)
+
+        try:
+            self.run_environment(verbose)
+        finally:
+            self.release_evaluation_pool()
+
+    def run_environment(self, verbose):
 
         if not verbose:
             start_progress(message="Searching...", spinner="dots")
@@ -5320,79 +5482,10 @@ class search(model,Implement):
                         
                 elif self.method == "heuristic":
                     
-                    self.em.sol(penalty_coefficient=self.penalty_coefficient, number_of_times=self.repeat,show_log=verbose)
+                    self.em.sol(penalty_coefficient=self.penalty_coefficient, number_of_times=self.repeat,show_log=verbose, n_jobs=self.episode_jobs, seed=self.episode_seed)
                     
                     if self.track_history:
-
-                        if self.interface in ['mealpy', 'niapy', 'pygad', 'scipy']: 
-
-                            self.best_max = [0] * (self.options["epoch"] - 1)
-                            self.best_min = [0] * (self.options["epoch"] - 1)
-                            self.middle = [0] * (self.options["epoch"] - 1)
-                            self.range = [0] * (self.options["epoch"] - 1)
-                            self.average = [0] * (self.options["epoch"] - 1)
-                            self.std = [0] * (self.options["epoch"] - 1)
-                            
-                            for i in range(1, self.options["epoch"]):
-                                pop_fit_per_epoch = self.ub_record[i * self.options["pop_size"]:(i + 1) * self.options["pop_size"]]
-                                max_current = np.max(pop_fit_per_epoch)
-                                min_current = np.min(pop_fit_per_epoch)
-                                ave_current = np.mean(pop_fit_per_epoch)
-                                std_current = np.std(pop_fit_per_epoch)
-
-                                if i == 1:
-                                    self.best_max[i - 1] = max_current
-                                    self.best_min[i - 1] = min_current
-                                else:
-                                    self.best_max[i - 1] = max(max_current, self.best_max[i - 2])
-                                    self.best_min[i - 1] = min(min_current, self.best_min[i - 2])
-
-                                self.average[i - 1] = ave_current
-                                self.std[i - 1] = std_current
-                                self.middle[i - 1] = (self.best_max[i - 1] + self.best_min[i - 1]) / 2
-                                self.range[i - 1] = self.best_max[i - 1] - self.best_min[i - 1]
-
-                            self.final_min = self.best_min[-1]
-                            self.final_max = self.best_max[-1]
-                            self.lb_for_min = np.array(self.best_max) - self.range[-1]
-                            self.ub_for_max = np.array(self.best_min) + self.range[-1]
-
-                            self.stagnation = np.sum(np.array(self.ub_for_max) - np.array(self.best_max) <= 1e-6) / self.options["epoch"]
-                        
-                        else:
-
-                            self.best_max = [0] * (self.options["epoch"] - 1)
-                            self.best_min = [0] * (self.options["epoch"] - 1)
-                            self.middle = [0] * (self.options["epoch"] - 1)
-                            self.range = [0] * (self.options["epoch"] - 1)
-                            self.average = [0] * (self.options["epoch"] - 1)
-                            self.std = [0] * (self.options["epoch"] - 1)
-                            
-                            for i in range(1, self.options["epoch"]):
-
-                                min_per_epoch = self.lb_record[i]
-                                max_per_epoch = self.ub_record[i]
-                                ave_per_epoch = self.ave_record[i]
-                                std_per_epoch = self.std_record[i]
-
-                                if i == 1:
-                                    self.best_max[i - 1] = max_per_epoch
-                                    self.best_min[i - 1] = min_per_epoch
-                                else:
-                                    self.best_max[i - 1] = max(max_per_epoch, self.best_max[i - 2])
-                                    self.best_min[i - 1] = min(min_per_epoch, self.best_min[i - 2])
-
-                                self.average[i - 1] = ave_per_epoch
-                                self.std[i - 1] = std_per_epoch
-                                self.middle[i - 1] = (self.best_max[i - 1] + self.best_min[i - 1]) / 2
-                                self.range[i - 1] = self.best_max[i - 1] - self.best_min[i - 1]
-
-                            self.final_min = self.best_min[-1]
-                            self.final_max = self.best_max[-1]
-                            self.lb_for_min = np.array(self.best_max) - self.range[-1]
-                            self.ub_for_max = np.array(self.best_min) + self.range[-1]
-
-                            self.stagnation = np.sum(np.array(self.ub_for_max) - np.array(self.best_max) <= 1e-6) / self.options["epoch"]
+                        self.summarize_history()
                     
             else:   
                 if self.method in ["exact", "convex", "constraint", "uncertain"]:
@@ -5402,10 +5495,14 @@ class search(model,Implement):
                     except:
                         from .algorithms.exact.multiobjective import sol_multi
                         
-                    def instance():
-                        self.em = model(method=self.method, name=self.name, interface=self.interface)
-                        self.em = self.environment(self.em, *self.args, **self.kwargs)
-                        return self.em
+                    builder = ModelBuilder(self.environment, self.args, self.kwargs, method=self.method, name=self.name, interface=self.interface, bulk_variables=self.bulk_variables, variable_names=self.variable_names)
+
+                    if self.options.get('n_jobs', 1) not in [None, 1]:
+                        instance = builder
+                    else:
+                        def instance():
+                            self.em = builder()
+                            return self.em
                     
                     self.time_solve_begin = timeit.default_timer()
                     self.result = sol_multi(instance=instance,
@@ -5419,7 +5516,8 @@ class search(model,Implement):
                                             time_limit=self.time_limit, 
                                             cpu_threads=self.cpu_threads,
                                             absolute_gap=self.absolute_gap, 
-                                            relative_gap=self.relative_gap
+                                            relative_gap=self.relative_gap,
+                                            interface_name=self.interface
                                             )
                     self.time_solve_end = timeit.default_timer()
 
@@ -5428,47 +5526,7 @@ class search(model,Implement):
                     self.em.solve(show_log=verbose, penalty_coefficient=self.penalty_coefficient)
 
                     if self.track_history:
-
-                        self.best_max = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.best_min = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.middle   = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.range    = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.average  = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.std      = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.lb_for_min = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-                        self.ub_for_max  = [[0] * (self.options["epoch"] - 1)]*self.number_of_objectives
-
-                        for i in range(1, self.options["epoch"]):
-
-                            min_per_epoch = self.lb_record[i]
-                            max_per_epoch = self.ub_record[i]
-                            ave_per_epoch = self.ave_record[i]
-                            std_per_epoch = self.std_record[i]
-
-                            if i == 1:
-                                for j in range(self.number_of_objectives):
-                                    self.best_max[j][i - 1] = max_per_epoch[j]
-                                    self.best_min[j][i - 1] = min_per_epoch[j]
-                            else:
-                                for j in range(self.number_of_objectives):
-                                    self.best_max[j][i - 1] = max(max_per_epoch[j], self.best_max[j][i - 2])
-                                    self.best_min[j][i - 1] = min(min_per_epoch[j], self.best_min[j][i - 2])
-                            
-                            for j in range(self.number_of_objectives):
-                                self.average[j][i - 1] = ave_per_epoch[j]
-                                self.std[j][i - 1] = std_per_epoch[j]
-                                self.middle[j][i - 1] = (self.best_max[j][i - 1] + self.best_min[j][i - 1]) / 2
-                                self.range[j][i - 1] = self.best_max[j][i - 1] - self.best_min[j][i - 1]
-                        
-                        for i in range(1, self.options["epoch"]):
-                            for j in range(self.number_of_objectives):
-                                self.lb_for_min[j][i - 1] = np.array(self.best_max[j][i-1]) - self.range[j][-1]
-                                self.ub_for_max[j][i - 1] = np.array(self.best_min[j][i-1]) + self.range[j][-1]
-
-                        self.final_min = self.best_min[-1]
-                        self.final_max = self.best_max[-1]
-
-                        self.stagnation = np.sum(np.array(self.ub_for_max) - np.array(self.best_max) <= 1e-6) / self.options["epoch"]
+                        self.summarize_history()
 
         if self.method == "madm":
             self.time_solve_begin = timeit.default_timer()
@@ -5640,11 +5698,20 @@ class search(model,Implement):
     def get_slack(self,input):
         return self.em.get_slack(input)
 
-    def sensitivity(self, dataset, parameter_names, parameter_values, environment=None,control_scenario=0):
+    def get_duals(self,family=None):
+        return self.em.get_duals(family)
+
+    def get_slacks(self,family=None):
+        return self.em.get_slacks(family)
+
+    def sensitivity(self, dataset, parameter_names, parameter_values, environment=None,control_scenario=0, n_jobs=None, backend=None):
         
         from .operators.metrics import compute_similarity
         import copy
 
+        n_jobs = self.sensitivity_jobs if n_jobs is None else n_jobs
+        backend = self.sensitivity_backend if backend is None else backend
+
         self.sensitivity_parameter_names = parameter_names
         self.sensitivity_parameter_values = parameter_values
         result_dataset = data_toolkit(key=0, measure=False)
@@ -5663,6 +5730,12 @@ class search(model,Implement):
             
             if number_of_parameters != number_of_names:
                 raise ValueError("Number of parameter names and values do not match. It should be like ['a','b','c'] and [list_values_of_a (e.g., [1,2,3]), list_values_of_b (e.g., [1,2,3]), list_values_of_c (e.g., [1,2,3])]")
+
+            validate_string(
+                label="backend",
+                list_of_allowed_values=["thread", "process"],
+                input_string=backend,
+                required=True)
         
             sensitivity_keys = [
                 "sensitivtiy_values",
@@ -5670,65 +5743,49 @@ class search(model,Implement):
                 "sensitivtiy_of_cpt_to",
                 "sensitivtiy_of_objectives_to",
                 "sensitivtiy_of_solutions_to",
+                "sensitivtiy_of_errors_to",
             ]
+
+            scenarios = [(parameter_name, parameter_value) for parameter_name in parameter_names for parameter_value in parameter_values[parameter_names.index(parameter_name)]]
             
             self.sensitivity_begin_timer = timeit.default_timer()
+
+            outcomes = [None] * len(scenarios)
+            self.sensitivity_modes = {parameter_name: "rebuild" for parameter_name in parameter_names}
+            for parameter_name in self.mutable_params:
+                if parameter_name in parameter_names:
+                    positions = [i for i, scenario in enumerate(scenarios) if scenario[0] == parameter_name]
+                    try:
+                        incremental_outcomes = self.run_incremental_scenarios(environment, dataset, parameter_name, parameter_values[parameter_names.index(parameter_name)], control_scenario)
+                    except Exception as e:
+                        warnings.warn(f"Mutable parameter '{parameter_name}' is analyzed by rebuilding the model for each scenario: {e}")
+                        continue
+                    for i, outcome in zip(positions, incremental_outcomes):
+                        outcomes[i] = outcome
+                    self.sensitivity_modes[parameter_name] = "incremental"
+
+            remaining = [i for i in range(len(scenarios)) if outcomes[i] is None]
+            if n_jobs == 1:
+                for i in remaining:
+                    outcomes[i] = self.run_scenario(environment, dataset, *scenarios[i])
+            elif len(remaining) != 0:
+                state = {key: value for key, value in self.__dict__.items() if key not in ['em', 'heuristic_shell', 'compiled_environment', 'sensitivity_data', 'profiler']}
+                state['evaluation_backend'] = "serial"
+                for i, outcome in zip(remaining, run_scenarios(state, environment, dataset, [scenarios[i] for i in remaining], n_jobs, backend)):
+                    outcomes[i] = outcome
+
             for parameter_name in parameter_names:
                 for key in sensitivity_keys:
                     result_dataset.store(f"{key}_{parameter_name}", [])
-                previous_parameter_value = copy.deepcopy(dataset.data[parameter_name])
-                for parameter_value in parameter_values[parameter_names.index(parameter_name)]:
-                    result_dataset.data[f"sensitivtiy_values_{parameter_name}"].append(parameter_value)
-                    dataset.data[parameter_name] = parameter_value
-                    
-                    
-                    
-                    self.create_env(environment,verbose=self.verbose)
-                    
-                    
-                    with suppress(Exception):
-                        self.run(verbose=self.verbose)
-                        
-                    if self.method!='madm':
-                        if self.number_of_objectives==1:
-                            
-                            #Single-objective case extraction
-                            self.sensitivity_solutions = {}
-                            if self.method != "heuristic":
-                                for typ, var in self.em.features['variables'].keys():
-                                    self.sensitivity_solutions[var] = self.em.get_numpy_var(var) if self.em.healthy() else None
-                            
-                            else:
-                                for j in self.em.VariablesDim.keys():
-                                    self.sensitivity_solutions[j]=self.em.get_numpy_var(j) if self.em.healthy() else None
-                            
-                            self.sensitivity_objective_values = np.array([[self.em.get_obj()]])[0][0] if self.em.healthy() else None
-                            self.sensitivity_num_objective_values = 1
-                            self.sensitivity_cpt = self.em.get_time()
-                        
-                        else:
-                            
-                            #Multi-objective case extraction
-                            if self.method != "heuristic":
-                                self.sensitivity_solutions = self.result[3] if self.em.healthy() else None
-                                self.sensitivity_objective_values = self.result[0] if self.em.healthy() else np.array([[None for i in range(self.directions)]])
-                                self.sensitivity_num_objective_values = self.objective_values.shape[0]
-                                self.sensitivity_cpt = self.time_solve_end - self.time_solve_begin        
-                            else:
-                                self.sensitivity_num_objective_values = self.em.get_obj().shape[0] if self.em.healthy()  else 1
-                                self.sensitivity_solutions  = {i: {} for i in range(self.num_objective_values)}
-                                for i in range(self.sensitivity_num_objective_values):
-                                    for j in self.em.VariablesDim.keys():
-                                        self.sensitivity_solutions[i][j]=self.em.get_numpy_var(j) if self.em.healthy() else None
-                                self.sensitivity_objective_values = self.em.get_obj() if self.em.healthy() else None
-                                self.sensitivity_num_objective_values = self.objective_values.shape[0]
-                                self.sensitivity_cpt = self.em.get_time()
-                    result_dataset.data[f"sensitivtiy_of_health_to_{parameter_name}"].append(self.em.healthy())
-                    result_dataset.data[f"sensitivtiy_of_cpt_to_{parameter_name}"].append(self.sensitivity_cpt)
-                    result_dataset.data[f"sensitivtiy_of_objectives_to_{parameter_name}"].append(self.sensitivity_objective_values)
-                    result_dataset.data[f"sensitivtiy_of_solutions_to_{parameter_name}"].append(self.sensitivity_solutions)
-  
-                dataset.data[parameter_name] = previous_parameter_value
+
+            for (parameter_name, parameter_value), outcome in zip(scenarios, outcomes):
+                result_dataset.data[f"sensitivtiy_values_{parameter_name}"].append(parameter_value)
+                result_dataset.data[f"sensitivtiy_of_health_to_{parameter_name}"].append(outcome['health'])
+                result_dataset.data[f"sensitivtiy_of_cpt_to_{parameter_name}"].append(outcome['cpt'])
+                result_dataset.data[f"sensitivtiy_of_objectives_to_{parameter_name}"].append(outcome['objectives'])
+                result_dataset.data[f"sensitivtiy_of_solutions_to_{parameter_name}"].append(outcome['solutions'])
+                result_dataset.data[f"sensitivtiy_of_errors_to_{parameter_name}"].append(outcome['error'])
+
             self.sensitivity_end_timer = timeit.default_timer()         
             
             if self.number_of_objectives==1:
@@ -5738,6 +5795,135 @@ class search(model,Implement):
             self.sensitivity_data = copy.deepcopy(result_dataset.data)
 
             return self.sensitivity_data
+
+    def run_scenario(self, environment, dataset, parameter_name, parameter_value):
+        """
+        Regenerates and solves the model with one parameter of the dataset overridden, and returns the health, solution time, objective values, solutions and error (if any) of the scenario.
+        """
+
+        previous_parameter_value = dataset.data[parameter_name]
+        dataset.data[parameter_name] = parameter_value
+        error = None
+        start = timeit.default_timer()
+
+        try:
+            self.create_env(environment,verbose=self.verbose)
+            self.run(verbose=self.verbose)
+        except Exception as e:
+            error = e
+
+        try:
+            outcome = self.scenario_outcome()
+            outcome['error'] = None if error is None else f"{type(error).__name__}: {error}"
+        except Exception as e:
+            outcome = failed_scenario(error if error is not None else e, timeit.default_timer() - start)
+        finally:
+            dataset.data[parameter_name] = previous_parameter_value
+
+        return outcome
+
+    def run_incremental_scenarios(self, environment, dataset, parameter_name, parameter_values, control_scenario=0):
+        """
+        Runs the scenarios of a mutable parameter on a single live model, instead of rebuilding the environment for each scenario.
+
+        Where the parameter lands in the model data is recorded from a few builds at perturbed values (see ``ParameterLanding``). Each value
+        is then applied directly to the solver object, which is re-solved starting from the solution of the control scenario.
+        """
+
+        from .generators import solution_generator
+
+        if self.method != "exact" or self.number_of_objectives != 1:
+            raise ValueError("Incremental sensitivity analysis is only available for single-objective exact models.")
+        if not solution_generator.supports_incremental(self.interface):
+            raise ValueError(f"Incremental sensitivity analysis is not supported by '{self.interface}' (use one of {solution_generator.incremental_interfaces}).")
+
+        previous_parameter_value = dataset.data[parameter_name]
+        if np.size(previous_parameter_value) + 2 > len(parameter_values):
+            raise ValueError("Recording where the parameter lands takes more builds than there are scenarios.")
+
+        builder = ModelBuilder(environment, self.args, self.kwargs, method=self.method, name=self.name, interface=self.interface, bulk_variables=self.bulk_variables, variable_names=self.variable_names)
+
+        def build(value):
+            dataset.data[parameter_name] = value
+            probe = builder()
+            probe.features['objective_being_optimized'] = 0
+            probe.features['model_object_before_solve'] = probe.model
+            return solution_generator.extract_linear_data(probe.features)
+
+        try:
+            landing = ParameterLanding(build, previous_parameter_value)
+            dataset.data[parameter_name] = previous_parameter_value
+            live = builder()
+            live.sol(directions=list(self.directions), solver=self.solver, show_log=self.verbose, time_limit=self.time_limit, cpu_threads=self.cpu_threads, absolute_gap=self.absolute_gap, relative_gap=self.relative_gap)
+        finally:
+            dataset.data[parameter_name] = previous_parameter_value
+
+        current = landing.base
+        warm_start = None
+        outcomes = [None] * len(parameter_values)
+        order = [control_scenario] + [i for i in range(len(parameter_values)) if i != control_scenario] if control_scenario < len(parameter_values) else range(len(parameter_values))
+
+        for i in order:
+            start = timeit.default_timer()
+            try:
+                target = landing.predict(parameter_values[i])
+                changes = landing.changes(current, target)
+                current = None
+                live.solution = solution_generator.update_solution(live.features, changes, warm_start)
+                current = target
+                healthy = live.healthy()
+                outcomes[i] = {
+                    'health': healthy,
+                    'cpt': live.get_time(),
+                    'objectives': np.array([[live.get_obj()]])[0][0] if healthy else None,
+                    'solutions': {var: live.get_numpy_var(var) if healthy else None for typ, var in live.features['variables'].keys()},
+                    'error': None,
+                }
+                if i == control_scenario and healthy:
+                    warm_start = solution_generator.get_warm_start(live.features)
+            except Exception as e:
+                outcomes[i] = failed_scenario(e, timeit.default_timer() - start)
+
+        return outcomes
+
+    def scenario_outcome(self):
+
+        if self.method!='madm':
+            if self.number_of_objectives==1:
+                
+                #Single-objective case extraction
+                self.sensitivity_solutions = {}
+                if self.method != "heuristic":
+                    for typ, var in self.em.features['variables'].keys():
+                        self.sensitivity_solutions[var] = self.em.get_numpy_var(var) if self.em.healthy() else None
+                
+                else:
+                    for j in self.em.VariablesDim.keys():
+                        self.sensitivity_solutions[j]=self.em.get_numpy_var(j) if self.em.healthy() else None
+                
+                self.sensitivity_objective_values = np.array([[self.em.get_obj()]])[0][0] if self.em.healthy() else None
+                self.sensitivity_num_objective_values = 1
+                self.sensitivity_cpt = self.em.get_time()
+            
+            else:
+                
+                #Multi-objective case extraction
+                if self.method != "heuristic":
+                    self.sensitivity_solutions = self.result[3] if self.em.healthy() else None
+                    self.sensitivity_objective_values = self.result[0] if self.em.healthy() else np.array([[None for i in range(len(self.directions))]])
+                    self.sensitivity_num_objective_values = self.objective_values.shape[0]
+                    self.sensitivity_cpt = self.time_solve_end - self.time_solve_begin        
+                else:
+                    self.sensitivity_num_objective_values = self.em.get_obj().shape[0] if self.em.healthy()  else 1
+                    self.sensitivity_solutions  = {i: {} for i in range(self.num_objective_values)}
+                    for i in range(self.sensitivity_num_objective_values):
+                        for j in self.em.VariablesDim.keys():
+                            self.sensitivity_solutions[i][j]=self.em.get_numpy_var(j) if self.em.healthy() else None
+                    self.sensitivity_objective_values = self.em.get_obj() if self.em.healthy() else None
+                    self.sensitivity_num_objective_values = self.objective_values.shape[0]
+                    self.sensitivity_cpt = self.em.get_time()
+
+        return {'health': self.em.healthy(), 'cpt': self.sensitivity_cpt, 'objectives': self.sensitivity_objective_values, 'solutions': self.sensitivity_solutions}
         
     def is_value_unreliable(self, data, bounds, features, vartype):
         if 'variables' not in features:
@@ -5832,58 +6018,83 @@ class search(model,Implement):
                         for val in flatten_value(v))
         return False
 
-    def benchmark(self, environment=None, algorithms=None, repeat=1, show_report=False):
+    def benchmark(self, environment=None, algorithms=None, repeat=1, show_report=False, timeout=None, n_jobs=None, save=None, seed=None):
+        """
+        Runs each (interface, solver) pair of the benchmark, ``repeat`` times, in its own subprocess and stores the summary in ``ben_results`` and the record of each run in ``ben_runs``.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Wall-clock time limit of each run in seconds; runs exceeding it are terminated and recorded as 'timeout'.
+        n_jobs : int, optional
+            Number of runs executed concurrently (all available cores if -1).
+        save : str, optional
+            Path of a '.json' or '.csv' file to which the record of each run is written.
+        seed : int, optional
+            Seed from which the random generators of the runs are spawned (independent runs if None).
+        """
 
         if environment is None:
             environment = self.environment        
+
+        timeout = self.benchmark_timeout if timeout is None else timeout
+        n_jobs = self.benchmark_jobs if n_jobs is None else n_jobs
         
         if algorithms is None or algorithms == "all":
             if self.method=="exact":
                 algorithms=EXACT_ALGORITHMS
             if self.method=="heuristic":
                 algorithms=HEURISTIC_ALGORITHMS
+
+        runs = [(interface, solver) for interface, solver in algorithms for _ in range(repeat)]
+        state = {key: value for key, value in self.__dict__.items() if key not in ['em', 'heuristic_shell', 'compiled_environment', 'sensitivity_data', 'ben_results', 'ben_runs', 'profiler']}
+        state['evaluation_backend'] = "serial"
+
+        with progress_bar(range(len(runs)), unit="run", description="Benchmarking") as bar:
+            records = run_benchmarks(state, environment, runs, n_jobs, timeout, callback=lambda position, record: bar.update(), seed=seed)
+
+        for (interface, solver), record in zip(runs, records):
+            record['interface'] = interface
+            record['solver'] = solver
+        self.ben_runs = pd.DataFrame(records, columns=['interface', 'solver', 'status', 'objective', 'mgt', 'solve_time', 'wall_time', 'peak_rss', 'error'])
         
         columns = pd.MultiIndex.from_product([['time', 'obj'], ['ave', 'std', 'min', 'max']],names=['metric', 'stat'])
         df = pd.DataFrame(columns=columns,index=[i+1 for i in range(len(algorithms))])
-        counter = 0
-        for interface, solver in progress_bar(algorithms, unit="alg", description="Benchmarking"):
-            objs = []
-            times = []
-            try:
-                for _ in range(repeat):
-                    self.create_env(environment, verbose=self.verbose)
-                    with suppress(Exception):
-                        self.run(verbose=self.verbose)
-                    objs.append(self.em.get_obj())
-                    times.append(self.em.get_time())
-                    
-                df.loc[counter+1, ('time', 'ave')] = pd.Series(times).mean()
-                df.loc[counter+1, ('time', 'std')] = pd.Series(times).std()
-                df.loc[counter+1, ('time', 'min')] = pd.Series(times).min()
-                df.loc[counter+1, ('time', 'max')] = pd.Series(times).max()
-                df.loc[counter+1, ('obj', 'ave')] = pd.Series(objs).mean()
-                df.loc[counter+1, ('obj', 'std')] = pd.Series(objs).std()
-                df.loc[counter+1, ('obj', 'min')] = pd.Series(objs).min()
-                df.loc[counter+1, ('obj', 'max')] = pd.Series(objs).max()
-                df.loc[counter+1, ('interface', '')] = interface
-                df.loc[counter+1, ('solver', '')] = solver
-                
-            except:
-                
-                df.loc[counter+1, ('interface', '')] = interface
-                df.loc[counter+1, ('solver', '')] = solver        
-                pass
-            
-            os.system('cls' if os.name == 'nt' else 'clear')
-            counter += 1
+        for counter, (interface, solver) in enumerate(algorithms):
+            group = self.ben_runs.iloc[counter*repeat:(counter+1)*repeat]
+            succeeded = group[group['status'] == 'ok']
+            times = pd.Series(succeeded['solve_time'], dtype=float)
+            objs = pd.Series([objective if np.ndim(objective) == 0 else np.nan for objective in succeeded['objective']], dtype=float)
+
+            df.loc[counter+1, ('time', 'ave')] = times.mean()
+            df.loc[counter+1, ('time', 'std')] = times.std()
+            df.loc[counter+1, ('time', 'min')] = times.min()
+            df.loc[counter+1, ('time', 'max')] = times.max()
+            df.loc[counter+1, ('obj', 'ave')] = objs.mean()
+            df.loc[counter+1, ('obj', 'std')] = objs.std()
+            df.loc[counter+1, ('obj', 'min')] = objs.min()
+            df.loc[counter+1, ('obj', 'max')] = objs.max()
+            df.loc[counter+1, ('mgt', 'ave')] = pd.Series(succeeded['mgt'], dtype=float).mean()
+            df.loc[counter+1, ('wall', 'ave')] = pd.Series(group['wall_time'], dtype=float).mean()
+            df.loc[counter+1, ('rss', 'max')] = pd.Series(group['peak_rss'], dtype=float).max()
+            df.loc[counter+1, ('runs', 'ok')] = len(succeeded)
+            df.loc[counter+1, ('runs', 'failed')] = len(group) - len(succeeded)
+            df.loc[counter+1, ('interface', '')] = interface
+            df.loc[counter+1, ('solver', '')] = solver
+            df.loc[counter+1, ('failure', '')] = next((f"{status}: {error}" for status, error in zip(group['status'], group['error']) if status != 'ok'), None)
         
-        df_cleaned = df.dropna(subset=[('time', 'ave'), ('obj', 'ave')]).reset_index(drop=True)
-        df_sorted = df_cleaned.sort_values(by=('time', 'ave'))
+        df_sorted = df.sort_values(by=[('runs', 'ok'), ('time', 'ave')], ascending=[False, True], na_position='last')
         df_sorted = df_sorted.reset_index(drop=True)
         
         if show_report:
             print(df_sorted.to_string())
 
+        if save:
+            if save.endswith('.json'):
+                self.ben_runs.to_json(save, orient='records', indent=4)
+            else:
+                self.ben_runs.to_csv(save, index=False)
+
         self.ben_results = df_sorted
 
         return self.ben_results
@@ -6201,11 +6412,24 @@ class search(model,Implement):
                     box.row(left="STG", right=format_string(self.stagnation,ensure_length=True))
                 except:
                     pass
+
+            if getattr(self.em, "fitness_cache", None) is not None:
+                cache = self.em.fitness_cache
+                box.row(left="FCH", right=' '.join(format_string(j,ensure_length=True) for j in [cache.hits, cache.misses, cache.hit_rate]))
+
+            termination = self.termination
+            if termination is not None:
+                box.row(left="TRM", right=' '.join(format_string(j,ensure_length=True) for j in [termination.reason, termination.epochs, termination.evaluations]))
+
+            violations = self.constraint_violations
+            if violations is not None:
+                for label, rate in violations.head(5).items():
+                    box.row(left=f"VIO {label}", right=format_string(rate,ensure_length=True))
                 
             if self.number_of_objectives==1:
                 total_var_count = (
                     self.em.features.get("total_variable_counter", [0, 0])[1]
-                    if hasattr(self.em, "features") and isinstance(self.em.features, dict)
+                    if hasattr(self.em, "features") and isinstance(self.em.features, (dict, ModelState))
                     else 0
                 )
                 total_density = self.get_density()
@@ -6269,6 +6493,21 @@ class search(model,Implement):
             box.empty()
             box.bottom()
 
+    def report_profile(self, width=90, style=1):
+        box = report(width=width, style=style)
+        profile = self.profile
+        if profile is not None:
+            box.top(left="Profile", right=f"{len(self.profiler.events)} events")
+            box.empty()
+            for phase, row in profile.iterrows():
+                box.row(left=phase, center=f"{int(row['calls'])} calls {row['share']*100:.1f}%", right=format_time_and_microseconds(row['seconds']))
+            if len(self.profiler.counters) != 0:
+                box.empty()
+                for counter, value in self.profiler.counters.items():
+                    box.row(left=counter, right=format_string(value))
+            box.empty()
+            box.bottom()
+
     def report_sensitivity(self, width=90, style=1, skip=False, show_elements=False):
         box = report(width=width, style=style)
         # Sensitivity report
@@ -6380,6 +6619,7 @@ class search(model,Implement):
         self.report_decision(style=style, key_vars=self.key_vars, show_elements=show_elements, width=width, skip=skip)
         self.report_sensitivity(style=style)
         self.report_benchmark(style=style)
+        self.report_profile(style=style)
 
     def save_io(self,name,extra=None):
         dt = data_toolkit(key=0)
@@ -6419,33 +6659,54 @@ class search(model,Implement):
         return total_nonzeros
 
 class parallel_search:
-    def __init__(self, configurations, parallelization_method="thread", max_workers=None):
+    """
+    Runs several searches, one per configuration, in a thread or process pool and keeps their results in the order of the configurations.
+
+    In process mode, the large numpy arrays in the configurations (given directly or held by datasets and dictionaries, whether they are passed
+    as ``dataset`` or as keyword arguments of the environment) are broadcast once through shared memory and attached
+    zero-copy (read-only) by the workers, which return a compact record (status, objective, solutions, timing and error) of each search
+    instead of the search object. In thread mode, the search objects are returned unless ``compact`` is True.
+    """
+
+    def __init__(self, configurations, parallelization_method="thread", max_workers=None, progress=None, compact=None, min_shared_bytes=2**20):
         self.configurations = configurations
         self.method = parallelization_method
         self.max_workers = max_workers
+        self.progress = progress
+        self.compact = (parallelization_method != "thread") if compact is None else compact
+        self.min_shared_bytes = min_shared_bytes
         self.results = []
         self.run_parallel_searches()
 
     def run_parallel_searches(self):
         if self.method == "thread":
-            executor_class = concurrent.futures.ThreadPoolExecutor
-        else:
-            executor_class = concurrent.futures.ProcessPoolExecutor
-
-        with executor_class(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(self._run_single_search, config) for config in self.configurations]
-            self.results = []
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
-                except Exception as e:
-                    result = f"Error occurred: {str(e)}"
-                self.results.append(result)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._run_single_search, config) for config in self.configurations]
+                return self._gather(futures)
+
+        values = [value for config in self.configurations for value in config.values()]
+        with SharedDataset(values, self.min_shared_bytes) as shared:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(run_search, shared.dumps(config)) for config in self.configurations]
+                return self._gather(futures)
+
+    def _gather(self, futures):
+        self.results = [None] * len(futures)
+        positions = {future: position for position, future in enumerate(futures)}
+        for future in concurrent.futures.as_completed(futures):
+            position = positions[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = f"Error occurred: {str(e)}"
+            self.results[position] = result
+            if self.progress:
+                self.progress(position, result)
         return self.results
 
     def _run_single_search(self, config):
         search_instance = search(**config)
-        return search_instance
+        return search_record(search_instance) if self.compact else search_instance
 
 class feloop_model(model):
     def __init__(self,name=None, agent=None):
@@ -1,14 +1,17 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
-def generate_model(total_variables, directions, solver_name, solver_options, lb, ub):
+from ...algorithms.heuristic.termination import termination_from_options
+
+def generate_model(total_variables, directions, solver_name, solver_options, lb, ub, groups=None):
+    termination = termination_from_options(solver_options)
     match solver_name:
         case 'hco':
             try:
                 from ...extras.algorithms.heuristic.HCO import HCO
             except ImportError:
                 from ...algorithms.heuristic.HCO import HCO
-            model_object = HCO(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), e=solver_options.get('elitism_number', 3), ac=solver_options.get('archive_cap', 100), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+            model_object = HCO(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), e=solver_options.get('elitism_number', 3), ac=solver_options.get('archive_cap', 100), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'gwo':
             try:
@@ -16,14 +19,14 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.GWO import GWO
             model_object = GWO(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get(
-                'pop_size', 50), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'pop_size', 50), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination, jit=solver_options.get('jit'))
 
         case 'ga':
             try:
                 from ...extras.algorithms.heuristic.GA import GA
             except ImportError:
                 from ...algorithms.heuristic.GA import GA
-            model_object = GA(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), sc=solver_options.get('selection', 1), mu=solver_options.get('mutation_rate', 0.02), cr=solver_options.get('crossover_rate', 0.7), sfl=solver_options.get('survival_lb', 0.4), sfu=solver_options.get('survival_ub', 0.6), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+            model_object = GA(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), sc=solver_options.get('selection', 1), mu=solver_options.get('mutation_rate', 0.02), cr=solver_options.get('crossover_rate', 0.7), sfl=solver_options.get('survival_lb', 0.4), sfu=solver_options.get('survival_ub', 0.6), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination, jit=solver_options.get('jit'))
 
         case 'dgwo':
             try:
@@ -31,14 +34,14 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.DGWO import GWO
             model_object = GWO(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get(
-                'pop_size', 50), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'pop_size', 50), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'dga':
             try:
                 from ...extras.algorithms.heuristic.DGA import GA
             except ImportError:
                 from ...algorithms.heuristic.DGA import GA
-            model_object = GA(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), sc=solver_options.get('selection', 1), mu=solver_options.get('mutation_rate', 0.02), cr=solver_options.get('crossover_rate', 0.7), sfl=solver_options.get('survival_lb', 0.4), sfu=solver_options.get('survival_ub', 0.6), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+            model_object = GA(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), sc=solver_options.get('selection', 1), mu=solver_options.get('mutation_rate', 0.02), cr=solver_options.get('crossover_rate', 0.7), sfl=solver_options.get('survival_lb', 0.4), sfu=solver_options.get('survival_ub', 0.6), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
 
         case 'de':
@@ -47,7 +50,7 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.DE import DE
             model_object = DE(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), mu=solver_options.get('mutation_rate', 0.02),
-                              cr=solver_options.get('crossover_rate', 0.7), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                              cr=solver_options.get('crossover_rate', 0.7), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination, jit=solver_options.get('jit'))
 
         case 'sa':
             try:
@@ -55,7 +58,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.SA import SA
             model_object = SA(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=1, cc=solver_options.get('cooling_cycles', 10), mt=solver_options.get(
-                'maximum_temperature', 1000),  ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'maximum_temperature', 1000), k=solver_options.get('neighbors', 1), ch=solver_options.get('chains', 1), tl=solver_options.get('temperature_ratio', 1e-2), groups=groups, mv=solver_options.get('moves'), sg=solver_options.get('move_scale', 0.1),
+                ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'bo':
             try:
@@ -63,7 +67,7 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.BO import BO
             model_object = BO(f=total_variables, d=directions, s=solver_options.get(
-                'epoch', 100), t=10, rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=10, ac=solver_options.get('archive_cap', 200), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
             
         case 'ts':
             try:
@@ -71,7 +75,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.TS import TS
             model_object = TS(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=1, c=solver_options.get(
-                'tabu_list_size', 10), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'tabu_list_size', 10), k=solver_options.get('neighbors', 10), groups=groups, mv=solver_options.get('moves'), sg=solver_options.get('move_scale', 0.1),
+                ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'pso':
             try:
@@ -79,7 +84,7 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.PSO import PSO
             model_object = PSO(f=total_variables, d=directions, s=solver_options.get('epoch', 100), t=solver_options.get('pop_size', 50), w=solver_options.get('velocity_weight', 0.8), c1=solver_options.get(
-                'p_best_weight', 0.1), c2=solver_options.get('g_best_weight', 0.1), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False))
+                'p_best_weight', 0.1), c2=solver_options.get('g_best_weight', 0.1), ac=solver_options.get('archive_cap', 50), rep=solver_options.get('episode', 1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'adam':
             try:
@@ -87,8 +92,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.adam import ADAM
             model_object = ADAM(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
-                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
+                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'nadam':
             try:
@@ -96,8 +101,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.nadam import NADAM
             model_object = NADAM(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
-                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
+                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'adamax':
             try:
@@ -105,8 +110,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.adamax import ADAMAX
             model_object = ADAMAX(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
-                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
+                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'adadelta':
             try:
@@ -114,8 +119,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.adadelta import ADADELTA
             model_object = ADADELTA(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), rh=solver_options.get(
-                'rho', 0.95), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), rh=solver_options.get(
+                'rho', 0.95), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
             
         case 'adamw':
             try:
@@ -123,8 +128,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.adam import ADAM
             model_object = ADAM(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
-                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), wd=solver_options.get('weight_decay', 0.01), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), b1=solver_options.get(
+                'beta_1', 0.9), b2=solver_options.get('beta_2', 0.999), wd=solver_options.get('weight_decay', 0.01), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'rmsprop':
             try:
@@ -136,12 +141,15 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
                                    lb=lb, 
                                    ub=ub, 
                                    s=solver_options.get('epoch', 100), 
-                                   t=1, 
+                                   t=solver_options.get('pop_size', 1), 
                                    rep=solver_options.get('episode', 1), 
                                    lr=solver_options.get('learning_rate', 0.01), 
                                    m=solver_options.get('momentum', 0.9), 
                                    dr=solver_options.get('decay_rate', 0.9), 
-                                   ben=solver_options.get('benchmark', False))
+                                   h=solver_options.get('difference_step', 1e-4), 
+                                   ms=solver_options.get('max_step', 0.1), 
+                                   ben=solver_options.get('benchmark', False), 
+                                   termination=termination)
 
         case 'adagrad':
             try:
@@ -149,7 +157,7 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.adagrad import ADAGRAD
             model_object = ADAGRAD(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'sgd':
             try:
@@ -157,8 +165,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.sgd import SGD
             model_object = SGD(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), m=solver_options.get(
-                'momentum', 0.9), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), m=solver_options.get(
+                'momentum', 0.9), h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
         case 'nesterov':
             try:
@@ -166,8 +174,8 @@ def generate_model(total_variables, directions, solver_name, solver_options, lb,
             except ImportError:
                 from ...algorithms.heuristic.gradient.sgd import SGD
             model_object = SGD(f=total_variables, d=directions, lb=lb, ub=ub, s=solver_options.get(
-                'epoch', 100), t=1, rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), m=solver_options.get(
-                'momentum', 0.9), ben=solver_options.get('benchmark', False))
+                'epoch', 100), t=solver_options.get('pop_size', 1), rep=solver_options.get('episode', 1), lr=solver_options.get('learning_rate', 0.01), m=solver_options.get(
+                'momentum', 0.9), nv=True, h=solver_options.get('difference_step', 1e-4), ms=solver_options.get('max_step', 0.1), ben=solver_options.get('benchmark', False), termination=termination)
 
 
     return model_object
\ No newline at end of file
@@ -1,7 +1,10 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
+from ..helpers.profiler import profiled
 
+
+@profiled("model")
 def generate_model(features):
 
     match features['interface_name']:
@@ -5,6 +5,7 @@
 import sys
 
 import highspy as highs_interface
+import numpy as np
 from ...helpers.formatter import *
 
 highs_status_dict = {
@@ -28,4 +29,72 @@ def Get(model_object, result, input1, input2=None):
             return model_object.getObjectiveValue()
 
         case 'time':
-            return (result[1][1] - result[1][0])
\ No newline at end of file
+            return (result[1][1] - result[1][0])
+
+        case 'dual':
+
+            solution = model_object.getSolution()
+            if not solution.dual_valid:
+                return None
+            status, row = model_object.getRowByName(input2)
+            return solution.row_dual[row]
+
+        case 'slack':
+
+            status, row = model_object.getRowByName(input2)
+            return GetMany(model_object, result, ['slack'], [input2], np.array([row]))[0]
+
+        case 'rc':
+
+            solution = model_object.getSolution()
+            if not solution.dual_valid:
+                return None
+            return solution.col_dual[input2.index]
+
+def ColumnIndex(elements):
+
+    return np.fromiter((element.index for element in elements), dtype=np.int64, count=len(elements))
+
+def RowIndex(model_object, labels):
+
+    return np.fromiter((model_object.getRowByName(label)[1] for label in labels), dtype=np.int64, count=len(labels))
+
+def GetMany(model_object, result, input1, elements, columns=None):
+
+    input1 = input1[0]
+    solution = model_object.getSolution()
+
+    match input1:
+
+        case 'variable':
+
+            if columns is None:
+                columns = ColumnIndex(elements)
+            return np.asarray(solution.col_value)[columns]
+
+        case 'rc':
+
+            if not solution.dual_valid:
+                return np.full(len(elements), np.nan)
+            if columns is None:
+                columns = ColumnIndex(elements)
+            return np.asarray(solution.col_dual)[columns]
+
+        case 'dual':
+
+            if not solution.dual_valid:
+                return np.full(len(elements), np.nan)
+            if columns is None:
+                columns = RowIndex(model_object, elements)
+            return np.asarray(solution.row_dual)[columns]
+
+        case 'slack':
+
+            if columns is None:
+                columns = RowIndex(model_object, elements)
+            lp = model_object.getLp()
+            activity = np.asarray(solution.row_value)[columns]
+            upper_slack = np.asarray(lp.row_upper_)[columns] - activity
+            lower_slack = activity - np.asarray(lp.row_lower_)[columns]
+            slack = np.minimum(np.where(np.isfinite(upper_slack), upper_slack, np.inf), np.where(np.isfinite(lower_slack), lower_slack, np.inf))
+            return np.abs(np.where(np.isfinite(slack), slack, 0.0))
@@ -2,6 +2,7 @@
 # See the file LICENSE file for licensing details.
 
 from ortools.linear_solver import pywraplp as ortools_interface
+import numpy as np
 
 ortools_status_dict = {0: "optimal", 1: "feasible", 2: "infeasible",
                        3: "unbounded", 4: "abnormal", 5: "model_invalid", 6: "not_solved"}
@@ -35,3 +36,36 @@ def Get(model_object, result, input1, input2=None):
         case 'slack':
 
             print('Not supported in ortools.')
+
+        case 'rc':
+
+            return input2.reduced_cost()
+
+def GetMany(model_object, result, input1, elements, columns=None):
+
+    input1 = input1[0]
+    count = len(elements)
+
+    match input1:
+
+        case 'variable':
+
+            return np.fromiter((element.solution_value() for element in elements), dtype=float, count=count)
+
+        case 'rc':
+
+            return np.fromiter((element.reduced_cost() for element in elements), dtype=float, count=count)
+
+        case 'dual':
+
+            return np.fromiter((model_object.LookupConstraint(element).dual_value() for element in elements), dtype=float, count=count)
+
+        case 'slack':
+
+            constraints = [model_object.LookupConstraint(element) for element in elements]
+            activities = np.asarray(model_object.ComputeConstraintActivities())
+            activity = activities[[constraint.index() for constraint in constraints]]
+            upper_slack = np.array([constraint.ub() for constraint in constraints]) - activity
+            lower_slack = activity - np.array([constraint.lb() for constraint in constraints])
+            slack = np.minimum(np.where(np.isfinite(upper_slack), upper_slack, np.inf), np.where(np.isfinite(lower_slack), lower_slack, np.inf))
+            return np.abs(np.where(np.isfinite(slack), slack, 0.0))
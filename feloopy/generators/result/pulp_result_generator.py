@@ -3,6 +3,7 @@
 
 
 import pulp as pulp_interface
+import numpy as np
 
 
 
@@ -59,3 +60,30 @@ def Get(model_object, result, input1, input2=None):
 
        case 'rc':
             return directions*input2.dj
+
+
+def GetMany(model_object, result, input1, elements, columns=None):
+
+   indicator = input1
+   directions = +1 if input1[1][input1[2]] == 'min' else -1
+   input1 = input1[0]
+   count = len(elements)
+
+   match input1:
+
+       case 'variable':
+
+           return np.fromiter((np.nan if element.varValue is None else element.varValue for element in elements), dtype=float, count=count)
+
+       case 'rc':
+
+           return directions*np.fromiter((np.nan if element.dj is None else element.dj for element in elements), dtype=float, count=count)
+
+       case 'dual':
+
+           return np.array([Get(model_object, result, indicator, element) for element in elements], dtype=float)
+
+       case 'slack':
+
+           constraints = model_object.constraints
+           return np.fromiter((abs(constraints[element].slack) if element in constraints and constraints[element].slack is not None else np.nan for element in elements), dtype=float, count=count)
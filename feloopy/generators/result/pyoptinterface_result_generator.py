@@ -2,6 +2,7 @@
 # See the file LICENSE file for licensing details.
 
 import pyoptinterface as poi
+import numpy as np
 
 def Get(model_object, result, input1, input2=None):
 
@@ -38,4 +39,20 @@ def Get(model_object, result, input1, input2=None):
         
         case 'rc':
             ""
-    
\ No newline at end of file
+    
+def GetMany(model_object, result, input1, elements, columns=None):
+
+    indicator = input1
+    input1 = input1[0]
+    count = len(elements)
+
+    match input1:
+
+        case 'variable':
+
+            get_value = model_object.get_value
+            return np.fromiter((get_value(element) for element in elements), dtype=float, count=count)
+
+        case _:
+
+            return np.array([Get(model_object, result, indicator, element) for element in elements], dtype=float)
@@ -1,7 +1,10 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
+from ..helpers.profiler import profiled
 
+
+@profiled("result")
 def get(input, model_object, model_solution, Thing, variable_name_with_index):
 
     InterfaceName = input['interface_name']
@@ -278,3 +281,77 @@ def get(input, model_object, model_solution, Thing, variable_name_with_index):
                 from .result import rsome_dro_result_generator
                 return rsome_dro_result_generator.Get(model_object, model_solution, indicator)
 
+
+
+result_modules = {
+    'pulp': 'pulp_result_generator',
+    'casadi': 'casadi_result_generator',
+    'pyomo': 'pyomo_result_generator',
+    'insideopt': 'seeker_result_generator',
+    'insideopt-demo': 'seeker_result_generator',
+    'gams': 'gamspy_result_generator',
+    'highs': 'highs_result_generator',
+    'jump': 'jump_result_generator',
+    'ortools': 'ortools_result_generator',
+    'ortools_cp': 'ortools_cp_result_generator',
+    'gekko': 'gekko_result_generator',
+    'picos': 'picos_result_generator',
+    'cvxpy': 'cvxpy_result_generator',
+    'cylp': 'cylp_result_generator',
+    'pymprog': 'pymprog_result_generator',
+    'mathopt': 'mathopt_result_generator',
+    'cplex': 'cplex_result_generator',
+    'cplex_cp': 'cplex_cp_result_generator',
+    'gurobi': 'gurobi_result_generator',
+    'copt': 'copt_result_generator',
+    'xpress': 'xpress_result_generator',
+    'mip': 'mip_result_generator',
+    'linopy': 'linopy_result_generator',
+    'rsome_ro': 'rsome_ro_result_generator',
+    'rsome_dro': 'rsome_dro_result_generator',
+}
+
+def get_result_module(InterfaceName):
+
+    import importlib
+
+    if 'pyoptinterface' in InterfaceName:
+        module_name = 'pyoptinterface_result_generator'
+    else:
+        module_name = result_modules[InterfaceName]
+
+    return importlib.import_module(f".result.{module_name}", __package__)
+
+@profiled("result")
+def get_many(input, model_object, model_solution, Thing, elements, columns=None):
+    """
+    Returns the values, reduced costs, duals or slacks of many elements at once as a flat numpy array.
+
+    Interfaces that define ``GetMany`` gather the whole block from the solver (using ``columns`` when given);
+    the others are dispatched once and then queried element by element.
+    """
+
+    import numpy as np
+
+    module = get_result_module(input['interface_name'])
+
+    indicator = [Thing,
+                 input['directions'],
+                 input['objective_being_optimized']]
+
+    if hasattr(module, 'GetMany'):
+        return module.GetMany(model_object, model_solution, indicator, elements, columns)
+
+    values = [module.Get(model_object, model_solution, indicator, element) for element in elements]
+    return np.array(values, dtype=float)
+
+def get_columns(input, elements):
+    """
+    Returns the solver column (or row) indices of the given elements, if the interface exposes them.
+    """
+
+    module = get_result_module(input['interface_name'])
+
+    if hasattr(module, 'ColumnIndex'):
+        return module.ColumnIndex(elements)
+    return None
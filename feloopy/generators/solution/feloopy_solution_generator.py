@@ -7,37 +7,86 @@ import timeit
 from tabulate import tabulate as tb
 import numpy as np
 
+from ...operators.parallel_operators import run_episodes
 
-def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots,show_log):
 
-    if number_of_times == 1:
+class Episode:
+    """
+    Picklable episode of a native heuristic algorithm: solves the model once from a seed and records the best reward of each evaluated population.
+    """
+
+    def __init__(self, model_object, fitness_function, direction, history=None):
+
+        self.model_object = model_object
+        self.fitness_function = fitness_function
+        self.direction = direction
+        self.history = history
+
+    def __call__(self, index, seed):
+
+        if seed is not None:
+            np.random.seed(seed)
+        if self.history is not None:
+            self.history.start_episode(index)
+
+        curve = []
+        best = -self.direction*np.inf
+
+        def fitness_function(X):
+            nonlocal best
+            result = self.fitness_function(X)
+            if np.ndim(result) == 2:
+                current = self.direction*np.max(self.direction*result[:, -1])
+                if self.direction*current > self.direction*best:
+                    best = current
+                curve.append(best)
+            return result
+
+        time_solve_begin = timeit.default_timer()
+        best_agent, best_reward, status = self.model_object.solve(fitness_function)
+        time_solve_end = timeit.default_timer()
+        termination = getattr(self.model_object, 'termination', None)
+
+        return {'seed': seed, 'agent': best_agent, 'reward': np.asarray(best_reward).item(), 'status': status, 'begin': time_solve_begin, 'end': time_solve_end, 'curve': np.array(curve),
+                'termination': termination.reason if termination is not None else 'epoch', 'history': self.history.episode_history(index) if self.history is not None else None}
+
+def epochs_to_best(curve, direction):
+    """
+    Returns the number of evaluated populations after which a convergence curve reaches its final best reward.
+    """
+
+    if len(curve) == 0:
+        return 0
+    return int(np.argmax(direction*curve >= direction*curve[-1])) + 1
+
+def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots,show_log, n_jobs=1, seed=None, history=None):
+
+    if number_of_times == 1 and seed is None:
 
         time_solve_begin = timeit.default_timer()
         x, y, status = model_object.solve(fitness_function)
         time_solve_end = timeit.default_timer()
-        return x, y, time_solve_begin, time_solve_end, status
+        return x, y, time_solve_begin, time_solve_end, status, None
 
     else:
 
         Multiplier = {'max': 1, 'min': -1}
         directions = Multiplier[objectives_directions[objective_number]]
-        time_solve_begin = []
-        time_solve_end = []
-        bestreward = [-directions*np.inf]
+        episodes = run_episodes(Episode(model_object, fitness_function, directions, history), number_of_times, n_jobs, seed)
+        if history is not None:
+            for index, episode in enumerate(episodes):
+                history.load_episode(index, episode['history'])
+
         best_reward_found = -directions*np.inf
-        for i in range(number_of_times):
-            time_solve_begin.append(timeit.default_timer())
-            best_agent, best_reward, status = model_object.solve(
-                fitness_function)
-            time_solve_end.append(timeit.default_timer())
-            Result = [best_agent, best_reward]
-            Result[1] = np.asarray(Result[1])
-            Result[1] = Result[1].item()
-            bestreward.append(best_reward)
-            if directions*(Result[1]) >= directions*(best_reward_found):
-                best_agent_found = Result[0]
-                best_reward_found = Result[1]
-        bestreward.pop(0)
+        for episode in episodes:
+            if directions*(episode['reward']) >= directions*(best_reward_found):
+                best_agent_found = episode['agent']
+                best_reward_found = episode['reward']
+                status = episode['status']
+        time_solve_begin = [episode['begin'] for episode in episodes]
+        time_solve_end = [episode['end'] for episode in episodes]
+        bestreward = [episode['reward'] for episode in episodes]
+        epochs = [epochs_to_best(episode['curve'], directions) for episode in episodes]
 
         if show_log:
             print()
@@ -57,10 +106,12 @@ def generate_solution(model_object, fitness_function, total_features, objectives
                 sec.append(totsec)
                 ave.append(round((time_solve_end[i]-time_solve_begin[i])*10**6))
 
+            wall = round(np.max(time_solve_end) - np.min(time_solve_begin), 3)
             print("~~~~~~~\nTIME INFO\n~~~~~~~")
             print(tb({
                 "cpt (ave)": [np.average(ave), "%02d:%02d:%02d" % (np.average(hour), np.average(min), np.average(sec))],
                 "cpt (std)": [np.std(ave), "%02d:%02d:%02d" % (np.std(hour), np.std(min), np.std(sec))],
+                "cpt (wall)": [round(wall*10**6), "%02d:%02d:%02d" % (wall // 3600, wall % 3600 // 60, wall % 60)],
                 "unit": ["micro sec", "h:m:s"]
             }, headers="keys", tablefmt="github"))
             print()
@@ -68,6 +119,7 @@ def generate_solution(model_object, fitness_function, total_features, objectives
             print("~~~~~~~\nOBJ INFO\n~~~~~~~")
             print(tb({
                 "obj": [np.max(bestreward), np.average(bestreward), np.std(bestreward), np.min(bestreward)],
+                "epochs to best": [np.max(epochs), np.average(epochs), np.std(epochs), np.min(epochs)],
                 "unit": ["max", "average", "standard deviation", "min"]
             }, headers="keys", tablefmt="github"))
             print("~~~~~~~")
@@ -75,4 +127,4 @@ def generate_solution(model_object, fitness_function, total_features, objectives
         best_agent = best_agent_found
         best_reward = best_reward_found
 
-    return best_agent, best_reward, np.average(time_solve_begin), np.average(time_solve_end), status
+    return best_agent, best_reward, np.average(time_solve_begin), np.average(time_solve_end), status, episodes
@@ -88,3 +88,30 @@ def generate_solution(features):
             generated_solution = result, [time_solve_begin, time_solve_end]
 
     return generated_solution
+
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the live model after changing its objective and the bounds of some of its variables, starting from the previous solution.
+    """
+
+    model_object = features['model_object_before_solve']
+
+    for variable, lower, upper in bounds:
+        variable.LB = -gurobi_interface.GRB.INFINITY if lower is None else lower
+        variable.UB = gurobi_interface.GRB.INFINITY if upper is None else upper
+
+    if model_object.IsMIP and model_object.SolCount > 0:
+        for variable in model_object.getVars():
+            variable.Start = variable.X
+
+    match direction:
+        case "min":
+            model_object.setObjective(objective, gurobi_interface.GRB.MINIMIZE)
+        case "max":
+            model_object.setObjective(objective, gurobi_interface.GRB.MAXIMIZE)
+
+    time_solve_begin = timeit.default_timer()
+    result = model_object.optimize()
+    time_solve_end = timeit.default_timer()
+
+    return result, [time_solve_begin, time_solve_end]
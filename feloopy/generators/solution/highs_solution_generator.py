@@ -3,6 +3,7 @@
 
 
 import highspy as highs_interface
+import numpy as np
 import timeit
 
 highs_solver_selector = {'highs': 'highs'}
@@ -46,6 +47,7 @@ def generate_solution(features):
     match debug:
         case False:
             counter = 0
+            features['constraint_first_row'] = model_object.getNumRow()
             for constraint, label in zip(model_constraints, constraint_labels):
                 if label:
                     model_object.addConstr(constraint, name=label)
@@ -64,3 +66,102 @@ def generate_solution(features):
             generated_solution = result, [time_solve_begin, time_solve_end]
     return generated_solution
 
+
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the live model after changing its objective and the bounds of some of its variables, starting from the previous solution.
+    """
+
+    model_object = features['model_object_before_solve']
+
+    for variable, lower, upper in bounds:
+        model_object.changeColBounds(variable.index, -highs_interface.kHighsInf if lower is None else lower, highs_interface.kHighsInf if upper is None else upper)
+
+    if features['binary_variable_counter'][0] + features['integer_variable_counter'][0] != 0 and model_object.getInfo().primal_solution_status == 2:
+        model_object.setSolution(model_object.getSolution())
+
+    match direction:
+        case "min":
+            time_solve_begin = timeit.default_timer()
+            result = model_object.minimize(objective)
+            time_solve_end = timeit.default_timer()
+        case "max":
+            time_solve_begin = timeit.default_timer()
+            result = model_object.maximize(objective)
+            time_solve_end = timeit.default_timer()
+
+    return result, [time_solve_begin, time_solve_end]
+
+
+def extract_linear_data(features):
+    """
+    Returns the data of the linear model (objective costs and offset, constraint coefficients, row and column bounds) as built by the environment, before it is passed to the solver.
+    """
+
+    model_object = features['model_object_before_solve']
+    lp = model_object.getLp()
+
+    objective = highs_interface.highs.highs_linear_expression(features['objectives'][features['objective_being_optimized']])
+    cost = np.zeros(lp.num_col_)
+    np.add.at(cost, np.asarray(objective.idxs, dtype=np.int64), np.asarray(objective.vals, dtype=float))
+
+    coefficients = dict()
+    row_lower = np.empty(len(features['constraints']))
+    row_upper = np.empty(len(features['constraints']))
+    for row, constraint in enumerate(features['constraints']):
+        for column, value in zip(constraint.idxs, constraint.vals):
+            coefficients[row, column] = coefficients.get((row, column), 0.0) + value
+        row_lower[row], row_upper[row] = constraint.bounds
+
+    return {
+        'cost': cost,
+        'offset': np.array([objective.constant if objective.constant else 0.0]),
+        'coefficients': coefficients,
+        'row_lower': row_lower,
+        'row_upper': row_upper,
+        'col_lower': np.asarray(lp.col_lower_, dtype=float),
+        'col_upper': np.asarray(lp.col_upper_, dtype=float),
+    }
+
+def get_warm_start(features):
+    """
+    Returns the current solution of the live model, to start later re-solves from.
+    """
+
+    return features['model_object_before_solve'].getSolution()
+
+def update_solution(features, changes, warm_start=None):
+    """
+    Applies changes of the model data to the live model and re-solves it, starting from the given solution (or the current basis).
+    """
+
+    model_object = features['model_object_before_solve']
+    first_row = features['constraint_first_row']
+
+    if 'cost' in changes:
+        columns, values = changes['cost']
+        model_object.changeColsCost(len(columns), columns, values)
+
+    if 'offset' in changes:
+        model_object.changeObjectiveOffset(float(changes['offset']))
+
+    if 'coefficients' in changes:
+        for row, column, value in zip(*changes['coefficients']):
+            model_object.changeCoeff(first_row + int(row), int(column), float(value))
+
+    if 'row_bounds' in changes:
+        rows, lower, upper = changes['row_bounds']
+        model_object.changeRowsBounds(len(rows), first_row + rows, lower, upper)
+
+    if 'col_bounds' in changes:
+        columns, lower, upper = changes['col_bounds']
+        model_object.changeColsBounds(len(columns), columns, lower, upper)
+
+    if warm_start is not None and features['binary_variable_counter'][0] + features['integer_variable_counter'][0] != 0:
+        model_object.setSolution(warm_start)
+
+    time_solve_begin = timeit.default_timer()
+    result = model_object.run()
+    time_solve_end = timeit.default_timer()
+
+    return result, [time_solve_begin, time_solve_end]
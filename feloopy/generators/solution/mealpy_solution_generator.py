@@ -8,7 +8,62 @@ from tabulate import tabulate as tb
 from mealpy.utils.visualize import *
 from mealpy import FloatVar
 
-def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots, save_plots,show_log, solver_options):
+from ...operators.parallel_operators import run_episodes
+
+def enable_batch_evaluation(model_object, batch_fitness_function):
+    """
+    Makes the optimizer evaluate each new population with one call to the batched fitness function.
+    """
+
+    from mealpy.utils.target import Target
+
+    def update_target_for_population(pop=None):
+        rewards = batch_fitness_function(np.array([agent.solution for agent in pop]))
+        for agent, reward in zip(pop, rewards):
+            agent.target = Target(objectives=np.atleast_1d(reward).tolist(), weights=model_object.problem.obj_weights)
+        return pop
+
+    def generate_population(pop_size=None):
+        return update_target_for_population([model_object.generate_empty_agent() for _ in range(pop_size)])
+
+    model_object.update_target_for_population = update_target_for_population
+    if hasattr(model_object, 'generate_empty_agent'):
+        model_object.generate_population = generate_population
+
+class Episode:
+    """
+    Picklable episode of a mealpy optimizer: solves the problem once from a seed and keeps the global best fitness of each epoch.
+    """
+
+    def __init__(self, model_object, solver_inputs, termination=None, history=None):
+
+        self.model_object = model_object
+        self.solver_inputs = solver_inputs
+        self.termination = termination
+        self.history = history
+
+    def __call__(self, index, seed):
+
+        if self.history is not None:
+            self.history.start_episode(index)
+
+        time_solve_begin = timeit.default_timer()
+        g_best = self.model_object.solve(**self.solver_inputs, termination=self.termination, seed=seed)
+        time_solve_end = timeit.default_timer()
+
+        return {'seed': seed, 'agent': g_best.solution, 'reward': np.asarray(g_best.target.fitness).item(), 'begin': time_solve_begin, 'end': time_solve_end, 'curve': np.array(self.model_object.history.list_global_best_fit),
+                'history': self.history.episode_history(index) if self.history is not None else None}
+
+def epochs_to_best(curve, direction):
+    """
+    Returns the number of epochs after which a convergence curve reaches its final best fitness.
+    """
+
+    if len(curve) == 0:
+        return 0
+    return int(np.argmax(direction*curve >= direction*curve[-1])) + 1
+
+def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots, save_plots,show_log, solver_options, batch_fitness_function=None, n_jobs=1, seed=None, history=None):
 
     problem = {
         "obj_func": fitness_function,
@@ -25,24 +80,23 @@ def generate_solution(model_object, fitness_function, total_features, objectives
 
     else:
         termination=None
+
+    if solver_options.get("process_mode")!=None:
+        solver_inputs = {'problem': problem, 'mode': solver_options.get("process_mode"), 'n_workers': solver_options.get("n_workers")}
+    elif batch_fitness_function!=None:
+        enable_batch_evaluation(model_object, batch_fitness_function)
+        problem["obj_func"] = lambda solution: batch_fitness_function(np.reshape(solution, (1, -1)))[0]
+        solver_inputs = {'problem': problem, 'mode': 'swarm'}
+    else:
+        solver_inputs = {'problem': problem}
         
     if number_of_times == 1:
-        
-        if solver_options.get("process_mode")!=None:
-            solver_inputs = {'problem': problem, 'mode': solver_options.get("process_mode"), 'n_workers': solver_options.get("n_workers")}
-        else:
-            solver_inputs = {'problem': problem}
-
-        if termination!=None:
-            time_solve_begin = timeit.default_timer()
-            g_best = model_object.solve(**solver_inputs, termination=termination)
-            time_solve_end = timeit.default_timer()
-            best_agent, best_reward = g_best.solution, g_best.target.fitness
-        else:
-            time_solve_begin = timeit.default_timer()
-            g_best = model_object.solve(**solver_inputs)
-            time_solve_end = timeit.default_timer()
-            best_agent, best_reward = g_best.solution, g_best.target.fitness
+
+        time_solve_begin = timeit.default_timer()
+        g_best = model_object.solve(**solver_inputs, termination=termination, seed=seed)
+        time_solve_end = timeit.default_timer()
+        best_agent, best_reward = g_best.solution, g_best.target.fitness
+        episodes = None
         
         if show_plots:
             
@@ -64,24 +118,20 @@ def generate_solution(model_object, fitness_function, total_features, objectives
 
         Multiplier = {'max': 1, 'min': -1}
         directions = Multiplier[objectives_directions[objective_number]]
-        time_solve_begin = []
-        time_solve_end = []
-        bestreward = [-directions*np.inf]
-        best_reward_found = -directions*np.inf
+        episodes = run_episodes(Episode(model_object, solver_inputs, termination, history), number_of_times, n_jobs, seed)
+        if history is not None:
+            for index, episode in enumerate(episodes):
+                history.load_episode(index, episode['history'])
 
-        for i in range(number_of_times):
-            time_solve_begin.append(timeit.default_timer())
-            g_best = model_object.solve(**solver_inputs)
-            time_solve_end.append(timeit.default_timer())
-            best_agent, best_reward = g_best.solution, g_best.target.fitness
-            Result = [best_agent, best_reward]
-            Result[1] = np.asarray(Result[1])
-            Result[1] = Result[1].item()
-            bestreward.append(best_reward)
-            if directions*(Result[1]) >= directions*(best_reward_found):
-                best_agent_found = Result[0]
-                best_reward_found = Result[1]
-        bestreward.pop(0)
+        best_reward_found = -directions*np.inf
+        for episode in episodes:
+            if directions*(episode['reward']) >= directions*(best_reward_found):
+                best_agent_found = episode['agent']
+                best_reward_found = episode['reward']
+        time_solve_begin = [episode['begin'] for episode in episodes]
+        time_solve_end = [episode['end'] for episode in episodes]
+        bestreward = [episode['reward'] for episode in episodes]
+        epochs = [epochs_to_best(episode['curve'], directions) for episode in episodes]
 
         if show_log:
             print()
@@ -101,10 +151,12 @@ def generate_solution(model_object, fitness_function, total_features, objectives
                 sec.append(totsec)
                 ave.append(round((time_solve_end[i]-time_solve_begin[i])*10**6))
 
+            wall = round(np.max(time_solve_end) - np.min(time_solve_begin), 3)
             print("~~~~~~~\nTIME INFO\n~~~~~~~")
             print(tb({
                 "cpt (ave)": [np.average(ave), "%02d:%02d:%02d" % (np.average(hour), np.average(min), np.average(sec))],
                 "cpt (std)": [np.std(ave), "%02d:%02d:%02d" % (np.std(hour), np.std(min), np.std(sec))],
+                "cpt (wall)": [round(wall*10**6), "%02d:%02d:%02d" % (wall // 3600, wall % 3600 // 60, wall % 60)],
                 "unit": ["micro sec", "h:m:s"]
             }, headers="keys", tablefmt="github"))
             print("~~~~~~~")
@@ -112,6 +164,7 @@ def generate_solution(model_object, fitness_function, total_features, objectives
             print("~~~~~~~\nOBJ INFO\n~~~~~~~")
             print(tb({
                 "obj": [np.max(bestreward), np.average(bestreward), np.std(bestreward), np.min(bestreward)],
+                "epochs to best": [np.max(epochs), np.average(epochs), np.std(epochs), np.min(epochs)],
                 "unit": ["max", "average", "standard deviation", "min"]
             }, headers="keys", tablefmt="github"))
             print("~~~~~~~")
@@ -119,4 +172,4 @@ def generate_solution(model_object, fitness_function, total_features, objectives
         best_agent = best_agent_found
         best_reward = best_reward_found
 
-    return best_agent, best_reward, time_solve_begin, time_solve_end
+    return best_agent, best_reward, np.average(time_solve_begin), np.average(time_solve_end), episodes
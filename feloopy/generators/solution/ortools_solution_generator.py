@@ -98,3 +98,29 @@ def generate_solution(features):
             generated_solution = [result, [time_solve_begin, time_solve_end]]
 
     return generated_solution
+
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the live model after changing its objective and the bounds of some of its variables, starting from the previous solution.
+    """
+
+    model_object = features['model_object_before_solve']
+
+    for variable, lower, upper in bounds:
+        variable.SetBounds(-model_object.infinity() if lower is None else lower, model_object.infinity() if upper is None else upper)
+
+    if features['binary_variable_counter'][0] + features['integer_variable_counter'][0] != 0:
+        variables = model_object.variables()
+        model_object.SetHint(variables, [variable.solution_value() for variable in variables])
+
+    match direction:
+        case "min":
+            model_object.Minimize(objective)
+        case "max":
+            model_object.Maximize(objective)
+
+    time_solve_begin = timeit.default_timer()
+    result = model_object.Solve()
+    time_solve_end = timeit.default_timer()
+
+    return [result, [time_solve_begin, time_solve_end]]
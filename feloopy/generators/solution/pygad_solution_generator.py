@@ -8,13 +8,17 @@ import timeit
 from tabulate import tabulate as tb
 import pygad
 
-def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots, save_plots,show_log, solver_options):
+def generate_solution(model_object, fitness_function, total_features, objectives_directions, objective_number, number_of_times, show_plots, save_plots,show_log, solver_options, batch_fitness_function=None):
 
     coeffs = get_coeffs("pygad", objectives_directions)
     
     def new_fitness_function(ga_instance, sol, solution_idx):
         result = fitness_function(sol)*coeffs
         return result
+
+    def new_batch_fitness_function(ga_instance, sols, solution_ids):
+        rewards = batch_fitness_function(np.array(sols))
+        return [reward*coeffs for reward in rewards]
     
     initial_configs = get_config("pygad", "ga")
     supported_configs_specific = initial_configs.keys()
@@ -30,8 +34,13 @@ def generate_solution(model_object, fitness_function, total_features, objectives
     if "num_genes" not in config.keys(): config["num_genes"] = total_features[1]
     if "num_generations" not in config.keys(): config["num_generations"] = 100
     if "num_parents_mating" not in config.keys(): config["num_parents_mating"] = config["sol_per_pop"] // 2
-    
-    ga_instance = pygad.GA(fitness_func=new_fitness_function,**config)
+
+    if batch_fitness_function!=None:
+        batch_size = solver_options.get("batch_size")
+        config["fitness_batch_size"] = config["sol_per_pop"] if batch_size in [None, True, "population"] else batch_size
+        ga_instance = pygad.GA(fitness_func=new_batch_fitness_function,**config)
+    else:
+        ga_instance = pygad.GA(fitness_func=new_fitness_function,**config)
     
     if number_of_times == 1:
         
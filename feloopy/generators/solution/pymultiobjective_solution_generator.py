@@ -29,6 +29,9 @@ def generate_solution(solver_name, AlgOptions, Fitness, ToTalVariableCounter, Ob
         elif key == 'show_log':
             parameters['verbose'] = AlgOptions[key]
 
+        elif key == 'archive_cap':
+            continue
+
         else:
             parameters[key] = AlgOptions[key]
 
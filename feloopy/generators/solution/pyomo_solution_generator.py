@@ -176,3 +176,45 @@ def generate_solution(features):
             generated_solution = result, [time_solve_begin, time_solve_end]
 
     return generated_solution
+
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the live model after changing its objective and the bounds of some of its variables, starting from the previous solution.
+    """
+
+    model_object = features['model_object_before_solve']
+    solver_name = features['solver_name']
+
+    for variable, lower, upper in bounds:
+        variable.setlb(lower)
+        variable.setub(upper)
+
+    model_object.del_component('OBJ')
+    match direction:
+        case "min":
+            model_object.OBJ = pyomo_interface.Objective(expr=objective, sense=pyomo_interface.minimize)
+        case "max":
+            model_object.OBJ = pyomo_interface.Objective(expr=objective, sense=pyomo_interface.maximize)
+
+    if solver_name not in pyomo_offline_solver_selector.keys():
+        raise RuntimeError("Re-solving is only supported for the offline solvers of 'pyomo'.")
+
+    solver_manager = pyomo_interface.SolverFactory(pyomo_offline_solver_selector[solver_name])
+    if features['thread_count'] != None:
+        solver_manager.options['threads'] = features['thread_count']
+    if features['time_limit'] != None:
+        solver_manager.options['timelimit'] = features['time_limit']
+    if features['relative_gap'] != None:
+        solver_manager.options['mipgap'] = features['relative_gap']
+
+    arguments = {'tee': bool(features['log'])}
+    if len(features['solver_options']) != 0:
+        arguments['options'] = features['solver_options']
+    if solver_manager.warm_start_capable():
+        arguments['warmstart'] = True
+
+    time_solve_begin = timeit.default_timer()
+    result = solver_manager.solve(model_object, **arguments)
+    time_solve_end = timeit.default_timer()
+
+    return result, [time_solve_begin, time_solve_end]
@@ -78,3 +78,31 @@ def generate_solution(features):
             generated_solution = [None, [time_solve_begin, time_solve_end]]
 
     return generated_solution
+
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the live model after changing its objective and the bounds of some of its variables, starting from the previous solution.
+    """
+
+    model_object = features['model_object_before_solve']
+
+    for variable, lower, upper in bounds:
+        model_object.set_variable_attribute(variable, poi.VariableAttribute.LowerBound, -float('inf') if lower is None else lower)
+        model_object.set_variable_attribute(variable, poi.VariableAttribute.UpperBound, float('inf') if upper is None else upper)
+
+    if features['binary_variable_counter'][0] + features['integer_variable_counter'][0] != 0:
+        for variable in features['variables'].values():
+            for element in (variable.values() if hasattr(variable, 'values') else [variable]):
+                model_object.set_variable_attribute(element, poi.VariableAttribute.PrimalStart, model_object.get_value(element))
+
+    match direction:
+        case 'min':
+            model_object.set_objective(objective, poi.ObjectiveSense.Minimize)
+        case 'max':
+            model_object.set_objective(objective, poi.ObjectiveSense.Maximize)
+
+    time_solve_begin = timeit.default_timer()
+    model_object.optimize()
+    time_solve_end = timeit.default_timer()
+
+    return [None, [time_solve_begin, time_solve_end]]
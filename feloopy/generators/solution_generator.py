@@ -1,7 +1,10 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
+from ..helpers.profiler import profiled
 
+
+@profiled("solution")
 def generate_solution(features):
 
     match features['interface_name']:
@@ -153,3 +156,126 @@ def generate_solution(features):
             ModelSolution = rsome_dro_solution_generator.generate_solution(features)
 
     return ModelSolution
+
+persistent_interfaces = ['highs', 'gurobi', 'ortools', 'pyomo']
+
+def supports_regeneration(interface_name):
+
+    return interface_name in persistent_interfaces or 'pyoptinterface' in interface_name
+
+@profiled("solution")
+def regenerate_solution(features, objective, direction, bounds=[]):
+    """
+    Re-solves the model already passed to the solver after changing its objective and the bounds of some of its variables.
+
+    Parameters
+    ----------
+    features : dict
+        Features of the solved model.
+    objective : expression
+        New objective.
+    direction : str
+        Direction of the new objective ('min' or 'max').
+    bounds : list, optional
+        (variable, lower bound, upper bound) to set before solving; ``None`` stands for an infinite bound.
+    """
+
+    match features['interface_name']:
+
+        case 'highs':
+
+            from .solution import highs_solution_generator
+            ModelSolution = highs_solution_generator.regenerate_solution(features, objective, direction, bounds)
+
+        case 'gurobi':
+
+            from .solution import gurobi_solution_generator
+            ModelSolution = gurobi_solution_generator.regenerate_solution(features, objective, direction, bounds)
+
+        case 'ortools':
+
+            from .solution import ortools_solution_generator
+            ModelSolution = ortools_solution_generator.regenerate_solution(features, objective, direction, bounds)
+
+        case 'pyomo':
+
+            from .solution import pyomo_solution_generator
+            ModelSolution = pyomo_solution_generator.regenerate_solution(features, objective, direction, bounds)
+
+        case name if 'pyoptinterface' in name:
+
+            from .solution import pyoptinterface_solution_generator
+            ModelSolution = pyoptinterface_solution_generator.regenerate_solution(features, objective, direction, bounds)
+
+        case _:
+
+            raise RuntimeError("Re-solving a live model is not supported by '%s'! \nPossible fixes: \n1) Use one of %s. \n2) Disable the 'persistent' option. \n" % (features['interface_name'], persistent_interfaces + ['pyoptinterface']))
+
+    return ModelSolution
+
+incremental_interfaces = ['highs']
+
+def supports_incremental(interface_name):
+
+    return interface_name in incremental_interfaces
+
+def extract_linear_data(features):
+    """
+    Returns the data of a linear model as built by the environment, i.e., a dictionary of 'cost' and 'offset' of the objective,
+    'coefficients' of the constraints as {(row, column): value}, and 'row_lower', 'row_upper', 'col_lower' and 'col_upper' bounds.
+    """
+
+    match features['interface_name']:
+
+        case 'highs':
+
+            from .solution import highs_solution_generator
+            return highs_solution_generator.extract_linear_data(features)
+
+        case _:
+
+            raise RuntimeError("Incremental re-solving is not supported by '%s'! \nPossible fixes: \n1) Use one of %s. \n2) Remove the parameter from 'mutable_params'. \n" % (features['interface_name'], incremental_interfaces))
+
+def get_warm_start(features):
+    """
+    Returns the current solution of a solved linear model in the form the solver accepts as a starting point.
+    """
+
+    match features['interface_name']:
+
+        case 'highs':
+
+            from .solution import highs_solution_generator
+            return highs_solution_generator.get_warm_start(features)
+
+        case _:
+
+            raise RuntimeError("Incremental re-solving is not supported by '%s'! \nPossible fixes: \n1) Use one of %s. \n2) Remove the parameter from 'mutable_params'. \n" % (features['interface_name'], incremental_interfaces))
+
+@profiled("solution")
+def update_solution(features, changes, warm_start=None):
+    """
+    Applies changes of the data of a solved linear model directly to the solver object and re-solves it.
+
+    Parameters
+    ----------
+    features : dict
+        Features of the solved model.
+    changes : dict
+        Any of 'cost' (columns, values), 'offset' (value), 'coefficients' (rows, columns, values), 'row_bounds' (rows, lower, upper) and 'col_bounds' (columns, lower, upper).
+    warm_start : object, optional
+        Solution of the solver to start from.
+    """
+
+    match features['interface_name']:
+
+        case 'highs':
+
+            from .solution import highs_solution_generator
+            ModelSolution = highs_solution_generator.update_solution(features, changes, warm_start)
+
+        case _:
+
+            raise RuntimeError("Incremental re-solving is not supported by '%s'! \nPossible fixes: \n1) Use one of %s. \n2) Remove the parameter from 'mutable_params'. \n" % (features['interface_name'], incremental_interfaces))
+
+    return ModelSolution
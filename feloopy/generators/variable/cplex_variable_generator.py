@@ -2,6 +2,7 @@
 # See the file LICENSE file for licensing details.
 
 import itertools as it
+from ...classes.variable_array import VariableArray, allocate_variable_array, iterate_variable_keys, to_object_array
 
 sets = it.product
 
@@ -74,3 +75,19 @@ def generate_variable(model_object, variable_type, variable_name, variable_bound
                     GeneratedVariable = {key: model_object.continuous_var(lb=variable_bound[0], ub=variable_bound[1], name=f"{variable_name}{key}") for key in sets(*variable_dim)}
 
     return GeneratedVariable
+
+
+def generate_variable_array(model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    size, dims = allocate_variable_array(variable_dim)
+    names = [f"{variable_name}{key}" for key in iterate_variable_keys(dims)] if named else None
+
+    match variable_type:
+        case 'bvar':
+            generated_list = model_object.binary_var_list(size, name=names)
+        case 'ivar':
+            generated_list = model_object.integer_var_list(size, lb=variable_bound[0], ub=variable_bound[1], name=names)
+        case _:
+            generated_list = model_object.continuous_var_list(size, lb=variable_bound[0], ub=variable_bound[1], name=names)
+
+    return VariableArray(variable_name, dims, to_object_array(generated_list, size))
@@ -4,6 +4,7 @@
 
 import highspy as highs_interface
 import itertools as it
+from ...classes.variable_array import VariableArray, allocate_variable_array, iterate_variable_keys, to_object_array
 
 sets = it.product
 
@@ -103,3 +104,33 @@ def generate_variable(model_object, variable_type, variable_name, variable_bound
                         type=POSITIVE, lb=variable_bound[0], ub=variable_bound[1], name=f"{variable_name}{key}") for key in sets(*variable_dim)}
 
     return generated_variable
+
+def generate_variable_array(model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    if variable_bound[0] == None:
+        variable_bound[0] = -INFINITY
+
+    if variable_bound[1] == None:
+        variable_bound[1] = +INFINITY
+
+    size, dims = allocate_variable_array(variable_dim)
+
+    match variable_type:
+        case 'bvar':
+            variable_class, lower, upper = BINARY, 0, 1
+        case 'ivar':
+            variable_class, lower, upper = INTEGER, variable_bound[0], variable_bound[1]
+        case _:
+            variable_class, lower, upper = POSITIVE, variable_bound[0], variable_bound[1]
+
+    first_column = model_object.getNumCol()
+
+    if hasattr(model_object, 'addVariables'):
+        options = {'lb': lower, 'ub': upper, 'type': variable_class, 'out_array': True}
+        if named:
+            options['name'] = [f"{variable_name}{key}" for key in iterate_variable_keys(dims)]
+        array = to_object_array(model_object.addVariables(size, **options), size)
+    else:
+        array = to_object_array((model_object.addVariable(type=variable_class, lb=lower, ub=upper) for _ in range(size)), size)
+
+    return VariableArray(variable_name, dims, array, first_column=first_column)
@@ -2,6 +2,7 @@
 # See the file LICENSE file for licensing details.
 
 import itertools as it
+from ...classes.variable_array import VariableArray, allocate_variable_array, iterate_variable_keys, to_object_array
 
 sets = it.product
 
@@ -73,3 +74,25 @@ def generate_variable(model_object, variable_type, variable_name, variable_bound
                     generated_variable = {key: model_object.NumVar(variable_bound[0], variable_bound[1], f"{variable_name}{key}") for key in it.product(*variable_dim)}
 
     return generated_variable
+
+
+def generate_variable_array(model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    if variable_bound[0] == None:
+        variable_bound[0] = -model_object.infinity()
+
+    if variable_bound[1] == None:
+        variable_bound[1] = model_object.infinity()
+
+    integer = variable_type in ['bvar', 'ivar']
+    size, dims = allocate_variable_array(variable_dim)
+    first_column = model_object.NumVariables()
+
+    if named:
+        names = (f"{variable_name}{key}" for key in iterate_variable_keys(dims))
+    else:
+        names = it.repeat("", size)
+
+    array = to_object_array((model_object.Var(variable_bound[0], variable_bound[1], integer, name) for name in names), size)
+
+    return VariableArray(variable_name, dims, array, first_column=first_column)
@@ -3,6 +3,7 @@
 
 import pulp as pulp_interface
 import itertools as it
+from ...classes.variable_array import VariableArray, allocate_variable_array, iterate_variable_keys, to_object_array
 
 sets = it.product
 
@@ -65,4 +66,21 @@ def generate_variable(model_object, variable_type, variable_name, variable_bound
                 else:
                     generated_variable = {key: VariableGenerator(f"{variable_name}{key}", variable_bound[0], variable_bound[1], FREE) for key in sets(*variable_dim)}
 
-    return generated_variable
\ No newline at end of file
+    return generated_variable
+
+def generate_variable_array(model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    # PuLP requires unique names for writing the solver files, so cheap positional names replace the formatted keys.
+
+    category = {'pvar': POSITIVE, 'bvar': BINARY, 'ivar': INTEGER, 'fvar': FREE}[variable_type]
+    size, dims = allocate_variable_array(variable_dim)
+
+    if named:
+        names = (f"{variable_name}{key}" for key in iterate_variable_keys(dims))
+    else:
+        names = (f"{variable_name}_{position}" for position in range(size))
+
+    lower, upper = variable_bound[0], variable_bound[1]
+    array = to_object_array((VariableGenerator(name, lower, upper, category) for name in names), size)
+
+    return VariableArray(variable_name, dims, array)
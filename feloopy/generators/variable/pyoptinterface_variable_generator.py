@@ -3,6 +3,7 @@
 
 import pyoptinterface as poi
 import itertools as it
+from ...classes.variable_array import VariableArray, allocate_variable_array, iterate_variable_keys, to_object_array
 
 sets = it.product
 
@@ -70,3 +71,24 @@ def generate_variable(model_object, variable_type, variable_name, variable_bound
                     generated_variable = {key: model_object.add_variable(lb=variable_bound[0], ub=variable_bound[1], name=f"{variable_name}{key}", domain=FREE) for key in it.product(*variable_dim)}
 
     return generated_variable
+
+
+def generate_variable_array(model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    if variable_bound[0] == None:
+        variable_bound[0] = -float('inf')
+
+    if variable_bound[1] == None:
+        variable_bound[1] = float('inf')
+
+    domain = {'pvar': POSITIVE, 'bvar': BINARY, 'ivar': INTEGER, 'fvar': FREE}[variable_type]
+    size, dims = allocate_variable_array(variable_dim)
+
+    if named:
+        array = to_object_array((model_object.add_variable(lb=variable_bound[0], ub=variable_bound[1], name=f"{variable_name}{key}", domain=domain) for key in iterate_variable_keys(dims)), size)
+    elif hasattr(model_object, 'add_m_variables'):
+        array = to_object_array(model_object.add_m_variables(size, lb=variable_bound[0], ub=variable_bound[1], domain=domain).ravel(), size)
+    else:
+        array = to_object_array((model_object.add_variable(lb=variable_bound[0], ub=variable_bound[1], domain=domain) for _ in range(size)), size)
+
+    return VariableArray(variable_name, dims, array, first_column=array[0].index if size else None)
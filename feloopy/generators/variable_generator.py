@@ -1,9 +1,52 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
+from ..helpers.profiler import profiled
 
+BULK_INTERFACES = ['pulp', 'highs', 'ortools', 'cplex', 'pyoptinterface.highs', 'pyoptinterface.copt', 'pyoptinterface.mosek', 'pyoptinterface.gurobi']
+BULK_VARIABLE_TYPES = ['pvar', 'bvar', 'ivar', 'fvar']
 
-def generate_variable(interface_name, model_object, variable_type, variable_name, variable_bound, variable_dim):
+def generate_variable_array(interface_name, model_object, variable_type, variable_name, variable_bound, variable_dim, named=False):
+
+    inputs = {'model_object': model_object,
+              'variable_type': variable_type,
+              'variable_name': variable_name,
+              'variable_bound': variable_bound,
+              'variable_dim': variable_dim,
+              'named': named}
+
+    match interface_name:
+
+        case 'pulp':
+
+            from .variable import pulp_variable_generator
+            return pulp_variable_generator.generate_variable_array(**inputs)
+
+        case 'highs':
+
+            from .variable import highs_variable_generator
+            return highs_variable_generator.generate_variable_array(**inputs)
+
+        case 'ortools':
+
+            from .variable import ortools_variable_generator
+            return ortools_variable_generator.generate_variable_array(**inputs)
+
+        case 'cplex':
+
+            from .variable import cplex_variable_generator
+            return cplex_variable_generator.generate_variable_array(**inputs)
+
+        case name if 'pyoptinterface' in name:
+
+            from .variable import pyoptinterface_variable_generator
+            return pyoptinterface_variable_generator.generate_variable_array(**inputs)
+
+@profiled("variable")
+def generate_variable(interface_name, model_object, variable_type, variable_name, variable_bound, variable_dim, bulk=False, named=True):
+
+    if bulk and variable_dim != 0 and interface_name in BULK_INTERFACES and variable_type in BULK_VARIABLE_TYPES:
+        return generate_variable_array(interface_name, model_object, variable_type, variable_name, variable_bound, variable_dim, named)
 
     inputs = {'model_object': model_object,
               'variable_type': variable_type,
@@ -5,3 +5,4 @@ from .context_manager import *
 from .empty import *
 from .error import *
 from .formatter import *
+from .profiler import *
@@ -1,18 +1,15 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
-from rich.console import Console
-from rich.spinner import Spinner
 from datetime import datetime
 import threading
 import time
 import time
 import threading
-from tqdm import tqdm
 import numpy as np
 from numbers import Number
 from typing import Any, Sequence
-import pandas as pd
+from .lazy_import import pd
 
 class report:
 
@@ -461,7 +458,7 @@ class report:
     def print_pandas_df(
         self,
         label: str,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         columns: Sequence[str] = None,
         additional_text: str = "",
         decimal_places: int = 4,
@@ -856,6 +853,8 @@ def metrics_print(
 
 
 def run_with_progress(func, show_log, *args, **kwargs):
+    from tqdm import tqdm
+
     def show_progress():
         with tqdm(total=0, unit="s", bar_format="{desc}") as pbar:
             while not stop_event.is_set():
@@ -883,7 +882,7 @@ def progress_bar(iterable, unit="iter", description="Progress", remain=False):
     leave = False if remain == False else True
     return tqdm(iterable, desc=description, unit=unit, ncols=82, leave=leave)
 
-_console = Console()
+_console = None
 _spinner_thread = None
 _spinner_running = False
 _is_notebook = False
@@ -891,6 +890,14 @@ _start_time = None
 _show_elapsed = False
 
 
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 def _detect_notebook():
     try:
         from IPython import get_ipython
@@ -935,6 +942,7 @@ def start_progress(message="Processing...", spinner="dots", show_elapsed=False):
         if _is_notebook:
             from IPython.display import clear_output
             from rich.jupyter import print as jupyter_print
+            from rich.spinner import Spinner
             while _spinner_running:
                 clear_output(wait=True)
                 jupyter_print(Spinner(spinner, text=format_message()))
@@ -943,16 +951,16 @@ def start_progress(message="Processing...", spinner="dots", show_elapsed=False):
         else:
             status = None
             try:
-                status = _console.status(format_message(), spinner=spinner)
+                status = _get_console().status(format_message(), spinner=spinner)
                 status.start()
                 while _spinner_running:
                     status.update(format_message())
                     time.sleep(0.1)
             except LiveError:
                 while _spinner_running:
-                    _console.print(".", end="", soft_wrap=True)
+                    _get_console().print(".", end="", soft_wrap=True)
                     time.sleep(0.5)
-                _console.print()
+                _get_console().print()
             finally:
                 if status:
                     try:
@@ -982,9 +990,9 @@ def end_progress(success_message="Done!", failure_message=None, success=True, sh
         elapsed_str = f" for {_format_elapsed(datetime.now() - _start_time)}"
 
     if success:
-        _console.print(f"[bold green]{success_message}{elapsed_str}[/bold green]")
+        _get_console().print(f"[bold green]{success_message}{elapsed_str}[/bold green]")
     elif failure_message:
-        _console.print(f"[bold red]{failure_message}{elapsed_str}[/bold red]")
+        _get_console().print(f"[bold red]{failure_message}{elapsed_str}[/bold red]")
 def calculate_time_difference(start=0, end=0, length=None):
     if length is None:
         delta = round((end - start), 3)
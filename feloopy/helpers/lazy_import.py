@@ -0,0 +1,103 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import importlib
+
+IMPORT_TIME_BUDGET = 0.3
+LAZY_DEPENDENCIES = ['pandas', 'matplotlib', 'openpyxl', 'tabulate', 'rich', 'tqdm', 'joblib', 'pip']
+
+
+class LazyModule:
+    """
+    Stands for a module that is imported on its first attribute access, so that heavy dependencies (e.g., pandas or matplotlib) do not slow down ``import feloopy``.
+    """
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            module = self.__dict__['_module'] = importlib.import_module(self.__dict__['_name'])
+        return module
+
+    @property
+    def loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __reduce__(self):
+        return (LazyModule, (self.__dict__['_name'],))
+
+    def __repr__(self):
+        return f"<lazy module '{self.__dict__['_name']}' ({'loaded' if self.loaded else 'not loaded'})>"
+
+def lazy_function(module, name):
+    """
+    Returns a function that imports ``name`` from ``module`` on its first call and forwards the call to it.
+    """
+
+    def function(*args, **kwargs):
+        return getattr(importlib.import_module(module), name)(*args, **kwargs)
+
+    function.__name__ = function.__qualname__ = name
+    function.__doc__ = f"Lazily imported ``{module}.{name}``."
+    return function
+
+pd = LazyModule('pandas')
+plt = LazyModule('matplotlib.pyplot')
+style = LazyModule('matplotlib.style')
+
+def import_time(module='feloopy', repeat=3):
+    """
+    Measures the time of importing ``module`` in a fresh interpreter with ``python -X importtime``.
+
+    Returns the best total time (seconds) over ``repeat`` runs and the cumulative time (seconds) of each module imported in that run, from the slowest.
+    """
+
+    import subprocess
+    import sys
+
+    best_total, best_modules = None, None
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise ImportError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else f"Cannot import {module}.")
+
+        modules = dict()
+        for line in completed.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(cumulative) / 1e6
+
+        total = modules.get(module, 0.0)
+        if best_total is None or total < best_total:
+            best_total, best_modules = total, sorted(modules.items(), key=lambda item: item[1], reverse=True)
+
+    return best_total, best_modules
+
+def check_import_time(module='feloopy', budget=IMPORT_TIME_BUDGET, repeat=3, top=10, verbose=True):
+    """
+    Import-time regression check: returns True if importing ``module`` takes at most ``budget`` seconds (best of ``repeat`` runs) and none of the
+    ``LAZY_DEPENDENCIES`` is imported eagerly, and optionally prints the slowest imports.
+    """
+
+    total, modules = import_time(module, repeat)
+    eager = [dependency for dependency in LAZY_DEPENDENCIES if dependency in dict(modules)]
+    if verbose:
+        print(f"import {module}: {total:.3f} s (budget: {budget:.3f} s)")
+        for name, cumulative in modules[:top]:
+            print(f"{cumulative:10.3f} s  {name}")
+        if len(eager) != 0:
+            print(f"Eagerly imported: {', '.join(eager)}")
+    return total <= budget and len(eager) == 0
@@ -0,0 +1,168 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+_active_profiler = None
+
+
+class Profiler:
+    """
+    Collects the number of calls and the time spent in each phase of generating and solving a model, together with a timeline of these calls.
+
+    The generator entry points are wrapped with ``profiled``, which only measures time while a profiler is activated with ``profiling``.
+    """
+
+    def __init__(self, max_events=100000):
+        """
+        Parameters
+        ----------
+        max_events : int, optional
+            Maximum number of calls kept in the timeline; the totals keep counting beyond it.
+        """
+
+        self.phases = dict()
+        self.counters = dict()
+        self.events = []
+        self.max_events = max_events
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def record(self, phase, start, end):
+
+        with self.lock:
+            totals = self.phases.get(phase)
+            if totals is None:
+                totals = self.phases[phase] = [0, 0.0]
+            totals[0] += 1
+            totals[1] += end - start
+            if len(self.events) < self.max_events:
+                self.events.append((phase, start, end, threading.get_ident()))
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Activates the profiler and records the enclosed block as one call of the phase ``name``.
+        """
+
+        with profiling(self):
+            start = time.perf_counter()
+            try:
+                yield self
+            finally:
+                self.record(name, start, time.perf_counter())
+
+    def count(self, name, value):
+        self.counters[name] = value
+
+    def summary(self):
+        """
+        Returns a dictionary of phase to (calls, seconds).
+        """
+
+        return {phase: (calls, seconds) for phase, (calls, seconds) in self.phases.items()}
+
+    def trace(self):
+        """
+        Returns the timeline in the Chrome trace event format (viewable in chrome://tracing or Perfetto).
+        """
+
+        import os
+
+        process = os.getpid()
+        events = [{
+            'name': phase,
+            'cat': 'feloopy',
+            'ph': 'X',
+            'ts': (start - self.origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': process,
+            'tid': thread,
+        } for phase, start, end, thread in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': dict(self.counters)}
+
+    def save_trace(self, path):
+
+        import json
+
+        with open(path, 'w') as file:
+            json.dump(self.trace(), file)
+
+    def __repr__(self):
+        return f"Profiler(phases={len(self.phases)}, events={len(self.events)})"
+
+
+@contextmanager
+def profiling(profiler):
+    """
+    Activates a profiler for the enclosed block (and restores the previous one afterwards).
+    """
+
+    global _active_profiler
+    previous = _active_profiler
+    _active_profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _active_profiler = previous
+
+def profiled(phase):
+    """
+    Decorates a generator entry point so that its calls are recorded as the phase ``phase`` of the active profiler, if any.
+    """
+
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _active_profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(phase, start, time.perf_counter())
+
+        return wrapper
+
+    return decorator
+
+def measure_allocation(build, number=10000, repeat=5, keep=1000):
+    """
+    Microbenchmark of a constructor (e.g., ``lambda: model(method='heuristic', interface='feloopy', agent=agent)``).
+
+    Returns the best time per call (seconds) over ``repeat`` rounds of ``number`` calls, and the memory retained per built object (bytes) while ``keep`` of them are alive.
+    """
+
+    import gc
+    import timeit
+    import tracemalloc
+
+    build()
+    seconds = min(timeit.repeat(build, number=number, repeat=repeat)) / number
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects = [build() for _ in range(keep)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / keep
+    del objects
+
+    return seconds, retained
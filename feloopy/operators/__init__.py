@@ -14,4 +14,11 @@ from .pareto import *
 from .random_operators import *
 from .set_operators import *
 from .update_operators import *
-from .validator import *
\ No newline at end of file
+from .validator import *
+from .parallel_operators import *
+from .cache_operators import *
+from .indicator_operators import *
+from .sensitivity_operators import *
+from .penalty_operators import *
+from .history_operators import *
+from .tracing_operators import *
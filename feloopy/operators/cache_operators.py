@@ -0,0 +1,115 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import collections
+import hashlib
+import numpy as np
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of fitness values, keyed by a hash of the decoded values of the variables of a search agent.
+
+    Binary, integer and sequential variables are rounded or argsorted before an environment sees them, so many distinct
+    agents decode to the same solution; only the first of them has to be evaluated.
+    """
+
+    missing = object()
+
+    def __init__(self, variable_spread, variable_type, variable_bound, maxsize=4096):
+
+        self.maxsize = maxsize
+        self.values = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.segments = [
+            (variable_spread[name][0], variable_spread[name][1], variable_type[name], variable_bound[name][0], variable_bound[name][1])
+            for name in variable_spread.keys()
+        ]
+
+    def decode(self, X):
+        """
+        Decodes the rows of X the same way as the heuristic variables do.
+        """
+
+        X = np.asarray(X, dtype=float)
+        parts = []
+
+        for start, end, variable_type, lower, upper in self.segments:
+
+            block = X[:, start:end]
+
+            match variable_type:
+
+                case 'bvar' | 'ivar':
+
+                    parts.append(np.round(lower + block * (upper - lower)) + 0.0)
+
+                case 'svar':
+
+                    parts.append(np.argsort(block, axis=1).astype(float))
+
+                case _:
+
+                    parts.append(block)
+
+        return np.ascontiguousarray(np.concatenate(parts, axis=1))
+
+    def keys(self, X):
+
+        decoded = self.decode(np.reshape(X, (1, -1)) if np.ndim(X) == 1 else X)
+        return [hashlib.blake2b(row.tobytes(), digest_size=16).digest() for row in decoded]
+
+    def lookup(self, keys):
+        """
+        Returns the cached values of the keys (``FitnessCache.missing`` for misses) and the rows to evaluate.
+
+        Repeated keys within the same call are evaluated once and counted as hits.
+        """
+
+        values = []
+        pending = {}
+
+        for row, key in enumerate(keys):
+
+            value = self.values.get(key, self.missing)
+
+            if value is not self.missing:
+                self.values.move_to_end(key)
+                self.hits += 1
+            elif key in pending:
+                self.hits += 1
+            else:
+                pending[key] = row
+                self.misses += 1
+
+            values.append(value)
+
+        return values, list(pending.values())
+
+    def store(self, key, value):
+
+        self.values[key] = value
+        self.values.move_to_end(key)
+
+        if len(self.values) > self.maxsize:
+            self.values.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self):
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def clear(self):
+
+        self.values.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"FitnessCache(size={len(self.values)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
@@ -1,20 +1,17 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
-import pip
 import timeit
 import os
 import sys
-import pandas as pd
 import numpy as np
 import itertools as it
-import matplotlib.style as style
-import matplotlib.pyplot as plt
-from openpyxl import load_workbook
 import math as mt
 from ..helpers.formatter import *
+from ..helpers.lazy_import import LazyModule, lazy_function, pd, plt, style
 
-from tabulate import tabulate as tb
+load_workbook = lazy_function('openpyxl', 'load_workbook')
+tb = lazy_function('tabulate', 'tabulate')
 
 def if_then_else(*conditions_and_values):
     conditions = conditions_and_values[::2]
@@ -153,6 +150,8 @@ def install(package):
 
     '''
 
+    import pip
+
     if hasattr(pip, 'main'):
         pip.main(['install', package])
         pip.main(['install', '--upgrade', package])
@@ -170,6 +169,8 @@ def uninstall(package):
 
     '''
 
+    import pip
+
     if hasattr(pip, 'main'):
         pip.main(['uninstall', package])
     else:
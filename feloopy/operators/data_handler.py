@@ -2,7 +2,7 @@
 # See the file LICENSE file for licensing details.
 
 import numpy as np
-import pandas as pd
+from ..helpers.lazy_import import pd
 import itertools as it
 import os
 import json
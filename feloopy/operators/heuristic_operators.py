@@ -5,6 +5,7 @@
 
 from ..helpers.empty import *
 from ..helpers.error import *
+from .tracing_operators import Node, record
 import numpy as np
 import math as mt
 import inspect
@@ -13,6 +14,8 @@ import ast
 
 class NumpyVariable(np.ndarray):
     def __new__(cls, input_array):
+        if isinstance(input_array, Node):
+            return record(NumpyVariable, input_array)
         obj = np.asarray(input_array).view(cls)
         return obj
 
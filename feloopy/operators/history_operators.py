@@ -0,0 +1,198 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import timeit
+import warnings
+
+import numpy as np
+
+HISTORY_STATS = ['min', 'max', 'mean', 'std', 'time']
+
+
+class HistoryRecorder:
+    """
+    Records the convergence history of a heuristic search once per epoch, in a preallocated ``(episodes, epochs, stats, objectives)`` array
+    holding the minimum, maximum, mean and standard deviation of the rewards of the population and the seconds spent in the epoch (``HISTORY_STATS``).
+
+    Interfaces that evaluate a whole population per call record one epoch per call (``pop_size=None``); for the others, the rewards are buffered
+    and recorded every ``pop_size`` evaluations, whether they are evaluated one by one or in batches. With ``path``, the array is an on-disk ``.npy``
+    memmap (readable with ``np.load(path, mmap_mode='r')``), for very long runs.
+
+    Epochs and episodes beyond the preallocated ones grow the array in memory and are dropped (counted in ``dropped``) for a memmap.
+    """
+
+    def __init__(self, epochs, episodes=1, objectives=1, pop_size=None, path=None):
+
+        self.shape = (episodes, epochs, len(HISTORY_STATS), objectives)
+        self.pop_size = pop_size
+        self.path = path
+        self.counts = np.zeros(episodes, dtype=np.int64)
+        self.dropped = 0
+
+        if path is None:
+            self.data = np.full(self.shape, np.nan)
+        else:
+            self.data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=self.shape)
+            self.data[...] = np.nan
+
+        self.start_episode(0)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['data'] = None
+        state['path'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.data = np.full(self.shape, np.nan)
+
+    def resize(self, episodes, epochs):
+
+        if episodes <= self.shape[0] and epochs <= self.shape[1]:
+            return True
+        if self.path is not None:
+            return False
+
+        shape = (max(episodes, self.shape[0]), max(epochs, self.shape[1])) + self.shape[2:]
+        data = np.full(shape, np.nan)
+        data[:self.shape[0], :self.shape[1]] = self.data
+        self.data, self.shape = data, shape
+        self.counts = np.concatenate([self.counts, np.zeros(shape[0] - len(self.counts), dtype=np.int64)])
+        return True
+
+    def start_episode(self, index):
+
+        if index >= self.shape[0]:
+            self.resize(max(index + 1, 2*self.shape[0]), self.shape[1])
+        self.episode = index
+        if index < self.shape[0]:
+            self.counts[index] = 0
+        self.pending = np.empty((self.pop_size, self.shape[3])) if self.pop_size else None
+        self.pending_count = 0
+        self.clock = timeit.default_timer()
+
+    def record(self, rewards):
+        """
+        Records the rewards of evaluated agents (one per row, one column per objective).
+        """
+
+        rewards = np.reshape(np.asarray(rewards, dtype=float), (-1, self.shape[3]))
+
+        if self.pop_size is None:
+            self.record_stats(rewards.min(axis=0), rewards.max(axis=0), rewards.mean(axis=0), rewards.std(axis=0))
+            return
+
+        start = 0
+        while start < len(rewards):
+            taken = min(self.pop_size - self.pending_count, len(rewards) - start)
+            self.pending[self.pending_count:self.pending_count + taken] = rewards[start:start + taken]
+            self.pending_count += taken
+            start += taken
+            if self.pending_count == self.pop_size:
+                self.pending_count = 0
+                self.record_stats(self.pending.min(axis=0), self.pending.max(axis=0), self.pending.mean(axis=0), self.pending.std(axis=0))
+
+    def record_stats(self, minimum, maximum, mean, std):
+        """
+        Records one epoch from the statistics of the rewards of its population.
+        """
+
+        now = timeit.default_timer()
+        episode = self.episode
+
+        if episode < self.shape[0] and (self.counts[episode] < self.shape[1] or self.resize(self.shape[0], 2*self.shape[1])):
+            row = self.data[episode, self.counts[episode]]
+            row[0], row[1], row[2], row[3], row[4] = minimum, maximum, mean, std, now - self.clock
+            self.counts[episode] += 1
+        else:
+            self.dropped += 1
+
+        self.clock = now
+
+    def episode_history(self, index):
+        """
+        Returns the recorded ``(epochs, stats, objectives)`` history of an episode.
+        """
+
+        return np.array(self.data[index, :self.counts[index]])
+
+    def load_episode(self, index, history):
+        """
+        Stores the history of an episode recorded elsewhere (e.g., in a worker process).
+        """
+
+        if not self.resize(index + 1, len(history)):
+            self.dropped += 1
+            return
+        self.data[index, :len(history)] = history
+        self.data[index, len(history):] = np.nan
+        self.counts[index] = len(history)
+
+    @property
+    def episodes(self):
+        recorded = np.flatnonzero(self.counts)
+        return int(recorded[-1]) + 1 if len(recorded) else 0
+
+    @property
+    def epochs(self):
+        return int(self.counts.max()) if len(self.counts) else 0
+
+    def trajectory(self, stat, objective=0):
+        """
+        Returns the recorded values of a statistic (one of ``HISTORY_STATS``) as an ``(episodes, epochs)`` array, NaN-padded after early-stopped episodes.
+        """
+
+        episodes, epochs = max(1, self.episodes), self.epochs
+        return np.array(self.data[:episodes, :epochs, HISTORY_STATS.index(stat), objective])
+
+    def best(self, direction, objective=0):
+        """
+        Returns the best reward found so far at each epoch of each episode, as an ``(episodes, epochs)`` array.
+        """
+
+        if direction == 'max':
+            return np.fmax.accumulate(self.trajectory('max', objective), axis=1)
+        return np.fmin.accumulate(self.trajectory('min', objective), axis=1)
+
+    def summary(self):
+        """
+        Returns, for each epoch (one column per objective), the best maximum and minimum rewards so far over the episodes, their middle and range,
+        the average mean and standard deviation of the rewards, the bounds derived from the final range and the share of stagnating epochs (or ``None`` if nothing is recorded).
+        """
+
+        episodes, epochs = max(1, self.episodes), self.epochs
+        if epochs == 0:
+            return None
+        data = np.asarray(self.data[:episodes, :epochs])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            best_max = np.fmax.accumulate(np.nanmax(data[:, :, 1], axis=0), axis=0)
+            best_min = np.fmin.accumulate(np.nanmin(data[:, :, 0], axis=0), axis=0)
+            average = np.nanmean(data[:, :, 2], axis=0)
+            std = np.nanmean(data[:, :, 3], axis=0)
+
+        spread = best_max - best_min
+        lb_for_min = best_max - spread[-1]
+        ub_for_max = best_min + spread[-1]
+
+        return {
+            'best_max': best_max,
+            'best_min': best_min,
+            'middle': (best_max + best_min) / 2,
+            'range': spread,
+            'average': average,
+            'std': std,
+            'lb_for_min': lb_for_min,
+            'ub_for_max': ub_for_max,
+            'stagnation': np.sum(ub_for_max - best_max <= 1e-6) / max(1, epochs),
+        }
+
+    def flush(self):
+
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def __repr__(self):
+        return f"HistoryRecorder(episodes={self.episodes}, epochs={self.epochs}, path={self.path!r})"
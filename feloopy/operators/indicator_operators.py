@@ -0,0 +1,229 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+from .pareto import BLOCK_ELEMENTS, non_dominated, to_minimization
+
+EXACT_HV_OBJECTIVES = 5
+
+
+def as_front(points, directions=None):
+    """
+    Returns a front as a two-dimensional float matrix of minimized objective values, or ``None`` if it is empty.
+    """
+
+    if points is None:
+        return None
+    points = np.asarray(points, dtype=float)
+    if points.size == 0:
+        return None
+    if directions is not None and points.ndim == 1:
+        points = points.reshape(-1, len(directions))
+    return to_minimization(points, directions)
+
+def nearest_distances(A, B, plus=False, block_elements=BLOCK_ELEMENTS):
+    """
+    Returns the distance of each row of A to its nearest row of B, computed in blocks of rows of A.
+
+    With ``plus=True``, the modified distance of Ishibuchi et al. is used, in which only the objectives where the row of A is worse than the row of B count (minimization).
+    """
+
+    distances = np.empty(len(A))
+    block = max(1, block_elements // max(1, len(B) * A.shape[1]))
+    for start in range(0, len(A), block):
+        difference = A[start:start+block, None, :] - B[None, :, :]
+        if plus:
+            np.maximum(difference, 0, out=difference)
+        distances[start:start+block] = np.sqrt(np.einsum('ijk,ijk->ij', difference, difference)).min(axis=1)
+    return distances
+
+def gd_indicator(front, reference_front):
+    """
+    Generational distance: mean distance from the obtained front to the nearest point of the reference front (minimization).
+    """
+
+    return float(nearest_distances(front, reference_front).mean())
+
+def gd_plus_indicator(front, reference_front):
+    """
+    Generational distance plus: GD with the dominance-compliant modified distance (minimization).
+    """
+
+    return float(nearest_distances(front, reference_front, plus=True).mean())
+
+def igd_indicator(front, reference_front):
+    """
+    Inverted generational distance: mean distance from the reference front to the nearest point of the obtained front (minimization).
+    """
+
+    return float(nearest_distances(reference_front, front).mean())
+
+def igd_plus_indicator(front, reference_front):
+    """
+    Inverted generational distance plus: IGD with the dominance-compliant modified distance (minimization).
+    """
+
+    return float(nearest_distances(-reference_front, -front, plus=True).mean())
+
+def sp_indicator(front, block_elements=BLOCK_ELEMENTS):
+    """
+    Schott's spacing: standard deviation of the Manhattan distances between each point of the front and its nearest neighbour (0 means evenly spaced).
+    """
+
+    n = len(front)
+    if n < 2:
+        return 0.0
+
+    distances = np.empty(n)
+    block = max(1, block_elements // (n * front.shape[1]))
+    for start in range(0, n, block):
+        gaps = np.abs(front[start:start+block, None, :] - front[None, :, :]).sum(axis=2)
+        gaps[np.arange(len(gaps)), np.arange(start, start + len(gaps))] = np.inf
+        distances[start:start+block] = gaps.min(axis=1)
+    return float(np.sqrt(((distances - distances.mean())**2).sum() / (n - 1)))
+
+def ms_indicator(front, reference_front=None):
+    """
+    Maximum spread of the front.
+
+    With a reference front, this is the mean squared overlap of the ranges of both fronts relative to the range of the reference front (1 means the whole reference range is covered);
+    otherwise, it is the diagonal of the bounding box of the front.
+    """
+
+    lower, upper = front.min(axis=0), front.max(axis=0)
+    if reference_front is None:
+        return float(np.sqrt(((upper - lower)**2).sum()))
+
+    reference_lower, reference_upper = reference_front.min(axis=0), reference_front.max(axis=0)
+    span = reference_upper - reference_lower
+    overlap = np.minimum(upper, reference_upper) - np.maximum(lower, reference_lower)
+    ratio = np.divide(overlap, span, out=np.ones_like(span), where=span != 0)
+    return float(np.sqrt(np.mean(np.clip(ratio, 0, None)**2)))
+
+def hv_2d(front, reference_point):
+    """
+    Exact hypervolume of a two-objective front by a sweep over the first objective.
+    """
+
+    front = front[np.lexsort((front[:, 1], front[:, 0]))]
+    ceiling = np.concatenate([[reference_point[1]], np.minimum.accumulate(front[:, 1])[:-1]])
+    heights = np.clip(ceiling - front[:, 1], 0, None)
+    return float(((reference_point[0] - front[:, 0]) * heights).sum())
+
+def hv_wfg(front, reference_point):
+    """
+    Exact hypervolume by the WFG algorithm: the volume of a front is the sum of the exclusive volumes of its points, each computed from the non-dominated part of the limit set of the points after it.
+    """
+
+    if len(front) == 0:
+        return 0.0
+    if len(front) == 1:
+        return float(np.prod(reference_point - front[0]))
+    if front.shape[1] == 2:
+        return hv_2d(front, reference_point)
+
+    front = front[np.argsort(front[:, -1], kind='stable')[::-1]]
+    total = 0.0
+    for i in range(len(front)):
+        volume = np.prod(reference_point - front[i])
+        if i + 1 < len(front):
+            limited = np.maximum(front[i+1:], front[i])
+            limited = np.unique(limited[non_dominated(limited)], axis=0)
+            volume -= hv_wfg(limited, reference_point)
+        total += volume
+    return float(total)
+
+def hv_monte_carlo(front, reference_point, samples=100000, seed=None, block_elements=BLOCK_ELEMENTS):
+    """
+    Monte-Carlo estimate of the hypervolume: the fraction of uniform samples of the box between the ideal and the reference point that are dominated by the front.
+    """
+
+    rng = np.random.default_rng(seed)
+    lower = front.min(axis=0)
+    box = np.prod(reference_point - lower)
+    block = max(1, block_elements // (len(front) * front.shape[1]))
+    dominated = 0
+    for start in range(0, samples, block):
+        sample = rng.uniform(lower, reference_point, size=(min(block, samples - start), front.shape[1]))
+        weakly = np.ones((len(sample), len(front)), dtype=bool)
+        for k in range(front.shape[1]):
+            weakly &= front[None, :, k] <= sample[:, k, None]
+        dominated += int(weakly.any(axis=1).sum())
+    return float(box * dominated / samples)
+
+def hv_indicator(front, reference_point=None, normalize=False, samples=100000, seed=None):
+    """
+    Hypervolume dominated by the front up to the reference point (minimization).
+
+    The value is exact (WFG) for up to five objectives and a Monte-Carlo estimate beyond that.
+
+    Parameters
+    ----------
+    front : np.ndarray
+        Minimized objective values (one point per row).
+    reference_point : array_like, optional
+        Reference (nadir) point; the worst value of each objective over the front if not provided.
+    normalize : bool, optional
+        If True, the objectives are scaled to [0, 1] between the ideal and the reference point, so that the hypervolume lies in [0, 1].
+    samples : int, optional
+        Number of samples of the Monte-Carlo estimate.
+    seed : int, optional
+        Seed of the Monte-Carlo estimate.
+    """
+
+    reference_point = front.max(axis=0) if reference_point is None or len(reference_point) == 0 else np.asarray(reference_point, dtype=float)
+
+    if normalize:
+        lower = front.min(axis=0)
+        span = reference_point - lower
+        span[span == 0] = 1
+        front = (front - lower) / span
+        reference_point = (reference_point - lower) / span
+
+    front = front[(front < reference_point).all(axis=1)]
+    if len(front) == 0:
+        return 0.0
+    front = np.unique(front[non_dominated(front)], axis=0)
+
+    if front.shape[1] <= EXACT_HV_OBJECTIVES:
+        return hv_wfg(front, reference_point)
+    return hv_monte_carlo(front, reference_point, samples, seed)
+
+def calculate_indicators(points, directions, reference_front=None, reference_point=None, normalize_hv=False, samples=100000, seed=None):
+    """
+    Calculates the quality indicators of an obtained front and returns them in a dictionary.
+
+    The hypervolume ('hv'), spacing ('sp') and maximum spread ('ms') only need the obtained front; the distance-based indicators ('gd', 'gdp', 'igd', 'igdp') are calculated only when a reference front is given.
+
+    Parameters
+    ----------
+    points : array_like
+        Objective values of the obtained front (one point per row), in the original sense of the objectives.
+    directions : list
+        Direction of each objective ('min' or 'max').
+    reference_front : array_like, optional
+        Reference (e.g., true) Pareto front, in the original sense of the objectives.
+    reference_point : array_like, optional
+        Reference point of the hypervolume, in the original sense of the objectives.
+    """
+
+    front = as_front(points, directions)
+    reference = as_front(reference_front, directions)
+    if front is None:
+        return dict()
+    if reference_point is not None and len(reference_point) != 0:
+        reference_point = to_minimization(np.asarray(reference_point, dtype=float).reshape(1, -1), directions)[0]
+
+    indicators = dict()
+    indicators['hv'] = hv_indicator(front, reference_point, normalize_hv, samples, seed)
+    indicators['sp'] = sp_indicator(front)
+    indicators['ms'] = ms_indicator(front, reference)
+
+    if reference is not None:
+        indicators['gd'] = gd_indicator(front, reference)
+        indicators['gdp'] = gd_plus_indicator(front, reference)
+        indicators['igd'] = igd_indicator(front, reference)
+        indicators['igdp'] = igd_plus_indicator(front, reference)
+
+    return indicators
@@ -0,0 +1,551 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import concurrent.futures
+import math as mt
+import threading
+import numpy as np
+
+from .tracing_operators import CompiledEnvironment
+
+
+class EnvironmentEvaluator:
+    """
+    Picklable evaluator of a heuristic environment, shipped once to the workers of an evaluation pool.
+    """
+
+    def __init__(self, environment, args, kwargs, name, method, interface, directions, solver, options, compiled=False, penalty_aggregator=None):
+
+        self.environment = environment
+        self.args = args
+        self.kwargs = kwargs
+        self.name = name
+        self.method = method
+        self.interface = interface
+        self.directions = directions
+        self.solver = solver
+        self.options = options
+        self.compiled = compiled
+        self.penalty_aggregator = penalty_aggregator
+        self.local = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    def build(self, agent_properties):
+
+        from ..feloopy import model
+
+        shell = getattr(self.local, 'shell', None)
+
+        if self.compiled and shell is not None:
+            return shell.load_agent(agent_properties)
+
+        lm = model(method=self.method, name=self.name, interface=self.interface, agent=agent_properties, no_agents=self.options.get("pop_size", 50))
+        lm.penalty_aggregator = self.penalty_aggregator
+        if self.compiled:
+            self.local.shell = lm
+        return lm
+
+    def solve(self, lm):
+
+        if len(self.directions) == 1:
+            lm.sol(directions=list(self.directions), solver=self.solver, solver_options=self.options)
+        else:
+            lm.sol(list(self.directions), self.solver, self.options, obj_id='all')
+
+    def __call__(self, agent_properties):
+
+        if self.compiled and agent_properties[0] == 'active':
+            compiled = getattr(self.local, 'compiled', None)
+            if compiled is None:
+                compiled = self.local.compiled = CompiledEnvironment(self.build, self.environment, self.args, self.kwargs, self.solve, self.directions)
+            return compiled(agent_properties)[agent_properties]
+
+        lm = self.build(agent_properties)
+        lm = self.environment(lm, *self.args, **self.kwargs)
+        self.solve(lm)
+        return lm[agent_properties]
+
+
+class ModelBuilder:
+    """
+    Picklable builder of a model from its environment, used to build and solve independent models in worker processes.
+    """
+
+    def __init__(self, environment, args, kwargs, **model_arguments):
+
+        self.environment = environment
+        self.args = args
+        self.kwargs = kwargs
+        self.model_arguments = model_arguments
+
+    def __call__(self):
+
+        from ..feloopy import model
+
+        return self.environment(model(**self.model_arguments), *self.args, **self.kwargs)
+
+
+worker_evaluator = None
+
+def initialize_worker(payload):
+
+    import cloudpickle
+
+    global worker_evaluator
+    worker_evaluator = cloudpickle.loads(payload)
+
+def evaluate_chunk(agent_properties, per_agent, evaluator=None):
+
+    evaluator = worker_evaluator if evaluator is None else evaluator
+    status, X, spread, penalty = agent_properties
+
+    if per_agent:
+        return [evaluator([status, x, spread, penalty]) for x in X]
+    return evaluator([status, X, spread, penalty])
+
+
+class EvaluationPool:
+    """
+    Persistent pool that fans the rows of a population out to thread or process workers and gathers the results in order.
+    """
+
+    def __init__(self, evaluator, backend="serial", n_workers=None, chunk_size=None):
+
+        import os
+
+        self.evaluator = evaluator
+        self.backend = backend
+        self.n_workers = n_workers if n_workers else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+
+        match backend:
+
+            case "thread":
+
+                self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.n_workers)
+
+            case "process":
+
+                import cloudpickle
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.n_workers, initializer=initialize_worker, initargs=(cloudpickle.dumps(evaluator),))
+
+            case _:
+
+                self.executor = None
+
+    def chunks(self, number_of_agents):
+
+        chunk_size = self.chunk_size if self.chunk_size else mt.ceil(number_of_agents / self.n_workers)
+        return [(start, min(start + chunk_size, number_of_agents)) for start in range(0, number_of_agents, chunk_size)]
+
+    def evaluate(self, status, X, spread, penalty, per_agent=False):
+        """
+        Evaluates the agents in the rows of X and returns the gathered results in the original row order.
+        """
+
+        if self.executor is None:
+            return evaluate_chunk([status, X, spread, penalty], per_agent, self.evaluator)
+
+        if self.backend == "thread":
+            futures = [self.executor.submit(evaluate_chunk, [status, X[start:end], spread, penalty], per_agent, self.evaluator) for start, end in self.chunks(len(X))]
+        else:
+            futures = [self.executor.submit(evaluate_chunk, [status, X[start:end], spread, penalty], per_agent) for start, end in self.chunks(len(X))]
+
+        results = [future.result() for future in futures]
+
+        if per_agent:
+            return [result for chunk in results for result in chunk]
+
+        results = [np.asarray(result) for result in results]
+        if self.evaluator.interface == 'feloopy' or results[0].ndim == 1:
+            return np.concatenate(results, axis=0)
+        return np.concatenate(results, axis=1)
+
+    def close(self):
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+def failed_scenario(error, cpt=0.0):
+    """
+    Returns the outcome of a sensitivity scenario that raised an error.
+    """
+
+    return {'health': False, 'cpt': cpt, 'objectives': None, 'solutions': {}, 'error': f"{type(error).__name__}: {error}"}
+
+def evaluate_scenario(payload):
+    """
+    Runs one sensitivity scenario on an isolated copy of a search, unpickled from its payload, and returns its outcome.
+    """
+
+    import cloudpickle
+    from ..feloopy import search
+
+    state, environment, dataset, parameter_name, parameter_value = cloudpickle.loads(payload)
+    instance = search.__new__(search)
+    instance.__dict__.update(state)
+    return instance.run_scenario(environment, dataset, parameter_name, parameter_value)
+
+def run_scenarios(state, environment, dataset, scenarios, n_jobs=None, backend="process"):
+    """
+    Runs sensitivity scenarios in a thread or process pool and returns their outcomes in the order of the scenarios.
+
+    Each scenario receives its own copy of the search state and the dataset, pickled together (so that the environment keeps pointing to the copied dataset), and the failures are recorded per scenario.
+
+    Parameters
+    ----------
+    state : dict
+        Attributes of the search to copy into each scenario.
+    scenarios : list
+        Pairs of (parameter name, parameter value).
+    n_jobs : int, optional
+        Number of workers; all available cores if None or -1.
+    backend : str, optional
+        'process' or 'thread'.
+    """
+
+    import cloudpickle
+    import os
+
+    n_workers = (os.cpu_count() or 1) if n_jobs in [None, -1] else n_jobs
+    executor_class = concurrent.futures.ThreadPoolExecutor if backend == "thread" else concurrent.futures.ProcessPoolExecutor
+
+    with executor_class(max_workers=n_workers) as executor:
+        futures = [executor.submit(evaluate_scenario, cloudpickle.dumps((state, environment, dataset, parameter_name, parameter_value))) for parameter_name, parameter_value in scenarios]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as error:
+                outcomes.append(failed_scenario(error))
+
+    return outcomes
+
+
+def peak_memory():
+    """
+    Returns the peak resident set size of the current process in megabytes, or None if it is not available on this platform.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+def benchmark_run(payload, connection):
+    """
+    Generates and solves the model of a search with one algorithm and sends the record of the run through the connection.
+    """
+
+    import os
+    import sys
+    import timeit
+    import cloudpickle
+    from ..feloopy import search
+
+    sys.stdout.flush()
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+    state, environment, interface, solver, seed = cloudpickle.loads(payload)
+    record = {'status': 'failed', 'objective': None, 'mgt': None, 'solve_time': None, 'peak_rss': None, 'error': None}
+
+    try:
+        instance = search.__new__(search)
+        instance.__dict__.update(state)
+        instance.interface = interface
+        instance.solver = solver
+
+        np.random.seed(seed)
+        from ..algorithms.heuristic.kernels import NUMBA_AVAILABLE, seed_kernels
+        if NUMBA_AVAILABLE:
+            seed_kernels(seed)
+
+        start = timeit.default_timer()
+        instance.create_env(environment, verbose=instance.verbose)
+        record['mgt'] = timeit.default_timer() - start
+        instance.run(verbose=instance.verbose)
+        objective = np.asarray(instance.get_obj(), dtype=float)
+        record['objective'] = float(objective) if objective.ndim == 0 else objective.tolist()
+        record['solve_time'] = float(instance.em.get_time())
+        record['status'] = 'ok' if instance.healthy() else 'unhealthy'
+    except Exception as error:
+        record['error'] = f"{type(error).__name__}: {error}"
+
+    record['peak_rss'] = peak_memory()
+    connection.send(record)
+    connection.close()
+
+def run_benchmarks(state, environment, runs, n_jobs=1, timeout=None, callback=None, seed=None):
+    """
+    Runs each benchmark run in its own subprocess, with up to ``n_jobs`` subprocesses at a time, and returns their records in the order of the runs.
+
+    A run that exceeds the wall-clock ``timeout`` (in seconds) is terminated and recorded as 'timeout'; a subprocess that exits without
+    reporting (e.g., a crashing solver) is recorded as 'failed' with its exit code.
+
+    Each run seeds its random generators from ``SeedSequence(seed).spawn``, so that repeated runs are independent samples (and reproducible for a given ``seed``).
+
+    Parameters
+    ----------
+    runs : list
+        Pairs of (interface, solver), one per run.
+    callback : callable, optional
+        Called with the position and the record of each finished run.
+    """
+
+    import multiprocessing
+    import multiprocessing.connection
+    import os
+    import time
+    import cloudpickle
+
+    context = multiprocessing.get_context()
+    n_jobs = (os.cpu_count() or 1) if n_jobs in [None, -1] else n_jobs
+    records = [None] * len(runs)
+    seeds = episode_seeds(len(runs), seed)
+    pending = list(range(len(runs)))
+    active = dict()
+
+    def finish(position, record):
+        process, connection, started = active.pop(position)
+        record['wall_time'] = time.perf_counter() - started
+        connection.close()
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        records[position] = record
+        if callback:
+            callback(position, record)
+
+    while pending or active:
+
+        while pending and len(active) < n_jobs:
+            position = pending.pop(0)
+            interface, solver = runs[position]
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=benchmark_run, args=(cloudpickle.dumps((state, environment, interface, solver, seeds[position])), sender), daemon=True)
+            process.start()
+            sender.close()
+            active[position] = (process, receiver, time.perf_counter())
+
+        connections = {connection: position for position, (process, connection, started) in active.items()}
+        for connection in multiprocessing.connection.wait(list(connections), timeout=0.05):
+            position = connections[connection]
+            try:
+                record = connection.recv()
+            except EOFError:
+                process = active[position][0]
+                process.join()
+                record = {'status': 'failed', 'objective': None, 'mgt': None, 'solve_time': None, 'peak_rss': None, 'error': f"Worker exited with code {process.exitcode}"}
+            finish(position, record)
+
+        if timeout is not None:
+            now = time.perf_counter()
+            for position in [position for position, (process, connection, started) in active.items() if now - started > timeout]:
+                active[position][0].terminate()
+                finish(position, {'status': 'timeout', 'objective': None, 'mgt': None, 'solve_time': None, 'peak_rss': None, 'error': f"Exceeded the time limit of {timeout} seconds"})
+
+    return records
+
+
+attached_blocks = dict()
+
+def attach_shared_array(name, shape, dtype):
+    """
+    Returns a read-only array backed by an existing shared memory block, without copying it.
+    """
+
+    from multiprocessing import shared_memory
+
+    if name not in attached_blocks:
+        attached_blocks[name] = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=attached_blocks[name].buf)
+    array.flags.writeable = False
+    return array
+
+
+class SharedDataset:
+    """
+    Broadcasts the large numpy arrays of one or more datasets to worker processes through shared memory.
+
+    The arrays are copied once into shared memory blocks; payloads pickled with ``dumps`` then refer to these blocks instead of
+    carrying the arrays, so that workers attach to them (read-only) without copying, wherever the arrays are referenced.
+    """
+
+    def __init__(self, datasets, min_bytes=2**20):
+        """
+        Parameters
+        ----------
+        datasets : list
+            Datasets (``DataToolkit`` objects, dictionaries, possibly nested, or arrays) whose arrays are shared; other values are ignored.
+        min_bytes : int, optional
+            Arrays smaller than this are pickled as usual.
+        """
+
+        self.blocks = []
+        self.shared = dict()
+        self.min_bytes = min_bytes
+
+        visited = set()
+        for dataset in datasets:
+            self.share(dataset, visited)
+
+    def share(self, value, visited):
+        """
+        Copies a large array, or the large arrays held by a dataset or dictionary, into shared memory blocks.
+        """
+
+        from multiprocessing import shared_memory
+
+        if type(value) is np.ndarray:
+            if value.nbytes >= self.min_bytes and value.dtype != object and id(value) not in self.shared:
+                block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+                np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+                self.blocks.append(block)
+                self.shared[id(value)] = (block.name, value.shape, value.dtype.str)
+            return
+
+        data = getattr(value, 'data', value)
+        if isinstance(data, dict) and id(data) not in visited:
+            visited.add(id(data))
+            for item in data.values():
+                self.share(item, visited)
+
+    def dumps(self, obj):
+        """
+        Pickles an object with cloudpickle, replacing the shared arrays by references to their blocks.
+        """
+
+        import io
+        import cloudpickle
+
+        shared = self.shared
+
+        class SharedPickler(cloudpickle.CloudPickler):
+
+            def reducer_override(self, candidate):
+                if type(candidate) is np.ndarray and id(candidate) in shared:
+                    return attach_shared_array, shared[id(candidate)]
+                return super().reducer_override(candidate)
+
+        buffer = io.BytesIO()
+        SharedPickler(buffer).dump(obj)
+        return buffer.getvalue()
+
+    @property
+    def nbytes(self):
+        return sum(block.size for block in self.blocks)
+
+    def close(self):
+
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+        self.shared = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def __repr__(self):
+        return f"SharedDataset(arrays={len(self.shared)}, nbytes={self.nbytes})"
+
+
+def search_record(instance):
+    """
+    Returns a compact, picklable record of a solved search: its health, objective values, solutions and timing.
+    """
+
+    healthy = bool(instance.healthy())
+    return {
+        'name': instance.name,
+        'status': 'ok' if healthy else 'unhealthy',
+        'objective': instance.get_obj() if healthy else None,
+        'solutions': getattr(instance, 'solutions', None) if healthy else None,
+        'mgt': instance.mgt,
+        'cpt': getattr(instance, 'cpt', None),
+        'error': None,
+    }
+
+def run_search(payload):
+    """
+    Builds and solves a search from a pickled configuration in a worker process and returns its compact record.
+    """
+
+    import cloudpickle
+    from ..feloopy import search
+
+    configuration = cloudpickle.loads(payload)
+    try:
+        return search_record(search(**configuration))
+    except Exception as error:
+        return {'name': configuration.get('name'), 'status': 'failed', 'objective': None, 'solutions': None, 'mgt': None, 'cpt': None, 'error': f"{type(error).__name__}: {error}"}
+
+
+worker_episode = None
+
+def initialize_episode_worker(payload):
+
+    import cloudpickle
+
+    global worker_episode
+    worker_episode = cloudpickle.loads(payload)
+
+def run_episode(task, episode=None):
+
+    episode = worker_episode if episode is None else episode
+    return episode(*task)
+
+def episode_seeds(number_of_times, seed=None):
+    """
+    Returns independent and reproducible seeds of ``number_of_times`` episodes, spawned from the seed sequence of ``seed``.
+    """
+
+    return [int(child.generate_state(1, dtype=np.uint32)[0]) for child in np.random.SeedSequence(seed).spawn(number_of_times)]
+
+def run_episodes(episode, number_of_times, n_jobs=1, seed=None):
+    """
+    Runs ``number_of_times`` independent episodes of a heuristic algorithm, with up to ``n_jobs`` worker processes at a time, and returns their records in order.
+
+    Each episode is seeded from ``SeedSequence(seed).spawn``, so that the episodes are reproducible for a given ``seed`` whatever the number of workers. Serial
+    episodes without a seed keep the current state of the random generators.
+
+    Parameters
+    ----------
+    episode : callable
+        Picklable callable that runs one episode for its position and seed (or ``None``) and returns its record.
+    """
+
+    import os
+
+    n_jobs = (os.cpu_count() or 1) if n_jobs in [None, -1] else n_jobs
+    seeds = episode_seeds(number_of_times, seed) if seed is not None or n_jobs != 1 else [None] * number_of_times
+
+    tasks = list(enumerate(seeds))
+
+    if n_jobs == 1 or number_of_times == 1:
+        return [run_episode(task, episode) for task in tasks]
+
+    import cloudpickle
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(n_jobs, number_of_times), initializer=initialize_episode_worker, initargs=(cloudpickle.dumps(episode),)) as executor:
+        return list(executor.map(run_episode, tasks))
@@ -1,4 +1,309 @@
 # Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
 # See the file LICENSE file for licensing details.
 
-# Placeholder
\ No newline at end of file
+import heapq
+
+import numpy as np
+
+BLOCK_ELEMENTS = 2**22
+
+
+def to_minimization(points, directions=None):
+    """
+    Returns the objective values as a float matrix in which every objective is minimized ('max' columns are negated).
+    """
+
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1:
+        points = points.reshape(-1, 1)
+    if directions is None:
+        return points
+    signs = np.array([-1.0 if direction == 'max' else 1.0 for direction in directions])
+    return points * signs
+
+def dominated_by(A, B, block_elements=BLOCK_ELEMENTS):
+    """
+    Returns a boolean mask over the rows of A that are dominated by at least one row of B (minimization), checked in blocks of rows of A.
+    """
+
+    mask = np.zeros(len(A), dtype=bool)
+    if len(A) == 0 or len(B) == 0:
+        return mask
+
+    block = max(1, block_elements // len(B))
+    for start in range(0, len(A), block):
+        a = A[start:start+block]
+        weakly = np.ones((len(a), len(B)), dtype=bool)
+        strictly = np.zeros((len(a), len(B)), dtype=bool)
+        for k in range(A.shape[1]):
+            weakly &= B[None, :, k] <= a[:, k, None]
+            strictly |= B[None, :, k] < a[:, k, None]
+        mask[start:start+block] = (weakly & strictly).any(axis=1)
+    return mask
+
+def covered(T, B, k, leaf=64):
+    """
+    Returns a boolean mask over the rows of B that are weakly dominated by at least one row of T on the objectives from ``k`` on (minimization).
+
+    The last two objectives are checked with a sweep over T sorted by the first of them. Otherwise, both sets are split at the median of objective ``k``:
+    rows of B above it only need the rows of T below it on the objectives after ``k``, which gives the O(n log^(m-2) n) merge of Kung's algorithm.
+    """
+
+    mask = np.zeros(len(B), dtype=bool)
+    if len(T) == 0 or len(B) == 0:
+        return mask
+
+    m = T.shape[1]
+    if k == m - 1:
+        return B[:, k] >= T[:, k].min()
+
+    if k == m - 2:
+        order = np.argsort(T[:, k], kind='stable')
+        lowest = np.minimum.accumulate(T[order, k+1])
+        index = np.searchsorted(T[order, k], B[:, k], side='right') - 1
+        mask[index >= 0] = lowest[index[index >= 0]] <= B[index >= 0, k+1]
+        return mask
+
+    if len(T)*len(B) <= leaf*leaf:
+        return np.all(T[None, :, k:] <= B[:, None, k:], axis=2).any(axis=1)
+
+    values = np.concatenate([T[:, k], B[:, k]])
+    pivot, highest = np.partition(values, len(values)//2)[len(values)//2], values.max()
+    if pivot == values.min() == highest:
+        return covered(T, B, k+1, leaf)
+    if pivot == highest:
+        pivot = values[values < highest].max()
+
+    low, high = T[:, k] <= pivot, B[:, k] > pivot
+    mask[~high] = covered(T[low], B[~high], k, leaf)
+    mask[high] = covered(T[~low], B[high], k, leaf) | covered(T[low], B[high], k+1, leaf)
+    return mask
+
+def kung(F, leaf=64):
+    """
+    Kung's divide-and-conquer filter over the rows of F, which must be unique and sorted lexicographically; returns the positions of the non-dominated rows.
+
+    A row of the bottom half is dominated by the top half if and only if a non-dominated row of the top half weakly dominates it on all objectives but the first.
+    """
+
+    n = len(F)
+    if n <= leaf:
+        return np.flatnonzero(~dominated_by(F, F))
+
+    top = kung(F[:n//2], leaf)
+    bottom = kung(F[n//2:], leaf) + n//2
+    return np.concatenate([top, bottom[~covered(F[top], F[bottom], 1, leaf)]])
+
+def sweep(F):
+    """
+    Three-objective sweep over the rows of F, which must be unique and sorted lexicographically; returns a boolean mask of the non-dominated rows.
+
+    The non-dominated projections of the rows seen so far on the last two objectives are kept as a staircase, so each row is checked with one binary search.
+    """
+
+    import bisect
+
+    keep = np.zeros(len(F), dtype=bool)
+    second, third = [], []
+
+    for position, (_, f2, f3) in enumerate(F.tolist()):
+
+        index = bisect.bisect_right(second, f2) - 1
+        if index >= 0 and third[index] <= f3:
+            continue
+
+        keep[position] = True
+        index = bisect.bisect_left(second, f2)
+        end = index
+        while end < len(second) and third[end] >= f3:
+            end += 1
+        second[index:end] = [f2]
+        third[index:end] = [f3]
+
+    return keep
+
+def non_dominated(points, directions=None):
+    """
+    Returns a boolean mask of the non-dominated rows of points.
+
+    Duplicated rows share the same status. After a lexicographic sort, two objectives are filtered with a vectorized sweep, three with a staircase sweep, and more with Kung's algorithm over blocked dominance checks.
+
+    Parameters
+    ----------
+    points : array_like
+        Objective values (one solution per row).
+    directions : list, optional
+        Direction of each objective ('min' or 'max'); all objectives are minimized if not provided.
+    """
+
+    F = to_minimization(points, directions)
+    if len(F) == 0:
+        return np.zeros(0, dtype=bool)
+
+    unique, inverse = np.unique(F, axis=0, return_inverse=True)
+    inverse = np.ravel(inverse)
+
+    match unique.shape[1]:
+
+        case 1:
+
+            keep = unique[:, 0] == unique[0, 0]
+
+        case 2:
+
+            previous = np.minimum.accumulate(unique[:, 1])
+            keep = np.ones(len(unique), dtype=bool)
+            keep[1:] = unique[1:, 1] < previous[:-1]
+
+        case 3:
+
+            keep = sweep(unique)
+
+        case _:
+
+            keep = np.zeros(len(unique), dtype=bool)
+            keep[kung(unique)] = True
+
+    return keep[inverse]
+
+def non_dominated_sort(points, directions=None):
+    """
+    Returns the rank of the front each row of points belongs to (0 for the non-dominated front).
+    """
+
+    F = to_minimization(points, directions)
+    ranks = np.full(len(F), -1, dtype=np.int64)
+    remaining = np.arange(len(F))
+    rank = 0
+
+    while len(remaining) != 0:
+        front = non_dominated(F[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+
+    return ranks
+
+def crowding_distance(points, directions=None):
+    """
+    Returns the crowding distance of each row of points within its own set; boundary rows get an infinite distance.
+    """
+
+    F = to_minimization(points, directions)
+    n, m = F.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+
+    order = np.argsort(F, axis=0, kind='stable')
+    sorted_F = np.take_along_axis(F, order, axis=0)
+    span = sorted_F[-1] - sorted_F[0]
+    span[span == 0] = 1
+
+    gaps = np.zeros((n, m))
+    gaps[1:-1] = (sorted_F[2:] - sorted_F[:-2]) / span
+    gaps[0] = gaps[-1] = np.inf
+    np.add.at(distance, order.ravel(), gaps.ravel())
+    return distance
+
+def truncate_front(points, cap, directions=None):
+    """
+    Returns the positions of the ``cap`` rows of a front to keep, removing the most crowded rows one at a time.
+
+    The rows are linked to their neighbors along each objective and kept in a heap by crowding distance, so a removal only updates the distances of its
+    neighbors. Once only boundary rows are left, their distances are recomputed after each removal.
+    """
+
+    F = to_minimization(points, directions)
+    n, m = F.shape
+    alive = np.ones(n, dtype=bool)
+
+    if n > max(cap, 2):
+
+        order = np.argsort(F, axis=0, kind='stable')
+        span = F[order[-1], np.arange(m)] - F[order[0], np.arange(m)]
+        span[span == 0] = 1
+        previous = np.full((n, m), -1, dtype=np.int64)
+        following = np.full((n, m), -1, dtype=np.int64)
+        for k in range(m):
+            previous[order[1:, k], k] = order[:-1, k]
+            following[order[:-1, k], k] = order[1:, k]
+
+        values, span = F.tolist(), span.tolist()
+        previous, following = previous.tolist(), following.tolist()
+
+        def distance(i):
+            if -1 in previous[i] or -1 in following[i]:
+                return np.inf
+            return sum((values[following[i][k]][k] - values[previous[i][k]][k])/span[k] for k in range(m))
+
+        distances = [distance(i) for i in range(n)]
+        heap = [(d, i) for i, d in enumerate(distances)]
+        heapq.heapify(heap)
+
+        size = n
+        while size > cap:
+            d, i = heapq.heappop(heap)
+            if not alive[i] or d != distances[i]:
+                continue
+            if d == np.inf:
+                break
+            alive[i] = False
+            size -= 1
+            neighbors = set()
+            for k in range(m):
+                before, after = previous[i][k], following[i][k]
+                following[before][k], previous[after][k] = after, before
+                neighbors.update((before, after))
+            for j in neighbors:
+                distances[j] = distance(j)
+                heapq.heappush(heap, (distances[j], j))
+
+    keep = np.flatnonzero(alive)
+    while len(keep) > cap:
+        keep = np.delete(keep, np.argmin(crowding_distance(F[keep])))
+    return keep
+
+
+class ParetoArchive:
+    """
+    Incremental archive of the non-dominated solutions found so far, optionally bounded by ``archive_cap``.
+
+    When the archive grows beyond its cap, the most crowded solutions are dropped first, so that the extremes of the front are kept.
+    """
+
+    def __init__(self, directions, archive_cap=None):
+
+        self.directions = list(directions)
+        self.archive_cap = archive_cap
+        self.points = np.zeros((0, len(self.directions)))
+        self.items = []
+
+    def add(self, points, items=None):
+        """
+        Merges new objective values (one per row) and their solutions into the archive and returns the number of solutions kept.
+        """
+
+        points = to_minimization(points).reshape(-1, len(self.directions))
+        items = [None] * len(points) if items is None else list(items)
+
+        merged_points = np.concatenate([self.points, points], axis=0)
+        merged_items = self.items + items
+
+        keep = np.flatnonzero(non_dominated(merged_points, self.directions))
+        _, first = np.unique(merged_points[keep], axis=0, return_index=True)
+        keep = keep[np.sort(first)]
+
+        if self.archive_cap is not None and len(keep) > self.archive_cap:
+            keep = keep[np.sort(truncate_front(merged_points[keep], self.archive_cap, self.directions))]
+
+        self.points = merged_points[keep]
+        self.items = [merged_items[position] for position in keep]
+        return len(keep)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"ParetoArchive(size={len(self.points)}, archive_cap={self.archive_cap})"
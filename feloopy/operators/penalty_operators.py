@@ -0,0 +1,191 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import threading
+
+import numpy as np
+
+PENALTY_AGGREGATIONS = ['max', 'sum_squares', 'adaptive']
+
+
+class PenaltyAggregator:
+    """
+    Aggregates the constraints of a heuristic model into one penalty per search agent, and keeps the rate at which each constraint is violated.
+
+    The value of a constraint is its violation (positive if violated, non-positive if satisfied). The values of a population are written
+    column by column into a column-major ``(pop_size, n_constraints)`` buffer, allocated on the first evaluation and reused afterwards, and aggregated as:
+
+    - 'max': the squared largest violation (the default of feloopy),
+    - 'sum_squares': the sum of the squared violations,
+    - 'adaptive': a weighted sum of the squared violations, in which the weight of a constraint is multiplied by ``adaptive_factor`` once per population
+      (every ``adaptive_period`` evaluated agents) in which more than ``adaptive_target`` of the agents violate it, and divided by it otherwise
+      (within ``adaptive_bounds``). All the agents of a population are thus penalized with the same weights, whether they are evaluated together or one by one.
+
+    The penalty is then multiplied by the penalty coefficient and added to (min) or subtracted from (max) the objectives.
+    """
+
+    def __init__(self, aggregation='max', adaptive_factor=1.5, adaptive_target=0.0, adaptive_bounds=(1.0, 1e6), adaptive_period=50):
+
+        if aggregation not in PENALTY_AGGREGATIONS:
+            raise ValueError(f"Invalid penalty aggregation '{aggregation}'; expected one of {PENALTY_AGGREGATIONS}.")
+
+        self.aggregation = aggregation
+        self.adaptive_factor = adaptive_factor
+        self.adaptive_target = adaptive_target
+        self.adaptive_bounds = adaptive_bounds
+        self.adaptive_period = max(1, int(adaptive_period))
+        self.buffers = dict()
+        self.weights = np.ones(0)
+        self.violations = np.zeros(0, dtype=np.int64)
+        self.evaluated = 0
+        self.pending = np.zeros(0, dtype=np.int64)
+        self.pending_agents = 0
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        state['buffers'] = dict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def buffer(self, pop_size, n_constraints):
+        buffer = self.buffers.get((pop_size, n_constraints))
+        if buffer is None:
+            buffer = self.buffers[(pop_size, n_constraints)] = (np.empty((pop_size, n_constraints), order='F'), np.empty((pop_size, n_constraints), dtype=bool, order='F'))
+        return buffer
+
+    def resize(self, n_constraints):
+        if len(self.violations) < n_constraints:
+            self.violations = np.concatenate([self.violations, np.zeros(n_constraints - len(self.violations), dtype=np.int64)])
+            self.weights = np.concatenate([self.weights, np.full(n_constraints - len(self.weights), float(self.adaptive_bounds[0]))])
+            self.pending = np.concatenate([self.pending, np.zeros(n_constraints - len(self.pending), dtype=np.int64)])
+
+    def adapt(self, counts, agents):
+        """
+        Adds the violation counts of evaluated agents to the current population, and updates the adaptive weights once it is complete.
+        """
+
+        self.pending[:len(counts)] += counts
+        self.pending_agents += agents
+        if self.pending_agents < self.adaptive_period:
+            return
+        low, high = self.adaptive_bounds
+        grow = self.pending > self.adaptive_target * self.pending_agents
+        np.clip(np.where(grow, self.weights * self.adaptive_factor, self.weights / self.adaptive_factor), low, high, out=self.weights)
+        self.pending[:] = 0
+        self.pending_agents = 0
+
+    def aggregate(self, constraints, pop_size):
+        """
+        Returns the penalty of each agent (before the penalty coefficient) and whether each agent violates at least one constraint.
+
+        Parameters
+        ----------
+        constraints : list
+            Values of the constraints, each a scalar or an array with one value per agent.
+        pop_size : int
+            Number of agents.
+        """
+
+        n_constraints = len(constraints)
+        if n_constraints == 0:
+            return np.zeros(pop_size), np.zeros(pop_size, dtype=bool)
+
+        with self.lock:
+
+            values, violated = self.buffer(pop_size, n_constraints)
+            try:
+                np.concatenate(constraints, axis=1, out=values)
+            except (ValueError, np.AxisError):
+                for column, constraint in enumerate(constraints):
+                    values[:, column] = np.ravel(constraint)
+
+            np.greater(values, 0, out=violated)
+            counts = violated.sum(axis=0, dtype=np.int64)
+            self.resize(n_constraints)
+            self.violations[:n_constraints] += counts
+            self.evaluated += pop_size
+
+            match self.aggregation:
+
+                case 'max':
+
+                    penalty = values.max(axis=1)
+                    np.maximum(penalty, 0, out=penalty)
+                    infeasible = penalty > 0
+                    penalty *= penalty
+                    return penalty, infeasible
+
+                case 'sum_squares':
+
+                    np.maximum(values, 0, out=values)
+                    np.square(values, out=values)
+                    penalty = values.sum(axis=1)
+
+                case 'adaptive':
+
+                    weights = self.weights[:n_constraints]
+                    np.maximum(values, 0, out=values)
+                    np.square(values, out=values)
+                    penalty = values @ weights
+                    self.adapt(counts, pop_size)
+
+            return penalty, penalty > 0
+
+    def aggregate_one(self, constraints):
+        """
+        Returns the penalty of one agent (before the penalty coefficient), given the values of its constraints as scalars.
+        """
+
+        n_constraints = len(constraints)
+        if n_constraints == 0:
+            return 0.0
+
+        with self.lock:
+
+            self.resize(n_constraints)
+            self.evaluated += 1
+            violations = self.violations
+            counts = np.zeros(n_constraints, dtype=np.int64)
+            largest, total = 0.0, 0.0
+            for index, value in enumerate(constraints):
+                if value > 0:
+                    violations[index] += 1
+                    counts[index] = 1
+                    value = float(value)
+                    if value > largest:
+                        largest = value
+                    total += self.weights[index] * value * value if self.aggregation == 'adaptive' else value * value
+
+            match self.aggregation:
+
+                case 'max':
+                    return largest * largest
+
+                case 'sum_squares':
+                    return total
+
+                case 'adaptive':
+                    self.adapt(counts, 1)
+                    return total
+
+    def violation_rates(self):
+        """
+        Returns the share of the evaluated agents that violated each constraint.
+        """
+
+        return self.violations / max(1, self.evaluated)
+
+    def reset(self):
+        self.weights = np.ones(0)
+        self.violations = np.zeros(0, dtype=np.int64)
+        self.evaluated = 0
+        self.pending = np.zeros(0, dtype=np.int64)
+        self.pending_agents = 0
+
+    def __repr__(self):
+        return f"PenaltyAggregator(aggregation='{self.aggregation}', constraints={len(self.violations)}, evaluated={self.evaluated})"
@@ -0,0 +1,134 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import numpy as np
+
+LINEAR_DATA_SEGMENTS = ['cost', 'offset', 'coefficients', 'row_lower', 'row_upper', 'col_lower', 'col_upper']
+
+
+class ParameterLanding:
+    """
+    Affine map from the entries of a numeric parameter to the data of a linear model (objective costs, constraint coefficients, row and column bounds).
+
+    Where the parameter lands is recorded by building the model at the base value and at one perturbed value per entry; one more build at a
+    random perturbation checks that the parameter indeed enters the model data affinely and does not change its structure.
+    """
+
+    def __init__(self, build, base_value, seed=0, rtol=1e-9, atol=1e-9):
+        """
+        Parameters
+        ----------
+        build : callable
+            Builds the model with the parameter at a given value and returns its linear data (see ``solution_generator.extract_linear_data``).
+        base_value : float or array_like
+            Value of the parameter in the dataset.
+        """
+
+        self.scalar = np.ndim(base_value) == 0
+        self.base_value = np.asarray(base_value, dtype=float)
+        self.shape = self.base_value.shape
+
+        base = build(self.value(self.base_value.ravel()))
+        steps = np.maximum(1.0, np.abs(self.base_value.ravel()))
+        probes = []
+        for entry in range(self.base_value.size):
+            perturbed = self.base_value.ravel().copy()
+            perturbed[entry] += steps[entry]
+            probes.append(build(self.value(perturbed)))
+
+        direction = np.random.default_rng(seed).uniform(-1, 1, self.base_value.size) * steps
+        check = build(self.value(self.base_value.ravel() + direction))
+
+        self.sizes = {segment: len(base[segment]) for segment in LINEAR_DATA_SEGMENTS if segment != 'coefficients'}
+        for data in probes + [check]:
+            if any(len(data[segment]) != size for segment, size in self.sizes.items()):
+                raise ValueError("The parameter changes the number of variables or constraints of the model.")
+
+        keys = set(base['coefficients'])
+        for data in probes + [check]:
+            keys.update(data['coefficients'])
+        self.keys = sorted(keys)
+        self.sizes['coefficients'] = len(self.keys)
+
+        self.base = self.flatten(base)
+        self.slopes = np.zeros((len(self.base), self.base_value.size))
+        for entry, data in enumerate(probes):
+            self.slopes[:, entry] = self.slope(self.base, self.flatten(data), steps[entry])
+
+        if not np.allclose(self.predict(self.base_value.ravel() + direction), self.flatten(check), rtol=rtol, atol=atol, equal_nan=True):
+            raise ValueError("The parameter does not enter the model data affinely.")
+
+    def value(self, entries):
+        return float(entries[0]) if self.scalar else entries.reshape(self.shape)
+
+    def flatten(self, data):
+        coefficients = data['coefficients']
+        return np.concatenate([
+            np.asarray(data['cost'], dtype=float),
+            np.asarray(data['offset'], dtype=float),
+            np.fromiter((coefficients.get(key, 0.0) for key in self.keys), dtype=float, count=len(self.keys)),
+            np.asarray(data['row_lower'], dtype=float),
+            np.asarray(data['row_upper'], dtype=float),
+            np.asarray(data['col_lower'], dtype=float),
+            np.asarray(data['col_upper'], dtype=float),
+        ])
+
+    def slope(self, base, perturbed, step):
+        same = (base == perturbed)
+        if not np.all(same | (np.isfinite(base) & np.isfinite(perturbed))):
+            raise ValueError("The parameter turns a bound of the model from infinite to finite or vice versa.")
+        with np.errstate(invalid='ignore'):
+            return np.where(same, 0.0, (perturbed - base) / step)
+
+    def predict(self, value):
+        """
+        Returns the flattened model data at a value of the parameter.
+        """
+
+        delta = np.asarray(value, dtype=float).ravel() - self.base_value.ravel()
+        if delta.size != self.base_value.size:
+            raise ValueError(f"Expected a value with {self.base_value.size} entries, got {delta.size}.")
+        return np.where(np.isfinite(self.base), self.base + self.slopes @ delta, self.base)
+
+    def changes(self, current, target):
+        """
+        Returns the changes that turn the flattened model data ``current`` (``None`` if unknown) into ``target``, in the form accepted by ``solution_generator.update_solution``.
+        """
+
+        changed = np.ones(len(target), dtype=bool) if current is None else ~(current == target)
+        segments = dict()
+        position = 0
+        for segment in LINEAR_DATA_SEGMENTS:
+            segments[segment] = (position, position + self.sizes[segment])
+            position += self.sizes[segment]
+
+        def part(segment, vector):
+            start, end = segments[segment]
+            return vector[start:end]
+
+        changes = dict()
+
+        columns = np.flatnonzero(part('cost', changed))
+        if len(columns) != 0:
+            changes['cost'] = (columns, part('cost', target)[columns])
+
+        if part('offset', changed).any():
+            changes['offset'] = part('offset', target)[0]
+
+        entries = np.flatnonzero(part('coefficients', changed))
+        if len(entries) != 0:
+            rows, columns = np.array([self.keys[entry] for entry in entries], dtype=np.int64).T
+            changes['coefficients'] = (rows, columns, part('coefficients', target)[entries])
+
+        rows = np.flatnonzero(part('row_lower', changed) | part('row_upper', changed))
+        if len(rows) != 0:
+            changes['row_bounds'] = (rows, part('row_lower', target)[rows], part('row_upper', target)[rows])
+
+        columns = np.flatnonzero(part('col_lower', changed) | part('col_upper', changed))
+        if len(columns) != 0:
+            changes['col_bounds'] = (columns, part('col_lower', target)[columns], part('col_upper', target)[columns])
+
+        return changes
+
+    def __repr__(self):
+        return f"ParameterLanding(entries={self.base_value.size}, landed={int(np.count_nonzero(self.slopes.any(axis=1)))})"
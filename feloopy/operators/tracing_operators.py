@@ -0,0 +1,667 @@
+# Copyright (c) 2022-2025, Keivan Tafakkori. All rights reserved.
+# See the file LICENSE file for licensing details.
+
+import copy
+import operator
+import warnings
+
+import numpy as np
+
+
+class TracingError(TypeError):
+    """
+    Raised when an environment uses a traced search agent in Python control flow (e.g., ``if``, ``len`` or ``float``), which cannot be replayed.
+    """
+
+
+class Node:
+    """
+    Symbolic value of a traced environment: every operation applied to it is recorded on its tape instead of being evaluated.
+    """
+
+    __array_priority__ = 1000
+    __hash__ = object.__hash__
+
+    def __init__(self, tape, index):
+        self._tape = tape
+        self._index = index
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self._tape.record(getattr, (self, name), {})
+
+    def __getitem__(self, key):
+        return self._tape.record(operator.getitem, (self, key), {})
+
+    def __setitem__(self, key, value):
+        raise TracingError("Traced search agents cannot be modified in place.")
+
+    def __call__(self, *args, **kwargs):
+        return self._tape.record(_call, (self,) + args, kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        function = ufunc if method == '__call__' else getattr(ufunc, method)
+        return self._tape.record(function, inputs, kwargs)
+
+    def __array_function__(self, function, types, args, kwargs):
+        return self._tape.record(function, args, kwargs)
+
+    def _untraceable(self, *args):
+        raise TracingError("A traced search agent cannot be used in Python control flow or converted to a Python scalar.")
+
+    __bool__ = __len__ = __iter__ = __int__ = __float__ = __index__ = __complex__ = _untraceable
+
+
+def _call(function, *args, **kwargs):
+    return function(*args, **kwargs)
+
+
+def record(function, *args):
+    """
+    Applies ``function`` to the arguments, or records it if one of them is traced.
+    """
+
+    for arg in args:
+        if isinstance(arg, Node):
+            return arg._tape.record(function, args, {})
+    return function(*args)
+
+
+def _binary(function):
+    return lambda self, other: self._tape.record(function, (self, other), {})
+
+
+def _reflected(function):
+    return lambda self, other: self._tape.record(function, (other, self), {})
+
+
+def _unary(function):
+    return lambda self: self._tape.record(function, (self,), {})
+
+
+for _name, _function in [('add', operator.add), ('sub', operator.sub), ('mul', operator.mul), ('truediv', operator.truediv), ('floordiv', operator.floordiv),
+                         ('mod', operator.mod), ('pow', operator.pow), ('matmul', operator.matmul), ('and', operator.and_), ('or', operator.or_), ('xor', operator.xor)]:
+    setattr(Node, f'__{_name}__', _binary(_function))
+    setattr(Node, f'__r{_name}__', _reflected(_function))
+
+for _name, _function in [('lt', operator.lt), ('le', operator.le), ('eq', operator.eq), ('ne', operator.ne), ('gt', operator.gt), ('ge', operator.ge)]:
+    setattr(Node, f'__{_name}__', _binary(_function))
+
+for _name, _function in [('neg', operator.neg), ('pos', operator.pos), ('abs', operator.abs), ('invert', operator.invert)]:
+    setattr(Node, f'__{_name}__', _unary(_function))
+
+
+def _contains_node(value):
+    if isinstance(value, Node):
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_contains_node(item) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_node(item) for item in value.values())
+    return False
+
+
+def _resolver(value):
+    """
+    Returns a function of the tape values that rebuilds ``value`` with its traced parts replaced by their values.
+    """
+
+    if isinstance(value, Node):
+        index = value._index
+        return lambda values: values[index]
+    if not _contains_node(value):
+        return lambda values: value
+    if isinstance(value, dict):
+        items = [(key, _resolver(item)) for key, item in value.items()]
+        return lambda values: {key: resolve(values) for key, resolve in items}
+    items = [_resolver(item) for item in value]
+    kind = type(value)
+    return lambda values: kind(resolve(values) for resolve in items)
+
+
+def _dependencies(value):
+    if isinstance(value, Node):
+        return [value._index]
+    if isinstance(value, (list, tuple)):
+        return [index for item in value for index in _dependencies(item)]
+    if isinstance(value, dict):
+        return [index for item in value.values() for index in _dependencies(item)]
+    return []
+
+
+class Tape:
+    """
+    Operations recorded from a traced search agent, replayed on the actual search agents.
+    """
+
+    def __init__(self):
+        self.operations = [None]
+        self.program = []
+        self.outputs = []
+
+    def input(self):
+        return Node(self, 0)
+
+    def record(self, function, args, kwargs):
+        self.operations.append((function, args, kwargs))
+        return Node(self, len(self.operations) - 1)
+
+    def compile(self, outputs):
+        """
+        Keeps the operations the outputs depend on and prepares their evaluation.
+        """
+
+        needed = set(_dependencies(outputs))
+        for index in range(len(self.operations) - 1, 0, -1):
+            if index in needed:
+                function, args, kwargs = self.operations[index]
+                needed.update(_dependencies(args))
+                needed.update(_dependencies(kwargs))
+
+        self.needed = sorted(index for index in needed if index != 0)
+        self.program = [(index, self.instruction(*self.operations[index])) for index in self.needed]
+        self.outputs = [_resolver(output) for output in outputs]
+        self.output_nodes = [output._index for output in outputs if isinstance(output, Node)]
+        self.size = len(self.operations)
+
+    def instruction(self, function, args, kwargs):
+
+        if not kwargs and len(args) == 2:
+            first, second = args
+            if isinstance(first, Node) and isinstance(second, Node):
+                i, j = first._index, second._index
+                return lambda values: function(values[i], values[j])
+            if isinstance(first, Node) and not _contains_node(second):
+                i = first._index
+                return lambda values: function(values[i], second)
+            if isinstance(second, Node) and not _contains_node(first):
+                j = second._index
+                return lambda values: function(first, values[j])
+
+        if not kwargs and len(args) == 1 and isinstance(args[0], Node):
+            i = args[0]._index
+            return lambda values: function(values[i])
+
+        resolve_args = _resolver(tuple(args))
+        resolve_kwargs = _resolver(dict(kwargs))
+        return lambda values: function(*resolve_args(values), **resolve_kwargs(values))
+
+    def values(self, agent):
+        """
+        Returns the values of all the operations for the search agent.
+        """
+
+        values = [None]*(self.size + 1)
+        values[0] = agent
+        for index, instruction in self.program:
+            values[index] = instruction(values)
+        return values
+
+    def run(self, agent):
+        """
+        Returns the outputs evaluated for the search agent.
+        """
+
+        values = self.values(agent)
+        return [output(values) for output in self.outputs]
+
+    def fuse(self, values):
+        """
+        Replaces the operations that are affine in arrays of the population (e.g., sums of weighted columns of the decoded variables) with one matrix
+        product per such array, using the values of one evaluation to know the shapes and types of the operations.
+
+        The operations are unchanged if nothing can be fused. Returns whether the program changed.
+        """
+
+        pop = np.shape(values[0])[0] if np.ndim(values[0]) == 2 else None
+        if pop is None:
+            return False
+
+        forms = dict()
+        for index in self.needed:
+            function, args, kwargs = self.operations[index]
+            value = values[index]
+            if not isinstance(value, np.ndarray) or value.dtype.kind not in 'iuf':
+                continue
+            form = _affine(function, args, kwargs, forms, values, pop)
+            if form is not None and form.shape(pop) == value.shape and form.size() <= FUSED_SIZE:
+                form.kind = (type(value), value.dtype)
+                forms[index] = form
+
+        if not forms:
+            return False
+
+        generic = set()
+        materialized = set()
+        stack = list(self.output_nodes)
+        materialized.update(index for index in self.output_nodes if index in forms)
+        while stack:
+            index = stack.pop()
+            if index in forms:
+                dependencies = list(forms[index].terms)
+            elif index != 0 and index not in generic:
+                generic.add(index)
+                function, args, kwargs = self.operations[index]
+                dependencies = _dependencies(args) + _dependencies(kwargs)
+                materialized.update(dependency for dependency in dependencies if dependency in forms)
+            else:
+                continue
+            stack.extend(dependency for dependency in dependencies if dependency not in generic)
+
+        program = []
+        done = set()
+        for index in sorted(generic):
+            function, args, kwargs = self.operations[index]
+            pending = [dependency for dependency in dict.fromkeys(_dependencies(args) + _dependencies(kwargs)) if dependency in forms and dependency not in done]
+            if pending:
+                program.append((self.size, _materialize([(dependency, forms[dependency]) for dependency in pending])))
+                done.update(pending)
+            program.append((index, self.instruction(function, args, kwargs)))
+
+        pending = [index for index in sorted(materialized) if index not in done]
+        if pending:
+            program.append((self.size, _materialize([(index, forms[index]) for index in pending])))
+
+        self.generic = self.program
+        self.program = program
+        return True
+
+    def unfuse(self):
+        self.program = getattr(self, 'generic', self.program)
+
+
+FUSED_SIZE = 2**22
+
+
+class Affine:
+    """
+    Value of a traced operation as an affine function of arrays of the population: the sum of ``values[b][:, rows] @ weights`` over the terms
+    ``b: (rows, weights)``, plus ``constant`` (one column per feature, or a single one for a ``vector`` of the population). The weights of a term are
+    None for the identity, and are kept below ``FUSED_SIZE`` entries.
+    """
+
+    def __init__(self, terms, constant, vector):
+        self.terms = terms
+        self.constant = constant
+        self.vector = vector
+        self.kind = None
+
+    @classmethod
+    def basis(cls, index, width, vector):
+        return cls({index: (np.arange(width), None)}, np.zeros(width), vector)
+
+    def shape(self, pop):
+        return (pop,) if self.vector else (pop, len(self.constant))
+
+    def size(self):
+        return sum(len(rows) for rows, _ in self.terms.values())*len(self.constant)
+
+    def dense(self):
+        terms = dict()
+        for index, (rows, weights) in self.terms.items():
+            if weights is None:
+                if len(rows)**2 > FUSED_SIZE:
+                    return None
+                weights = np.eye(len(rows))
+            terms[index] = (rows, weights)
+        return terms
+
+    def combine(self, other, sign):
+        first, second = self.dense(), other.dense()
+        if first is None or second is None or self.vector != other.vector or len(self.constant) != len(other.constant):
+            return None
+        terms = dict(first)
+        for index, (rows, weights) in second.items():
+            if index not in terms:
+                terms[index] = (rows, sign*weights)
+                continue
+            merged = np.union1d(terms[index][0], rows)
+            if len(merged)*len(self.constant) > FUSED_SIZE:
+                return None
+            total = np.zeros((len(merged), len(self.constant)))
+            total[np.searchsorted(merged, terms[index][0])] += terms[index][1]
+            total[np.searchsorted(merged, rows)] += sign*weights
+            terms[index] = (merged, total)
+        return Affine(terms, self.constant + sign*other.constant, self.vector)
+
+    def scale(self, factor):
+        terms = self.dense()
+        if terms is None:
+            return None
+        return Affine({index: (rows, weights*factor) for index, (rows, weights) in terms.items()}, self.constant*factor, self.vector)
+
+    def columns(self, key):
+        vector = isinstance(key, (int, np.integer))
+        key = slice(key, key + 1 if key != -1 else None) if vector else key
+        terms = dict()
+        for index, (rows, weights) in self.terms.items():
+            if weights is None:
+                terms[index] = (rows[key], None)
+            else:
+                weights = weights[:, key]
+                used = np.any(weights != 0, axis=1)
+                terms[index] = (rows[used], weights[used])
+        return Affine(terms, self.constant[key], vector)
+
+    def product(self, matrix):
+        vector = matrix.ndim == 1
+        matrix = matrix[:, None] if vector else matrix
+        terms = {index: (rows, matrix if weights is None else weights @ matrix) for index, (rows, weights) in self.terms.items()}
+        return Affine(terms, self.constant @ matrix, vector)
+
+
+def _operand(arg, forms, values, pop):
+    """
+    Returns the affine form of a traced operand, a numeric constant (scalar or 1-dimensional array), or None.
+    """
+
+    if isinstance(arg, Node):
+        index = arg._index
+        if index in forms:
+            return forms[index]
+        value = values[index]
+        if isinstance(value, np.ndarray) and value.dtype.kind in 'iuf' and value.ndim in (1, 2) and value.shape[0] == pop:
+            return Affine.basis(index, 1 if value.ndim == 1 else value.shape[1], value.ndim == 1)
+        return None
+    if _contains_node(arg):
+        return None
+    constant = np.asarray(arg)
+    if constant.dtype.kind in 'iuf' and constant.ndim <= 1:
+        return constant.astype(float)
+    return None
+
+
+def _constant(constant, form):
+    """
+    Returns a constant as an affine form matching ``form``, if it broadcasts over its features only.
+    """
+
+    if constant.ndim == 0:
+        return Affine(dict(), np.full(len(form.constant), float(constant)), form.vector)
+    if not form.vector and constant.shape == form.constant.shape:
+        return Affine(dict(), constant, False)
+    return None
+
+
+def _affine(function, args, kwargs, forms, values, pop):
+    """
+    Returns the affine form of an operation, or None if it is not affine in its traced operands.
+    """
+
+    operands = [_operand(arg, forms, values, pop) for arg in args]
+    affine = [isinstance(operand, Affine) for operand in operands]
+    if not any(affine):
+        return None
+
+    if function is operator.getitem or function is np.sum or function is np.reshape or isinstance(function, type):
+        return _structural(function, args, kwargs, operands[0], values, pop) if affine[0] else None
+
+    if kwargs or len(args) not in (1, 2) or any(operand is None for operand in operands):
+        return None
+
+    if len(args) == 1:
+        if function in (operator.neg, np.negative):
+            return operands[0].scale(-1.0)
+        if function in (operator.pos, np.positive):
+            return operands[0]
+        return None
+
+    first, second = operands
+    if function in (operator.add, operator.sub, operator.le, operator.ge, np.add, np.subtract):
+        sign = -1.0 if function in (operator.sub, operator.le, operator.ge, np.subtract) else 1.0
+        if function is operator.ge:
+            first, second = second, first
+        first = first if isinstance(first, Affine) else _constant(first, second)
+        second = second if isinstance(second, Affine) else _constant(second, first)
+        if first is None or second is None:
+            return None
+        return first.combine(second, sign)
+
+    if function in (operator.mul, np.multiply) and affine.count(True) == 1:
+        form, factor = (first, second) if affine[0] else (second, first)
+        if factor.ndim == 0 or (not form.vector and factor.shape == form.constant.shape):
+            return form.scale(factor)
+        return None
+
+    if function in (operator.truediv, np.divide) and affine == [True, False]:
+        if second.ndim == 0 or (not first.vector and second.shape == first.constant.shape):
+            return first.scale(1.0/second)
+        return None
+
+    if function in (operator.matmul, np.matmul) and affine == [True, False] and not first.vector:
+        if second.ndim == 1 and len(second) == len(first.constant):
+            return first.product(second)
+        return None
+
+    return None
+
+
+def _structural(function, args, kwargs, form, values, pop):
+    """
+    Returns the affine form of a view, column sum or reshape of an affine form, or None.
+    """
+
+    if isinstance(function, type):
+        return form if issubclass(function, np.ndarray) and len(args) == 1 and not kwargs else None
+
+    if function is operator.getitem:
+        key = args[1]
+        if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], slice) and key[0] == slice(None) and isinstance(key[1], (int, np.integer, slice)) and not form.vector:
+            return form.columns(key[1])
+        return None
+
+    if function is np.sum:
+        axis = kwargs.get('axis', args[1] if len(args) > 1 else None)
+        if axis in (1, -1) and len(args) + len(kwargs) == 2 and not form.vector:
+            return form.product(np.ones(len(form.constant)))
+        return None
+
+    shape = _resolved_shape(args[1], values) if len(args) == 2 and not kwargs else None
+    if form.vector and shape == (pop, 1):
+        return Affine(form.terms, form.constant, False)
+    if not form.vector and len(form.constant) == 1 and shape in [(pop,), (pop, -1)]:
+        return Affine(form.terms, form.constant, True)
+    return None
+
+
+def _resolved_shape(shape, values):
+    try:
+        return tuple(int(values[item._index]) if isinstance(item, Node) else int(item) for item in shape)
+    except (TypeError, ValueError):
+        return None
+
+
+def _materialize(forms):
+    """
+    Returns an instruction that evaluates the affine forms together, with one matrix product per array of the population.
+    """
+
+    constant = np.hstack([form.constant for _, form in forms])
+    offsets = np.cumsum([0] + [len(form.constant) for _, form in forms])
+
+    weights = []
+    for index in dict.fromkeys(index for _, form in forms for index in form.terms):
+        rows = np.unique(np.concatenate([form.terms[index][0] for _, form in forms if index in form.terms]))
+        if len(rows) == 0:
+            continue
+        matrix = np.zeros((len(rows), len(constant)))
+        for (_, form), start, stop in zip(forms, offsets[:-1], offsets[1:]):
+            if index in form.terms:
+                used, block = form.terms[index]
+                matrix[np.searchsorted(rows, used), start:stop] += np.eye(len(used)) if block is None else block
+        key = slice(rows[0], rows[-1] + 1) if rows[-1] - rows[0] + 1 == len(rows) else rows
+        weights.append((index, key, matrix))
+
+    outputs = []
+    start = 0
+    for index, form in forms:
+        stop = start + len(form.constant)
+        kind, dtype = form.kind
+        outputs.append((index, start if form.vector else slice(start, stop), kind, dtype))
+        start = stop
+
+    def instruction(values):
+        total = constant
+        for index, key, matrix in weights:
+            base = np.asarray(values[index])
+            total = total + base.reshape(len(base), -1)[:, key] @ matrix
+        for index, key, kind, dtype in outputs:
+            value = total[:, key]
+            if dtype.kind in 'iu':
+                value = np.rint(value)
+            value = value.astype(dtype, copy=False)
+            values[index] = value if kind is np.ndarray else value.view(kind)
+
+    return instruction
+
+
+TRACING_ERRORS = (TracingError, TypeError, ValueError, LookupError)
+
+
+class EnvironmentTrace:
+    """
+    Objective and constraint expressions of a heuristic environment, traced once on a symbolic search agent.
+    """
+
+    def __init__(self, shell, environment, args, kwargs):
+
+        self.tape = Tape()
+        shell.agent = self.tape.input()
+        lm = environment(shell, *args, **kwargs)
+        objectives = list(lm.features['objectives'])
+        constraints = list(lm.features['constraints'])
+        self.no_objectives = len(objectives)
+        self.tape.compile(objectives + constraints)
+
+    def evaluate(self, shell, directions, obj_id):
+        """
+        Evaluates the expressions for the search agents loaded in the shell and computes their penalized reward.
+        """
+
+        values = self.tape.run(shell.agent)
+        features = shell.features
+        features['objectives'] = values[:self.no_objectives]
+        features['constraints'] = values[self.no_objectives:]
+        features['directions'] = [None]*self.no_objectives
+        features['objective_counter'] = [self.no_objectives, 0]
+        shell.heuristic_reward(directions, obj_id)
+        return shell
+
+    def fuse(self, shell):
+        """
+        Fuses the affine expressions using their values for the search agents loaded in the shell.
+        """
+
+        return self.tape.fuse(self.tape.values(shell.agent))
+
+
+def _matches(first, second):
+    try:
+        return bool(np.allclose(np.asarray(first, dtype=float), np.asarray(second, dtype=float), equal_nan=True))
+    except (TypeError, ValueError):
+        return False
+
+
+class CompiledEnvironment:
+    """
+    Evaluates a heuristic environment in compiled mode.
+
+    The environment is traced once per shape of the search agents: its objectives and constraints are recorded as operations on the agent, so that later
+    evaluations only replay these operations (no variable generation, no environment code and no ``sol``). The first evaluation of each shape runs the
+    environment as usual and checks the replayed result against it; environments that cannot be traced (e.g., with Python control flow on the variables)
+    or do not replay identically keep running on the reused model, with a warning.
+
+    Parameters
+    ----------
+    build : callable
+        Returns the reused model loaded with the agent properties.
+    environment : callable
+        The environment function.
+    args, kwargs : tuple, dict
+        Extra arguments of the environment.
+    solve : callable
+        Calls ``sol`` on the model returned by the environment.
+    directions : list
+        Directions of the objectives.
+    """
+
+    def __init__(self, build, environment, args, kwargs, solve, directions):
+
+        self.build = build
+        self.environment = environment
+        self.args = args
+        self.kwargs = kwargs
+        self.solve = solve
+        self.directions = list(directions)
+        self.obj_id = 0 if len(self.directions) == 1 else 'all'
+        self.traces = dict()
+        self.warned = False
+
+    def run(self, agent_properties):
+        lm = self.environment(self.build(agent_properties), *self.args, **self.kwargs)
+        self.solve(lm)
+        return lm
+
+    def __call__(self, agent_properties):
+        """
+        Returns the model evaluated for the active agent properties.
+        """
+
+        key = np.shape(agent_properties[1])
+        trace = self.traces.get(key)
+        if trace is None:
+            return self.compile(agent_properties, key)
+        if trace is False:
+            return self.run(agent_properties)
+        return trace.evaluate(self.build(agent_properties), self.directions, self.obj_id)
+
+    def compile(self, agent_properties, key):
+
+        shell = self.build(agent_properties)
+        aggregator = shell.penalty_aggregator
+        state = None if aggregator is None else (aggregator.weights.copy(), aggregator.violations.copy(), aggregator.evaluated)
+
+        def restore(lm):
+            lm.penalty_aggregator = aggregator
+            if state is not None:
+                aggregator.weights, aggregator.violations, aggregator.evaluated = state[0].copy(), state[1].copy(), state[2]
+
+        lm = self.environment(shell, *self.args, **self.kwargs)
+        self.solve(lm)
+        expected = copy.deepcopy(lm[agent_properties])
+
+        try:
+            trace = EnvironmentTrace(self.build(agent_properties), self.environment, self.args, self.kwargs)
+        except TRACING_ERRORS as error:
+            trace = None
+            self.warn(f"it cannot be traced ({type(error).__name__}: {error})")
+
+        if trace is not None and trace.no_objectives == len(self.directions):
+            try:
+                fused = trace.fuse(self.build(agent_properties))
+            except TRACING_ERRORS:
+                fused = False
+            for attempt in ([True, False] if fused else [False]):
+                if not attempt:
+                    trace.tape.unfuse()
+                lm = self.build(agent_properties)
+                restore(lm)
+                try:
+                    lm = trace.evaluate(lm, self.directions, self.obj_id)
+                except TRACING_ERRORS:
+                    continue
+                if _matches(lm[agent_properties], expected):
+                    self.traces[key] = trace
+                    return lm
+            self.warn("its traced expressions do not reproduce its results")
+
+        self.traces[key] = False
+        lm = self.build(agent_properties)
+        restore(lm)
+        return self.run(agent_properties)
+
+    def warn(self, reason):
+        if not self.warned:
+            self.warned = True
+            warnings.warn(f"Compiled mode: the environment is evaluated without replay because {reason}; only the model object is reused.", RuntimeWarning, stacklevel=3)
@@ -22,6 +22,7 @@ common = [
     "tqdm",
     "colorama",
     "joblib",
+    "cloudpickle",
     "rich",
 ]
 
@@ -142,6 +143,7 @@ extra_dict = {
     "only_linux": only_linux,
     "mega": mega,
     "beta": beta,
+    "extras": extras,
 }
 
 keywords_list = [
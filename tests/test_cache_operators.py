@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from feloopy import model, Implement
+from feloopy.operators.cache_operators import FitnessCache
+
+value = np.random.default_rng(0).random(6)
+
+
+def knapsack(m):
+    x = m.bvar('x', [range(6)])
+    y = m.ivar('y', [range(2)], bound=[0, 3])
+    m.con(m.sum(x[:, i] for i in range(6)) <= 3)
+    m.obj(m.sum(value[i]*x[:, i] for i in range(6)) + y[:, 0] - y[:, 1])
+    return m
+
+
+def instance(X):
+    m = knapsack(model(method='heuristic', name='test', interface='feloopy', agent=X, no_agents=10))
+    m.sol(directions=['max'], solver='ga', solver_options={})
+    return m[X]
+
+
+def implementor(maxsize=None):
+    implementor = Implement(instance)
+    implementor.penalty_coefficient = 10
+    if maxsize:
+        implementor.fitness_cache = FitnessCache(implementor.VariablesSpread, implementor.VariablesType, implementor.VariablesBound, maxsize)
+    return implementor
+
+
+def duplicated_population(rows=12, width=8, extra=2, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((rows, width + extra))
+    X[rows//2:, :width] = np.clip(X[:rows//2, :width] + rng.uniform(-0.01, 0.01, (rows//2, width)), 0, 1)
+    return X
+
+
+def stub(interface_name, width, spread, types, bounds, maxsize=64):
+    implementor = Implement.__new__(Implement)
+    implementor.interface_name = interface_name
+    implementor.tot_counter = [0, width]
+    implementor.evaluation_recorder = None
+    implementor.fitness_cache = FitnessCache(spread, types, bounds, maxsize)
+    return implementor
+
+
+def test_feloopy_population_matches_uncached_evaluation():
+    cached, plain = implementor(maxsize=64), implementor()
+    X = duplicated_population()
+    result = cached.Fitness(X.copy())
+    assert np.allclose(result, plain.Fitness(X.copy()))
+    assert cached.fitness_cache.misses + cached.fitness_cache.hits == len(X)
+    assert cached.fitness_cache.hits > 0
+    assert np.allclose(cached.Fitness(X.copy()), result)
+    assert cached.fitness_cache.hits >= len(X)
+
+
+def test_one_agent_populations_match_uncached_evaluation():
+    cached, plain = implementor(maxsize=64), implementor()
+    X = duplicated_population()
+    for x in np.concatenate([X, X]):
+        assert np.allclose(cached.Fitness(x[None, :].copy()), plain.Fitness(x[None, :].copy()))
+
+
+def test_single_agents_are_looked_up_as_is():
+    calls = []
+    implementor = stub('mealpy', 0, {'x': (0, 3)}, {'x': 'bvar'}, {'x': [0, 1]})
+    evaluate = lambda x, record: calls.append(x) or float(np.round(x).sum())
+    assert implementor.Cached_Fitness(np.array([0.9, 0.2, 0.6]), evaluate) == 2.0
+    assert implementor.Cached_Fitness(np.array([0.7, 0.4, 0.8]), evaluate) == 2.0
+    assert implementor.Cached_Fitness(np.array([0.1, 0.4, 0.8]), evaluate) == 1.0
+    assert len(calls) == 2
+    assert (implementor.fitness_cache.hits, implementor.fitness_cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("objectives", [1, 2])
+def test_batches_take_rows_along_the_first_axis(objectives):
+    implementor = stub('mealpy', 0, {'x': (0, 4)}, {'x': 'ivar'}, {'x': [0, 5]})
+    evaluate = lambda X, record: np.round(5*X[:, :objectives]).squeeze() * np.arange(1, objectives + 1)
+    X = duplicated_population(rows=10, width=4, extra=0)
+    result = implementor.Cached_Fitness(X, evaluate, row_axis=0)
+    assert result.shape == evaluate(X, False).shape
+    assert np.allclose(result, evaluate(X, False))
+
+
+def test_other_interfaces_take_rows_along_the_second_axis():
+    implementor = stub('pymoo', 0, {'x': (0, 3)}, {'x': 'pvar'}, {'x': [0, 1]})
+    evaluate = lambda X, record: np.stack([X.sum(axis=1), X.prod(axis=1)])
+    X = np.random.default_rng(1).random((5, 3))
+    X = np.concatenate([X, X[:2]])
+    result = implementor.Cached_Fitness(X, evaluate)
+    assert result.shape == (2, 7)
+    assert np.allclose(result, evaluate(X, False))
+    assert implementor.fitness_cache.hits == 2
+
+
+def test_lru_eviction_counters():
+    cache = FitnessCache({'x': (0, 1)}, {'x': 'ivar'}, {'x': [0, 10]}, maxsize=2)
+    keys = cache.keys(np.array([[0.0], [0.5], [1.0]]))
+    for key, stored in zip(keys[:2], [0.0, 5.0]):
+        assert cache.lookup([key]) == ([FitnessCache.missing], [0])
+        cache.store(key, stored)
+    assert cache.lookup([keys[0]]) == ([0.0], [])
+    cache.store(keys[2], 10.0)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.lookup([keys[1]]) == ([FitnessCache.missing], [0])
+    assert cache.lookup([keys[0], keys[2], keys[2]])[0] == [0.0, 10.0, 10.0]
+    assert (cache.hits, cache.misses, cache.evictions) == (4, 3, 1)
+    assert cache.hit_rate == 4/7
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses, cache.evictions) == (0, 0, 0, 0)
+
+
+def test_repeated_keys_within_a_call_are_evaluated_once():
+    cache = FitnessCache({'x': (0, 2)}, {'x': 'bvar'}, {'x': [0, 1]})
+    values, rows = cache.lookup(cache.keys(np.array([[0.1, 0.9], [0.2, 0.8], [0.9, 0.9]])))
+    assert rows == [0, 2]
+    assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from feloopy import search
+from feloopy.operators.history_operators import HistoryRecorder
+
+
+def knapsack(m):
+    x = m.bvar('x', [5])
+    if m.features['vectorized']:
+        m.obj(m.sum(x[:, i] for i in range(5)))
+        m.con(x[:, 0] + x[:, 1] <= 1)
+    else:
+        m.obj(sum(x[i] for i in range(5)))
+        m.con(x[0] + x[1] <= 1)
+    m.sol(['max'], 'ga', {'epoch': 6, 'pop_size': 8, 'penalty_coefficient': 10})
+    return m
+
+
+def test_recorder_buffers_agents_into_epochs():
+    recorder = HistoryRecorder(epochs=3, pop_size=4)
+    rewards = np.arange(10.0)
+    recorder.record(rewards[:3])
+    for reward in rewards[3:]:
+        recorder.record(reward)
+    assert recorder.epochs == 2
+    assert list(recorder.trajectory('min')[0]) == [0.0, 4.0]
+    assert list(recorder.trajectory('max')[0]) == [3.0, 7.0]
+    assert list(recorder.best('max')[0]) == [3.0, 7.0]
+
+
+def test_evaluate_reads_recorded_history():
+    np.random.seed(0)
+    s = search(knapsack, method='heuristic', interface='feloopy', directions=['max'], solver='ga', options={'epoch': 6, 'pop_size': 8, 'penalty_coefficient': 10}, track_history=True, repeat=2, verbose=True)
+    obj, time, accuracy, prob_per_epoch = s.em.evaluate(show_fig=False, opt=4)
+    assert len(obj) == len(time) == 2
+    assert len(accuracy) == len(prob_per_epoch) == s.history.epochs
+    assert all(value <= 4 for value in obj)
+
+
+def test_evaluate_deprecates_ignored_arguments():
+    s = search(knapsack, method='heuristic', interface='feloopy', directions=['max'], solver='ga', options={'epoch': 2, 'pop_size': 4, 'penalty_coefficient': 10}, track_history=True, verbose=True)
+    with pytest.warns(DeprecationWarning, match="opt_features"):
+        s.em.evaluate(show_fig=False, opt_features=[1, 1, 0, 1, 1])
+    with pytest.warns(DeprecationWarning, match="pareto"):
+        s.em.evaluate(show_fig=False, pareto=np.zeros((1, 1)))
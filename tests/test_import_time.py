@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from feloopy.helpers.lazy_import import LAZY_DEPENDENCIES, LazyModule, check_import_time, import_time
+
+
+def test_import_time_is_within_budget():
+    assert check_import_time(repeat=3, verbose=False)
+
+
+def test_lazy_dependencies_are_not_imported_eagerly():
+    _, modules = import_time(repeat=1)
+    imported = {name.split('.')[0] for name, _ in modules}
+    assert imported.isdisjoint(LAZY_DEPENDENCIES)
+
+    script = f"import sys, feloopy; print(sorted(name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules))"
+    completed = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == '[]'
+
+
+def test_lazy_module_loads_on_first_access():
+    module = LazyModule('json')
+    assert not module.loaded
+    assert module.dumps([1]) == '[1]'
+    assert module.loaded
@@ -0,0 +1,66 @@
+import itertools as it
+
+import numpy as np
+import pytest
+
+from feloopy.operators.indicator_operators import gd_indicator, gd_plus_indicator, igd_indicator, igd_plus_indicator, hv_2d, hv_wfg, hv_indicator, calculate_indicators
+
+
+def counted_volume(front, reference_point):
+    """
+    Hypervolume of an integer front, counted as the unit cells dominated by one of its points.
+    """
+
+    cells = it.product(*[range(int(low), int(high)) for low, high in zip(front.min(axis=0), reference_point)])
+    return float(sum(np.any(np.all(front <= np.array(cell), axis=1)) for cell in cells))
+
+
+def test_hv_2d_staircase():
+    front = np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 1.0]])
+    assert hv_2d(front, np.array([4.0, 4.0])) == pytest.approx(6.0)
+    assert hv_wfg(front, np.array([4.0, 4.0])) == pytest.approx(6.0)
+
+
+def test_hv_wfg_known_values():
+    reference_point = np.ones(3)
+    assert hv_wfg(np.zeros((1, 3)), reference_point) == pytest.approx(1.0)
+    assert hv_wfg(np.array([[0.0, 0.0, 0.5], [0.5, 0.5, 0.0]]), reference_point) == pytest.approx(0.625)
+
+
+@pytest.mark.parametrize("m", [3, 4, 5])
+def test_hv_wfg_matches_counted_cells(m):
+    rng = np.random.default_rng(m)
+    reference_point = np.full(m, 6.0)
+    for _ in range(5):
+        front = rng.integers(0, 6, size=(12, m)).astype(float)
+        assert hv_indicator(front, reference_point) == pytest.approx(counted_volume(front, reference_point))
+
+
+def test_hv_indicator_normalized():
+    front = np.array([[0.0, 1.0], [1.0, 0.0]])
+    assert hv_indicator(front, [2.0, 2.0]) == pytest.approx(3.0)
+    assert hv_indicator(front, [2.0, 2.0], normalize=True) == pytest.approx(0.75)
+
+
+def test_distance_indicators_known_values():
+    reference_front = np.array([[0.0, 1.0], [1.0, 0.0]])
+    front = np.array([[0.5, 0.5]])
+    assert igd_indicator(front, reference_front) == pytest.approx(np.sqrt(0.5))
+    assert igd_plus_indicator(front, reference_front) == pytest.approx(0.5)
+    assert gd_indicator(front, reference_front) == pytest.approx(np.sqrt(0.5))
+    assert gd_plus_indicator(front, reference_front) == pytest.approx(0.5)
+    assert igd_plus_indicator(np.array([[1.0, 1.0]]), reference_front) == pytest.approx(1.0)
+    assert igd_plus_indicator(np.zeros((1, 2)), reference_front) == pytest.approx(0.0)
+
+
+def test_igd_plus_ishibuchi_example():
+    reference_front = np.array([[0.0, 10.0], [1.0, 6.0], [2.0, 2.0], [6.0, 1.0], [10.0, 0.0]])
+    front = np.array([[2.0, 4.0], [3.0, 3.0], [4.0, 2.0]])
+    expected = np.mean([2.0, 1.0, np.sqrt(2.0), 1.0, 2.0])
+    assert igd_plus_indicator(front, reference_front) == pytest.approx(expected)
+
+
+def test_calculate_indicators_directions():
+    points = np.array([[1.0, -3.0], [2.0, -2.0], [3.0, -1.0]])
+    indicators = calculate_indicators(points, ['min', 'max'], reference_point=[4.0, -4.0])
+    assert indicators['hv'] == pytest.approx(6.0)
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from feloopy.algorithms.heuristic.kernels import NUMBA_AVAILABLE, use_jit, seed_kernels, ga_vary, de_vary, gwo_vary
+from feloopy.algorithms.heuristic.GA import GA
+from feloopy.algorithms.heuristic.DE import DE
+from feloopy.algorithms.heuristic.GWO import GWO
+from feloopy.algorithms.heuristic.benchmark import benchmark
+
+
+def features(t=40, f=7, seed=0):
+    return np.random.default_rng(seed).random((t, f))
+
+
+def numpy_vary(model_object, x):
+    model_object.initialize()
+    model_object.pi[:, :model_object.f] = x
+    model_object.vary()
+    return model_object.pi[:, :model_object.f].copy()
+
+
+def test_jit_defaults_to_numba_availability():
+    assert use_jit() is NUMBA_AVAILABLE
+    assert use_jit(None) is NUMBA_AVAILABLE
+    assert use_jit(False) is False
+    assert GA(f=3, d=['max'], s=1, t=4, sc=1, cr=0.7, mu=0.02, sfl=0.4, sfu=0.6).jit is NUMBA_AVAILABLE
+    assert DE(f=3, d=['max'], s=1, t=4, cr=0.7, mu=0.02).jit is NUMBA_AVAILABLE
+    assert GWO(f=3, d=['max'], s=1, t=4).jit is NUMBA_AVAILABLE
+    assert GA(f=3, d=['max'], s=1, t=4, sc=1, cr=0.7, mu=0.02, sfl=0.4, sfu=0.6, jit=False).jit is False
+
+
+def test_benchmark_reports_skipped_sizes():
+    rows = benchmark(algorithms=('ga',), pop_sizes=(4, 50), dimensions=(3, 1000), repeats=1, max_cells=1000, show_log=False)
+    assert [(row['pop_size'], row['dimension']) for row in rows] == [(4, 3), (4, 1000), (50, 3), (50, 1000)]
+    assert [row['skipped'] is None for row in rows] == [True, False, True, False]
+    assert rows[3]['numpy'] is None and 'max_cells' in rows[3]['skipped']
+
+
+@pytest.mark.skipif(NUMBA_AVAILABLE, reason="numba is installed")
+def test_jit_requires_numba():
+    with pytest.raises(ImportError):
+        use_jit(True)
+
+
+@pytest.mark.parametrize("cr, mu", [(0.0, 0.0), (0.0, 1.0)])
+def test_ga_vary_matches_numpy(cr, mu):
+    x = features()
+    out = np.empty_like(x)
+    seed_kernels(1)
+    ga_vary(x, out, cr, mu)
+    np.random.seed(1)
+    expected = numpy_vary(GA(f=x.shape[1], d=['max'], s=1, t=len(x), sc=1, cr=cr, mu=mu, sfl=0.4, sfu=0.6), x)
+    assert np.allclose(out, expected)
+
+
+def test_ga_vary_stays_in_bounds():
+    x = features(t=200)
+    out = np.empty_like(x)
+    seed_kernels(2)
+    ga_vary(x, out, 0.7, 0.02)
+    assert np.all((out >= 0) & (out <= 1))
+
+
+def test_de_vary_matches_numpy_without_crossover():
+    x = features()
+    out = np.empty_like(x)
+    seed_kernels(3)
+    de_vary(x, out, 0.0, 0.5)
+    np.random.seed(3)
+    assert np.allclose(out, numpy_vary(DE(f=x.shape[1], d=['max'], s=1, t=len(x), cr=0.0, mu=0.5), x))
+
+
+def test_de_vary_copies_agents_without_mutation():
+    x = features()
+    out = np.empty_like(x)
+    seed_kernels(4)
+    de_vary(x, out, 1.0, 0.0)
+    np.random.seed(4)
+    expected = numpy_vary(DE(f=x.shape[1], d=['max'], s=1, t=len(x), cr=1.0, mu=0.0), x)
+    for rows in (out, expected):
+        assert all(np.any(np.all(np.isclose(row, x), axis=1)) for row in rows)
+
+
+def test_gwo_vary_matches_numpy_at_last_epoch():
+    x = features()
+    leader = features(t=1, seed=5)[0]
+    kernel = x.copy()
+    seed_kernels(5)
+    gwo_vary(kernel, leader, leader, leader, 0.0)
+    model_object = GWO(f=x.shape[1], d=['max'], s=10, t=len(x))
+    model_object.initialize()
+    model_object.pi[:, :model_object.f] = x
+    model_object.alpha[:model_object.f] = model_object.beta[:model_object.f] = model_object.delta[:model_object.f] = leader
+    model_object.it_no = model_object.it
+    model_object.vary()
+    assert np.allclose(kernel, np.tile(leader, (len(x), 1)))
+    assert np.allclose(kernel, model_object.pi[:, :model_object.f])
+
+
+@pytest.mark.parametrize("algorithm", ['ga', 'de', 'gwo'])
+def test_vary_moments_match_numpy(algorithm):
+    x = features(t=2000, f=10, seed=6)
+    alpha, beta, delta = features(t=3, f=10, seed=7)
+    seed_kernels(8)
+    np.random.seed(8)
+    match algorithm:
+        case 'ga':
+            kernel = np.empty_like(x)
+            ga_vary(x, kernel, 0.7, 0.05)
+            expected = numpy_vary(GA(f=10, d=['max'], s=1, t=2000, sc=1, cr=0.7, mu=0.05, sfl=0.4, sfu=0.6), x)
+        case 'de':
+            kernel = np.empty_like(x)
+            de_vary(x, kernel, 0.7, 0.5)
+            expected = numpy_vary(DE(f=10, d=['max'], s=1, t=2000, cr=0.7, mu=0.5), x)
+        case 'gwo':
+            kernel = x.copy()
+            gwo_vary(kernel, alpha, beta, delta, 1.0)
+            model_object = GWO(f=10, d=['max'], s=2, t=2000)
+            model_object.initialize()
+            model_object.pi[:, :10] = x
+            model_object.alpha[:10], model_object.beta[:10], model_object.delta[:10] = alpha, beta, delta
+            model_object.it_no = 1
+            model_object.vary()
+            expected = model_object.pi[:, :10]
+    assert np.all((kernel >= 0) & (kernel <= 1))
+    assert np.allclose(kernel.mean(axis=0), expected.mean(axis=0), atol=0.05)
+    assert np.allclose(kernel.std(axis=0), expected.std(axis=0), atol=0.05)
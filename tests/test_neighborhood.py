@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from feloopy.algorithms.heuristic.neighborhood import Neighborhood, TabuMemory
+
+
+def sequences(block):
+    return np.argsort(block, axis=1).tolist()
+
+
+def is_swap(before, after):
+    changed = [position for position in range(len(before)) if before[position] != after[position]]
+    return len(changed) == 2 and after[changed[0]] == before[changed[1]] and after[changed[1]] == before[changed[0]]
+
+
+def is_insert(before, after):
+    for i in range(len(before)):
+        for j in range(len(before)):
+            if i != j:
+                moved = before[:i] + before[i+1:]
+                moved.insert(j, before[i])
+                if moved == after:
+                    return True
+    return False
+
+
+@pytest.mark.parametrize("move, check", [('swap', is_swap), ('insert', is_insert)])
+def test_sequence_moves(move, check):
+    np.random.seed(0)
+    neighborhood = Neighborhood(8, groups=[('sequence', 0, 8)], moves=[move])
+    X = np.random.rand(200, 8)
+    Y = neighborhood.propose(X)
+    assert np.allclose(np.sort(Y, axis=1), np.sort(X, axis=1))
+    for before, after in zip(sequences(X), sequences(Y)):
+        assert sorted(after) == list(range(8))
+        assert before != after and check(before, after)
+
+
+def test_sequence_moves_mixed():
+    np.random.seed(1)
+    neighborhood = Neighborhood(5, groups=[('sequence', 0, 5)], moves=['swap', 'insert'])
+    X = np.random.rand(200, 5)
+    for before, after in zip(sequences(X), sequences(neighborhood.propose(X))):
+        assert is_swap(before, after) or is_insert(before, after)
+
+
+def test_moves_only_change_one_group():
+    np.random.seed(2)
+    groups = [('binary', 0, 4), ('sequence', 4, 9), ('continuous', 9, 12)]
+    neighborhood = Neighborhood(12, groups=groups)
+    X = np.random.rand(300, 12)
+    Y = neighborhood.propose(X)
+    changed = np.stack([np.any(Y[:, start:end] != X[:, start:end], axis=1) for _, start, end in groups], axis=1)
+    assert np.all(changed.sum(axis=1) <= 1)
+    flipped = changed[:, 0]
+    assert np.all(np.any(np.abs(Y[flipped, :4] - (1 - X[flipped, :4])) < 1e-12, axis=1))
+    assert np.all((Y >= 0) & (Y <= 1))
+
+
+def test_keys_identify_decoded_solutions():
+    neighborhood = Neighborhood(4, groups=[('binary', 0, 2), ('sequence', 2, 4)])
+    keys = neighborhood.keys(np.array([[0.9, 0.1, 0.2, 0.7], [0.6, 0.4, 0.1, 0.3], [0.6, 0.4, 0.8, 0.3]]))
+    assert keys[0] == keys[1] != keys[2]
+
+
+def test_invalid_moves():
+    with pytest.raises(ValueError):
+        Neighborhood(3, moves=['reverse'])
+
+
+def test_tabu_memory_forgets_oldest():
+    memory = TabuMemory(2)
+    for key in [b'a', b'b', b'a', b'c']:
+        memory.add(key)
+    assert len(memory) == 2 and b'a' not in memory and b'b' in memory and b'c' in memory
@@ -0,0 +1,93 @@
+import multiprocessing
+
+import cloudpickle
+import numpy as np
+import pytest
+
+from feloopy import search, data_toolkit, parallel_search
+from feloopy.operators.parallel_operators import SharedDataset
+
+OPTIONS = {'epoch': 3, 'pop_size': 8, 'penalty_coefficient': 10}
+
+
+def weighted(m, ds):
+    x = m.bvar('x', [5])
+    if ds.data['fail'] and m.features['agent_status'] == 'active':
+        raise RuntimeError("failing environment")
+    m.obj(m.sum(ds.data['w'][i]*x[:, i] for i in range(5)))
+    m.con(x[:, 0] + x[:, 1] <= 1)
+    m.sol(['max'], 'ga', OPTIONS)
+    return m
+
+
+def keyword_weighted(m, weights, bounds):
+    x = m.bvar('x', [5])
+    m.obj(m.sum(weights[i]*x[:, i] for i in range(5)))
+    m.con(x[:, 0] + x[:, 1] <= bounds['pair'][0])
+    m.sol(['max'], 'ga', OPTIONS)
+    return m
+
+
+def dataset(fail=False):
+    ds = data_toolkit(key=0)
+    ds.data['w'] = np.arange(5.0)
+    ds.data['fail'] = fail
+    return ds
+
+
+def pooled_search(ds, **kwargs):
+    return search(weighted, method='heuristic', interface='feloopy', directions=['max'], solver='ga', options=OPTIONS,
+                  evaluation_backend='process', evaluation_workers=2, ds=ds, verbose=True, **kwargs)
+
+
+def test_pool_is_closed_after_run():
+    s = pooled_search(dataset())
+    assert s.em.evaluation_pool is None
+    assert multiprocessing.active_children() == []
+    assert 0 < s.get_obj() <= 10.0
+
+
+def test_pool_is_created_by_a_deferred_run():
+    s = pooled_search(dataset(), should_run=False)
+    assert s.em.evaluation_pool is None
+    s.run(verbose=True)
+    assert s.em.evaluation_pool is None
+    assert multiprocessing.active_children() == []
+
+
+def test_pool_is_closed_after_failed_run():
+    ds = dataset(fail=True)
+    s = pooled_search(ds, should_run=False)
+    with pytest.raises(RuntimeError, match="failing environment"):
+        s.run(verbose=True)
+    assert s.em.evaluation_pool is None
+    assert multiprocessing.active_children() == []
+
+
+def test_pool_is_closed_after_sensitivity_scenarios():
+    ds = dataset()
+    s = pooled_search(ds)
+    s.sensitivity(ds, ['w'], [[np.arange(5.0), np.ones(5), np.zeros(5)]], n_jobs=1)
+    assert multiprocessing.active_children() == []
+
+
+def test_shared_dataset_shares_every_configuration_value():
+    ds = dataset()
+    weights = np.arange(4.0)
+    bounds = {'pair': np.ones(3), 'nested': {'deep': np.zeros(2)}}
+    configuration = {'dataset': ds, 'weights': weights, 'bounds': bounds, 'again': ds, 'name': 'x'}
+    with SharedDataset(list(configuration.values()), min_bytes=0) as shared:
+        assert len(shared.shared) == 4
+        copy = cloudpickle.loads(shared.dumps(configuration))
+        assert np.array_equal(copy['weights'], weights) and not copy['weights'].flags.writeable
+        assert np.array_equal(copy['bounds']['nested']['deep'], bounds['nested']['deep'])
+        assert not copy['dataset'].data['w'].flags.writeable
+        assert copy['again'] is copy['dataset']
+
+
+def test_process_searches_receive_shared_keyword_arrays():
+    configuration = dict(environment=keyword_weighted, method='heuristic', interface='feloopy', directions=['max'], solver='ga', options=OPTIONS, verbose=True,
+                         weights=np.arange(5.0), bounds={'pair': np.ones(1)})
+    runs = parallel_search([configuration, configuration], parallelization_method="process", max_workers=2, min_shared_bytes=0)
+    assert [record['status'] for record in runs.results] == ['ok', 'ok']
+    assert all(0 < record['objective'] <= 10.0 for record in runs.results)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from feloopy.operators.pareto import non_dominated, non_dominated_sort, crowding_distance, truncate_front, ParetoArchive
+
+
+def brute_non_dominated(F):
+    weakly = np.all(F[None, :, :] <= F[:, None, :], axis=2)
+    strictly = np.any(F[None, :, :] < F[:, None, :], axis=2)
+    return ~(weakly & strictly).any(axis=1)
+
+
+def brute_non_dominated_sort(F):
+    ranks = np.full(len(F), -1)
+    remaining = np.arange(len(F))
+    rank = 0
+    while len(remaining):
+        front = brute_non_dominated(F[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+    return ranks
+
+
+def random_points(rng, n, m, ties):
+    if ties:
+        return rng.integers(0, 4, size=(n, m)).astype(float)
+    return rng.random((n, m))
+
+
+@pytest.mark.parametrize("m", [1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize("ties", [False, True])
+def test_non_dominated_matches_brute_force(m, ties):
+    rng = np.random.default_rng(m)
+    for n in [1, 2, 17, 300]:
+        F = random_points(rng, n, m, ties)
+        assert np.array_equal(non_dominated(F), brute_non_dominated(F))
+
+
+def test_non_dominated_on_large_fronts():
+    rng = np.random.default_rng(0)
+    X = np.abs(rng.normal(size=(3000, 4)))
+    F = np.concatenate([X/np.linalg.norm(X, axis=1)[:, None], rng.random((1000, 4)) + 1])
+    assert np.array_equal(non_dominated(F), brute_non_dominated(F))
+
+
+def test_non_dominated_directions():
+    rng = np.random.default_rng(1)
+    F = rng.random((200, 3))
+    directions = ['max', 'min', 'max']
+    assert np.array_equal(non_dominated(F, directions), brute_non_dominated(F*np.array([-1, 1, -1])))
+
+
+@pytest.mark.parametrize("m", [2, 3, 4])
+def test_non_dominated_sort_matches_brute_force(m):
+    rng = np.random.default_rng(10 + m)
+    for ties in [False, True]:
+        F = random_points(rng, 250, m, ties)
+        assert np.array_equal(non_dominated_sort(F), brute_non_dominated_sort(F))
+
+
+def test_crowding_distance_boundaries():
+    F = np.array([[0.0, 1.0], [0.25, 0.5], [0.5, 0.25], [1.0, 0.0]])
+    distance = crowding_distance(F)
+    assert np.isinf(distance[[0, 3]]).all()
+    assert np.allclose(distance[1:3], [0.5 + 0.75, 0.75 + 0.5])
+
+
+def test_truncate_front_matches_repeated_crowding():
+    rng = np.random.default_rng(2)
+    X = np.abs(rng.normal(size=(400, 3)))
+    F = X/np.linalg.norm(X, axis=1)[:, None]
+    for cap in [1, 5, 50, 399]:
+        keep = np.arange(len(F))
+        while len(keep) > cap:
+            keep = np.delete(keep, np.argmin(crowding_distance(F[keep])))
+        assert np.array_equal(np.sort(truncate_front(F, cap)), keep)
+
+
+def test_pareto_archive_keeps_non_dominated_and_cap():
+    archive = ParetoArchive(['min', 'min'], archive_cap=3)
+    archive.add([[1, 5], [2, 2], [5, 1], [3, 3]], items='abcd')
+    assert sorted(archive.items) == ['a', 'b', 'c']
+    archive.add([[0, 0]], items='e')
+    assert archive.items == ['e'] and len(archive) == 1
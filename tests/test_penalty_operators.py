@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from feloopy import search
+from feloopy.operators.penalty_operators import PenaltyAggregator
+
+
+def test_adaptive_weights_are_constant_within_a_population():
+    aggregator = PenaltyAggregator('adaptive', adaptive_period=8)
+    penalties = [aggregator.aggregate_one([1.0]) for _ in range(8)]
+    assert penalties == [1.0] * 8
+    assert aggregator.weights[0] == 1.5
+    assert aggregator.aggregate_one([1.0]) == 1.5
+
+
+def test_adaptive_weights_match_between_populations_and_agents():
+    np.random.seed(0)
+    vectorized = PenaltyAggregator('adaptive', adaptive_target=0.3, adaptive_period=6)
+    per_agent = PenaltyAggregator('adaptive', adaptive_target=0.3, adaptive_period=6)
+    for _ in range(5):
+        constraints = np.random.rand(6, 3) - 0.6
+        penalty, _ = vectorized.aggregate([constraints[:, [column]] for column in range(3)], 6)
+        expected = [per_agent.aggregate_one(list(row)) for row in constraints]
+        assert np.allclose(penalty, expected)
+        assert np.array_equal(vectorized.weights, per_agent.weights)
+        assert np.array_equal(vectorized.violations, per_agent.violations)
+
+
+def test_adaptive_weights_stay_within_bounds():
+    aggregator = PenaltyAggregator('adaptive', adaptive_bounds=(1.0, 2.0), adaptive_period=1)
+    for _ in range(10):
+        aggregator.aggregate_one([1.0, -1.0])
+    assert list(aggregator.weights) == [2.0, 1.0]
+
+
+@pytest.mark.parametrize("options", [dict(fitness_cache=True), dict(evaluation_backend="process")])
+def test_adaptive_penalty_rejects_stale_weights(options):
+    with pytest.raises(ValueError, match="adaptive"):
+        search(lambda m: m, method="heuristic", interface="feloopy", directions=["max"], solver="ga", penalty_aggregation="adaptive", **options)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from feloopy import search, data_toolkit
+from feloopy.operators.sensitivity_operators import ParameterLanding
+
+pytest.importorskip("highspy")
+
+SCENARIOS = {
+    'b': [5.0, 4.5, 4.0, 3.0, 2.0, 1.0],
+    'c': [np.array([3.0, 2.0, 1.0]), np.array([1.0, 2.0, 3.0]), np.array([2.0, 2.0, 2.0]), np.array([0.0, 1.0, 1.0]), np.array([5.0, 1.0, 1.0]), np.array([1.0, 1.0, 5.0])],
+    'a': [np.array([1.0, 2.0]), np.array([2.0, 1.0]), np.array([1.0, 1.0]), np.array([3.0, 0.5]), np.array([0.5, 3.0])],
+    'q': [2.0, 1.0, 3.0, 1.5, 2.5],
+}
+
+
+def production(m, ds):
+    x = m.pvar('x', [range(3)])
+    c, b, a, q = ds.data['c'], ds.data['b'], ds.data['a'], ds.data['q']
+    m.obj(sum(c[i]*x[i] for i in range(3)))
+    m.con(x[0] + x[1] + x[2] <= b, name='capacity')
+    m.con(x[0] <= q**2, name='square')
+    m.con(a[0]*x[1] + a[1]*x[2] <= 1, name='mix')
+    return m
+
+
+def dataset():
+    ds = data_toolkit(key=0)
+    ds.data['c'] = np.array([3.0, 2.0, 1.0])
+    ds.data['b'] = 5.0
+    ds.data['a'] = np.array([1.0, 2.0])
+    ds.data['q'] = 2.0
+    return ds
+
+
+def analyze(mutable_params):
+    ds = dataset()
+    s = search(environment=production, directions=['max'], interface='highs', solver='highs', method='exact', verbose=True, mutable_params=mutable_params, ds=ds)
+    names = list(SCENARIOS)
+    return s, s.sensitivity(ds, names, [SCENARIOS[name] for name in names], n_jobs=1)
+
+
+def test_incremental_scenarios_match_rebuilt_scenarios():
+    rebuilt, expected = analyze([])
+    with pytest.warns(UserWarning, match="'q' is analyzed by rebuilding"):
+        incremental, results = analyze(list(SCENARIOS))
+    assert rebuilt.sensitivity_modes == {name: 'rebuild' for name in SCENARIOS}
+    assert incremental.sensitivity_modes == {'b': 'incremental', 'c': 'incremental', 'a': 'incremental', 'q': 'rebuild'}
+    for name in SCENARIOS:
+        assert results[f'sensitivtiy_of_health_to_{name}'] == expected[f'sensitivtiy_of_health_to_{name}']
+        assert results[f'sensitivtiy_of_errors_to_{name}'] == expected[f'sensitivtiy_of_errors_to_{name}']
+        assert np.allclose(np.ravel(results[f'sensitivtiy_of_objectives_to_{name}']), np.ravel(expected[f'sensitivtiy_of_objectives_to_{name}']))
+
+
+def linear_data(cost, coefficient, upper):
+    return {
+        'cost': [cost, 1.0],
+        'offset': [0.0],
+        'coefficients': {(0, 0): 1.0, (0, 1): coefficient},
+        'row_lower': [-np.inf],
+        'row_upper': [upper],
+        'col_lower': [0.0, 0.0],
+        'col_upper': [np.inf, np.inf],
+    }
+
+
+def test_landing_records_affine_entries():
+    landing = ParameterLanding(lambda p: linear_data(2*p[0], 3.0 - p[1], 4.0), np.array([1.0, 2.0]))
+    target = landing.predict([2.0, 5.0])
+    assert np.allclose(target, landing.flatten(linear_data(4.0, -2.0, 4.0)))
+    changes = landing.changes(landing.base, target)
+    assert set(changes) == {'cost', 'coefficients'}
+    assert list(changes['cost'][0]) == [0] and np.allclose(changes['cost'][1], [4.0])
+    rows, columns, values = changes['coefficients']
+    assert (list(rows), list(columns), list(values)) == ([0], [1], [-2.0])
+    assert set(landing.changes(None, target)) == {'cost', 'offset', 'coefficients', 'row_bounds', 'col_bounds'}
+
+
+def test_landing_slices_scalar_bounds():
+    landing = ParameterLanding(lambda p: linear_data(1.0, 1.0, p), 4.0)
+    changes = landing.changes(landing.base, landing.predict(7.0))
+    assert list(changes) == ['row_bounds']
+    rows, lower, upper = changes['row_bounds']
+    assert list(rows) == [0] and lower[0] == -np.inf and upper[0] == 7.0
+
+
+def test_landing_rejects_non_affine_parameters():
+    with pytest.raises(ValueError, match="affinely"):
+        ParameterLanding(lambda p: linear_data(p**2, 1.0, 4.0), 2.0)
+
+
+def test_landing_rejects_infinite_bound_changes():
+    with pytest.raises(ValueError, match="infinite"):
+        ParameterLanding(lambda p: linear_data(1.0, 1.0, np.inf if p > 4.5 else p), 4.0)
+
+
+def test_landing_rejects_structural_changes():
+    def build(p):
+        data = linear_data(1.0, 1.0, 4.0)
+        if p != 4.0:
+            data['row_upper'] = [4.0, p]
+            data['row_lower'] = [-np.inf, -np.inf]
+        return data
+    with pytest.raises(ValueError, match="number of variables or constraints"):
+        ParameterLanding(build, 4.0)
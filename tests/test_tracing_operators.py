@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+
+from feloopy import model
+from feloopy.operators.penalty_operators import PenaltyAggregator
+from feloopy.operators.tracing_operators import CompiledEnvironment, Tape, TracingError
+
+rng = np.random.default_rng(0)
+n = 12
+value = rng.random(n)
+weight = rng.random((2, n))
+distance = rng.random((6, 6))
+
+
+def knapsack(m):
+    x = m.bvar('x', [range(n)])
+    for k in range(2):
+        m.con(m.sum(weight[k, i]*x[:, i] for i in range(n)) <= 2)
+    m.obj(m.sum(value[i]*x[:, i] for i in range(n)))
+    return m
+
+
+def where(m):
+    x = m.pvar('x', [range(3)], bound=[-1, 2])
+    m.con(x[:, 0] + x[:, 1] <= 2)
+    m.obj(np.where(x[:, 0] > 0.5, x[:, 1], -x[:, 2]) + x[:, 2])
+    return m
+
+
+def broadcast(m):
+    x = m.pvar('x', [range(4)], bound=[0, 5])
+    m.con(np.sum(x*weight[0, :4], axis=1) <= 4)
+    m.obj(np.sum((x - value[:4])**2, axis=1) - x[:, 0]*x[:, 1])
+    return m
+
+
+def tour(m):
+    y = m.svar('y', 6)
+    m.obj(np.sum(distance[y[:, :-1], y[:, 1:]], axis=1))
+    return m
+
+
+def control(m):
+    x = m.pvar('x', [range(3)], bound=[0, 5])
+    scale = 2.0 if m.features['agent_status'] != 'idle' and np.any(x[:, 0] > 4) else 1.0
+    m.obj(scale*(x[:, 0] + x[:, 1]))
+    return m
+
+
+def scalar(m):
+    x = m.pvar('x', [range(3)], bound=[0, 5])
+    m.obj(x[:, 0] + float(np.max(x[:, 1])) if m.features['agent_status'] != 'idle' else x[:, 0])
+    return m
+
+
+def noisy(m):
+    x = m.pvar('x', [range(3)], bound=[0, 5])
+    m.obj(x[:, 0] + np.random.rand())
+    return m
+
+
+def biobjective(m):
+    x = m.pvar('x', [range(3)], bound=[0, 5])
+    m.con(x[:, 0] + x[:, 1] >= 2)
+    m.obj(x[:, 0]**2 + x[:, 1])
+    m.obj(-x[:, 2] + x[:, 0])
+    return m
+
+
+class Evaluators:
+    """
+    Plain and compiled evaluations of an environment on the same populations.
+    """
+
+    def __init__(self, environment, directions, aggregation='max', interface='feloopy'):
+
+        self.environment = environment
+        self.directions = directions
+        self.interface = interface
+        self.aggregator = PenaltyAggregator(aggregation)
+        self.shell = None
+        idle = environment(self.build(['idle']))
+        self.spread = idle.features['variable_spread']
+        self.width = idle.features['total_variable_counter'][1]
+        self.compiled = CompiledEnvironment(self.reuse, environment, (), {}, self.solve, directions)
+
+    def build(self, X):
+        m = model(method='heuristic', name='test', interface=self.interface, agent=X, no_agents=10)
+        m.penalty_aggregator = self.aggregator
+        return m
+
+    def reuse(self, X):
+        if self.shell is None:
+            self.shell = self.build(X)
+            return self.shell
+        return self.shell.load_agent(X)
+
+    def solve(self, m):
+        if len(self.directions) == 1:
+            m.sol(directions=self.directions, solver='ga', solver_options={})
+        else:
+            m.sol(self.directions, None, {}, obj_id='all')
+
+    def population(self, pop, seed):
+        extra = 2 if len(self.directions) == 1 else 2*len(self.directions) + 1
+        return np.random.default_rng(seed).random((pop, self.width + extra))
+
+    def properties(self, X):
+        return ['active', X.copy(), self.spread, 10]
+
+    def plain(self, X):
+        m = self.environment(self.build(self.properties(X)))
+        self.solve(m)
+        return np.array(m[self.properties(X)], dtype=float)
+
+    def replay(self, X):
+        properties = self.properties(X)
+        return np.array(self.compiled(properties)[properties], dtype=float)
+
+
+def compare(evaluators, seeds=range(4), pops=(10, 10, 7)):
+    for pop in pops:
+        for seed in seeds:
+            X = evaluators.population(pop, seed)
+            assert np.allclose(evaluators.replay(X), evaluators.plain(X), equal_nan=True)
+
+
+@pytest.mark.parametrize("environment", [knapsack, where, broadcast])
+def test_traced_environments_replay(environment):
+    evaluators = Evaluators(environment, ['max'])
+    compare(evaluators)
+    assert all(evaluators.compiled.traces.values())
+
+
+def test_sums_are_fused():
+    evaluators = Evaluators(knapsack, ['max'])
+    compare(evaluators, seeds=[0], pops=[10])
+    tape = evaluators.compiled.traces[(10, evaluators.width + 2)].tape
+    assert tape.program is not tape.generic and len(tape.program) < len(tape.generic)
+
+
+def test_multiple_objectives_replay():
+    compare(Evaluators(biobjective, ['min', 'max']))
+
+
+@pytest.mark.parametrize("environment", [tour, control, scalar])
+def test_untraceable_environments_fall_back(environment):
+    evaluators = Evaluators(environment, ['min'] if environment is tour else ['max'])
+    with pytest.warns(RuntimeWarning, match="Compiled mode"):
+        compare(evaluators, seeds=[0], pops=[10])
+    compare(evaluators)
+    assert not any(evaluators.compiled.traces.values())
+
+
+def test_stochastic_environment_falls_back():
+    evaluators = Evaluators(noisy, ['max'])
+    X = evaluators.population(10, 0)
+    with pytest.warns(RuntimeWarning, match="do not reproduce"):
+        evaluators.replay(X)
+    assert evaluators.compiled.traces[X.shape] is False
+    np.random.seed(1)
+    replayed = evaluators.replay(X)
+    np.random.seed(1)
+    assert np.allclose(replayed, evaluators.plain(X))
+
+
+def test_penalty_state_matches_plain_evaluation():
+    plain, compiled = Evaluators(knapsack, ['max'], 'adaptive'), Evaluators(knapsack, ['max'], 'adaptive')
+    for seed in range(3):
+        X = plain.population(10, seed)
+        assert np.allclose(compiled.replay(X), plain.plain(X))
+    for key in ['weights', 'violations', 'evaluated']:
+        assert np.array_equal(getattr(compiled.aggregator, key), getattr(plain.aggregator, key))
+
+
+def test_tape_rejects_control_flow():
+    tape = Tape()
+    agent = tape.input()
+    for convert in (bool, float, int, len):
+        with pytest.raises(TracingError):
+            convert(agent[:, 0] > 1)
+    with pytest.raises(TracingError):
+        agent[0] = 1
+
+
+def test_tape_replays_without_fusion():
+    tape = Tape()
+    agent = tape.input()
+    output = np.sum(agent[:, :2]*np.array([1.0, -2.0]), axis=1) + np.maximum(agent[:, 2], 0.5)
+    tape.compile([output])
+    X = np.random.default_rng(3).random((5, 3))
+    expected = X[:, 0] - 2*X[:, 1] + np.maximum(X[:, 2], 0.5)
+    assert np.allclose(tape.run(X)[0], expected)
+    tape.fuse(tape.values(X))
+    assert np.allclose(tape.run(X)[0], expected)
+    tape.unfuse()
+    assert np.allclose(tape.run(X)[0], expected)